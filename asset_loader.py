@@ -0,0 +1,109 @@
+# asset_loader.py
+# 이미지를 백그라운드 스레드에서 읽고(디코딩) 스케일하는 비동기 로더입니다.
+#  - request() 는 바로 돌아오고, 씬은 이미지가 준비될 때까지 대체 이미지(placeholder)를 그립니다.
+#  - 디스플레이 포맷 변환(convert / convert_alpha)은 메인 스레드의 pump() 에서만 합니다.
+#    (디스플레이 관련 호출은 메인 스레드에서 해야 안전하기 때문)
+#  - pump() 는 Game.run / HeadlessRunner 가 프레임마다 한 번 부르고, 완료된 요청의 콜백을 실행합니다.
+import queue
+import threading
+import time
+from collections import deque
+
+import pygame
+
+
+def _scale(image, size):
+    # smoothscale 은 24/32비트 이미지만 받으므로 팔레트 이미지 등은 32비트로 옮겨 담습니다.
+    if image.get_bytesize() not in (3, 4):
+        rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        rgba.blit(image, (0, 0))
+        image = rgba
+    return pygame.transform.smoothscale(image, size)
+
+
+class AssetLoader:
+    def __init__(self):
+        self._requests = queue.Queue()
+        self._done = deque()        # 작업 스레드 -> 메인 스레드 (key, 이미지 또는 None)
+        self._pending = {}          # key -> 콜백 목록 (메인 스레드에서만 접근)
+        self._thread = None
+        self.loaded = 0
+        self.failed = 0
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="asset-loader", daemon=True)
+            self._thread.start()
+
+    def request(self, path, size=None, alpha=True, callback=None):
+        """path 이미지를 (size 로 스케일해) 읽도록 요청합니다.
+
+        준비되면 pump() 에서 callback(surface) 를 부릅니다. 실패하면 callback(None).
+        같은 요청이 이미 진행 중이면 콜백만 덧붙입니다.
+        """
+        key = (path, tuple(size) if size else None, alpha)
+        callbacks = self._pending.get(key)
+        if callbacks is None:
+            callbacks = self._pending[key] = []
+            self._ensure_thread()
+            self._requests.put(key)
+        if callback is not None:
+            callbacks.append(callback)
+        return key
+
+    def pending(self):
+        return len(self._pending)
+
+    def _worker(self):
+        while True:
+            key = self._requests.get()
+            path, size, _ = key
+            try:
+                image = pygame.image.load(path)
+                if size is not None and image.get_size() != size:
+                    image = _scale(image, size)
+            except Exception:
+                image = None
+            self._done.append((key, image))
+
+    def pump(self):
+        """완료된 이미지를 디스플레이 포맷으로 바꾸고 콜백을 실행합니다 (메인 스레드). 처리한 수를 돌려줍니다."""
+        count = 0
+        while self._done:
+            key, image = self._done.popleft()
+            if image is not None:
+                try:
+                    image = image.convert_alpha() if key[2] else image.convert()
+                except pygame.error:
+                    # 화면이 아직 없으면 변환하지 않은 이미지를 그대로 씁니다.
+                    pass
+                self.loaded += 1
+            else:
+                self.failed += 1
+            for callback in self._pending.pop(key, ()):
+                callback(image)
+            count += 1
+        return count
+
+    def wait(self, timeout=5.0):
+        """대기 중인 요청이 모두 끝날 때까지 pump 합니다 (벤치마크/도구용). 다 끝나면 True."""
+        deadline = time.perf_counter() + timeout
+        while self._pending:
+            self.pump()
+            if not self._pending:
+                break
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+
+# 프로세스 전체에서 함께 쓰는 로더
+_shared = None
+
+
+def shared_loader():
+    global _shared
+    if _shared is None:
+        _shared = AssetLoader()
+    return _shared
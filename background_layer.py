@@ -0,0 +1,63 @@
+# background_layer.py
+# 맵 배경 이미지를 한 번만 읽어 보관하는 배경 레이어입니다. (월드 텍스처로 쓰임: tile_world.set_texture)
+#  - 디스크에서 읽는 것은 프로세스에서 한 번뿐 (Game.restart 로 MapScene 을 새로 만들어도 재사용)
+#  - 배경은 불투명하므로 convert() 로 디스플레이 포맷에 맞춰 빠른 blit 경로를 탑니다.
+#  - 읽기는 asset_loader 의 작업 스레드에서 하고, 도착하면 version 을 올려 씬이 월드를 다시 칠하게 합니다.
+import os
+
+from asset_loader import shared_loader
+
+# 기본적으로 프로젝트 루트의 `background.png`를 우선으로 사용하고,
+# 없다면 assets/backgrounds/background.png 를 시도합니다.
+BACKGROUND_CANDIDATES = (
+    os.path.join("background.png"),
+    os.path.join("assets", "backgrounds", "background.png"),
+)
+FALLBACK_COLOR = (150, 200, 255)  # 이미지가 없을 때 쓰는 하늘색
+
+
+def find_background_path():
+    for path in BACKGROUND_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return BACKGROUND_CANDIDATES[-1]
+
+
+class BackgroundLayer:
+    def __init__(self, path=None, color=FALLBACK_COLOR):
+        self.path = path or find_background_path()
+        self.color = color
+        self.image = None       # 원본 이미지 (디스플레이 포맷)
+        self._loaded = False
+        # 이미지가 도착할 때마다 1 증가 (씬이 화면 전체를 다시 그려야 하는지 판단)
+        self.version = 0
+
+    def load(self, size=None):
+        """원본 이미지를 한 번만 읽도록 요청합니다 (size 를 주면 작업 스레드에서 미리 스케일).
+
+        준비되기 전이나 실패하면 단색 배경을 씁니다.
+        """
+        if self._loaded:
+            return self.image
+        self._loaded = True
+        if os.path.exists(self.path):
+            shared_loader().request(self.path, size, alpha=False, callback=self._on_loaded)
+        return self.image
+
+    def _on_loaded(self, image):
+        # 로드 실패(None)면 기본 컬러로 계속 그립니다.
+        if image is None:
+            return
+        self.image = image
+        self.version += 1
+
+
+# 모든 MapScene 이 함께 쓰는 배경 레이어
+_shared = None
+
+
+def shared_background():
+    global _shared
+    if _shared is None:
+        _shared = BackgroundLayer()
+    return _shared
@@ -0,0 +1,363 @@
+# balance.py
+# 밸런스 조정용 대량 전투 실행기입니다. (종 x 레벨 x 기술 구성) 조합마다 전투를 수천 번씩 돌려
+# 승률, 쓰러뜨리기까지 걸린 턴, 레벨별 EXP 곡선 표를 만듭니다.
+#  - 전투 규칙은 battle_engine.BattleEngine 을 그대로 씁니다 (attack_target / gain_exp 포함).
+#  - 조합을 작은 작업(chunk) 으로 나눠 프로세스 풀에 뿌리고, 끝나는 대로 받아 합칩니다.
+#    작업마다 독립된 시드를 주므로 프로세스 수와 상관없이 같은 --seed 면 같은 결과가 나옵니다.
+#  - 작업 결과는 숫자 몇 개뿐이라 프로세스 간 전송 비용이 거의 없어, 코어 수에 거의 비례해 빨라집니다.
+#
+# 실행 예:
+#   python balance.py                                    # 스타터 Lv5~15 vs 풀숲 야생 포켓몬
+#   python balance.py --levels 5-30:5 --enemy-levels 3-12:3 --skills tackle,ember --battles 5000
+#   python balance.py --enemies 2,4 --skills "Tackle:10:35;불꽃세례:16:15" --procs 8 --json balance.json
+#   python balance.py --scaling                          # 프로세스 수 1..코어 수 처리량 비교
+import os
+import random
+import sys
+import time
+
+from base_pokemon import Skill
+from battle_engine import BattleEngine, PLAYER, ENEMY
+from species_db import shared_species_db
+
+# 이름 붙은 기술 구성 (이름, 위력, PP). --skills 에 이름 대신 "이름:위력:PP;..." 를 직접 써도 됩니다.
+SKILL_SETS = {
+    "tackle": (("Tackle", 10, 35),),
+    "ember": (("Tackle", 10, 35), ("불꽃세례", 16, 15)),
+    "strong": (("Tackle", 10, 35), ("불꽃세례", 16, 15), ("화염방사", 24, 5)),
+}
+DEFAULT_SKILLS = "tackle"
+DEFAULT_LEVELS = "5-15"
+CHUNK = 500               # 작업 하나에 들어가는 전투 수
+MAX_TURNS = 200           # 전투 하나의 턴 제한 (넘으면 무승부)
+
+
+def parse_levels(text):
+    """'5-15', '5-30:5', '3,5,8' 형식을 레벨 목록으로 바꿉니다."""
+    levels = []
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        step = 1
+        if ":" in part:
+            part, step = part.split(":")
+            step = max(1, int(step))
+        if "-" in part:
+            lo, hi = part.split("-")
+            levels.extend(range(int(lo), int(hi) + 1, step))
+        else:
+            levels.append(int(part))
+    return sorted(set(lv for lv in levels if lv >= 1))
+
+
+def parse_skill_set(text):
+    """기술 구성 이름(SKILL_SETS) 또는 '이름:위력:PP;이름:위력:PP' 를 (이름, (기술, ...)) 으로."""
+    text = text.strip()
+    if text in SKILL_SETS:
+        return text, SKILL_SETS[text]
+    skills = []
+    for part in text.split(";"):
+        name, power, pp = part.split(":")
+        skills.append((name.strip(), int(power), int(pp)))
+    return text, tuple(skills)
+
+
+def scaled_pokemon(species, level, skills=None):
+    """종의 기본 레벨에서 level 까지 레벨업(또는 다운)한 Pokemon. skills: (이름, 위력, PP) 목록."""
+    pokemon = species.create()
+    if skills:
+        pokemon.skills = [Skill(name, power, pp) for name, power, pp in skills]
+    delta = level - pokemon.level
+    if delta:
+        pokemon.level_up(delta)
+        # 기본 레벨보다 낮추면 스탯이 0 이하가 되지 않게 합니다.
+        pokemon.max_hp = max(1, pokemon.max_hp)
+        pokemon.attack = max(1, pokemon.attack)
+        pokemon.defense = max(1, pokemon.defense)
+        pokemon.speed = max(1, pokemon.speed)
+        pokemon.current_hp = pokemon.max_hp
+    return pokemon
+
+
+def choose_skill(pokemon):
+    # 플레이어 전략: PP 가 남은 기술 중 위력이 가장 센 것 (없으면 None)
+    best = None
+    best_power = -1
+    for i, skill in enumerate(pokemon.skills):
+        if skill.current_pp > 0 and skill.power > best_power:
+            best = i
+            best_power = skill.power
+    return best
+
+
+# -----------------------------
+# 작업 (워커 프로세스에서 실행)
+# -----------------------------
+# 작업 = (칸 번호, 내 종 id, 내 레벨, 상대 종 id, 상대 레벨, 기술 구성, 전투 수, 시드)
+# 결과 = (칸 번호, 전투 수, 승, 패, 무, 턴 합, 이긴 전투의 턴 합, EXP 합)
+def run_chunk(job):
+    cell, player_id, player_level, enemy_id, enemy_level, skills, battles, seed = job
+    db = shared_species_db()
+    player_species = db.get(player_id)
+    enemy_species = db.get(enemy_id)
+    rng = random.Random(seed)
+    # 전투마다 새 난수 생성기를 만들지 않고 하나를 다시 시드해 씁니다 (시드가 같으면 결과도 같음).
+    battle_rng = random.Random()
+    wins = losses = draws = turns = ko_turns = exp = 0
+    for _ in range(battles):
+        player = scaled_pokemon(player_species, player_level, skills)
+        enemy = scaled_pokemon(enemy_species, enemy_level)
+        engine = BattleEngine(player, enemy, seed=rng.getrandbits(32), record_events=False, rng=battle_rng)
+        while not engine.finished and engine.turns < MAX_TURNS:
+            index = choose_skill(player)
+            if index is None:
+                break
+            engine.player_attack(index)
+        exp += engine.exp_gained
+        turns += engine.turns
+        if engine.winner == PLAYER:
+            wins += 1
+            ko_turns += engine.turns
+        elif engine.winner == ENEMY:
+            losses += 1
+        else:
+            draws += 1
+    return cell, battles, wins, losses, draws, turns, ko_turns, exp
+
+
+# -----------------------------
+# 집계
+# -----------------------------
+class CellStats:
+    """조합 하나(내 종/레벨, 상대 종/레벨, 기술 구성)의 누적 결과."""
+
+    __slots__ = ("player", "player_level", "enemy", "enemy_level", "skill_set",
+                 "battles", "wins", "losses", "draws", "turns", "ko_turns", "exp")
+
+    def __init__(self, player, player_level, enemy, enemy_level, skill_set):
+        self.player = player                # 종 이름
+        self.player_level = player_level
+        self.enemy = enemy
+        self.enemy_level = enemy_level
+        self.skill_set = skill_set          # 기술 구성 이름
+        self.battles = self.wins = self.losses = self.draws = 0
+        self.turns = self.ko_turns = self.exp = 0
+
+    def add(self, battles, wins, losses, draws, turns, ko_turns, exp):
+        self.battles += battles
+        self.wins += wins
+        self.losses += losses
+        self.draws += draws
+        self.turns += turns
+        self.ko_turns += ko_turns
+        self.exp += exp
+
+    @property
+    def win_rate(self):
+        return self.wins / self.battles if self.battles else 0.0
+
+    @property
+    def mean_turns(self):
+        return self.turns / self.battles if self.battles else 0.0
+
+    @property
+    def turns_to_ko(self):
+        # 이긴 전투에서 상대를 쓰러뜨리기까지 걸린 평균 턴
+        return self.ko_turns / self.wins if self.wins else 0.0
+
+    @property
+    def exp_per_battle(self):
+        return self.exp / self.battles if self.battles else 0.0
+
+    def as_dict(self):
+        return {
+            "player": self.player, "player_level": self.player_level,
+            "enemy": self.enemy, "enemy_level": self.enemy_level, "skills": self.skill_set,
+            "battles": self.battles, "win_rate": self.win_rate,
+            "loss_rate": self.losses / self.battles if self.battles else 0.0,
+            "draw_rate": self.draws / self.battles if self.battles else 0.0,
+            "mean_turns": self.mean_turns, "turns_to_ko": self.turns_to_ko,
+            "exp_per_battle": self.exp_per_battle,
+        }
+
+
+def build_matrix(db, players, levels, enemies, enemy_levels, skill_sets, battles, seed, chunk=CHUNK):
+    """조합 표(CellStats 목록)와 작업 목록을 만듭니다.
+
+    enemy_levels 가 None 이면 상대는 각 종의 기본 레벨로 싸웁니다.
+    작업 시드는 --seed 와 작업 순서로만 정해지므로 실행 순서/프로세스 수와 무관합니다.
+    """
+    seeder = random.Random(seed)
+    cells = []
+    jobs = []
+    for skill_name, skills in skill_sets:
+        for pid in players:
+            p = db.get(pid)
+            for level in levels:
+                for eid in enemies:
+                    e = db.get(eid)
+                    for elevel in (enemy_levels or (e.level,)):
+                        cell = len(cells)
+                        cells.append(CellStats(p.name, level, e.name, elevel, skill_name))
+                        left = battles
+                        while left > 0:
+                            n = min(chunk, left)
+                            jobs.append((cell, pid, level, eid, elevel, skills, n, seeder.getrandbits(64)))
+                            left -= n
+    return cells, jobs
+
+
+def run_jobs(cells, jobs, procs, progress=None):
+    """작업을 procs 개 프로세스로 나눠 돌리고, 끝나는 대로 cells 에 합칩니다. 걸린 시간(초)을 돌려줍니다."""
+    start = time.perf_counter()
+    done = 0
+    if procs <= 1:
+        results = map(run_chunk, jobs)
+        pool = None
+    else:
+        import multiprocessing
+        pool = multiprocessing.Pool(procs)
+        # 작업이 끝나는 순서대로 받습니다 (느린 작업 하나가 나머지 집계를 막지 않도록).
+        results = pool.imap_unordered(run_chunk, jobs, chunksize=max(1, len(jobs) // (procs * 8)))
+    try:
+        for cell, *counts in results:
+            cells[cell].add(*counts)
+            done += 1
+            if progress is not None:
+                progress(done, len(jobs))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    return time.perf_counter() - start
+
+
+# -----------------------------
+# 출력
+# -----------------------------
+def win_rate_lines(cells):
+    out = [f"{'기술':10s} {'내 포켓몬':10s} {'Lv':>3} {'상대':10s} {'Lv':>3} {'전투':>7} "
+           f"{'승률':>6} {'패배':>6} {'무승부':>6} {'평균 턴':>7} {'KO 턴':>6} {'EXP':>6}"]
+    for c in cells:
+        d = c.as_dict()
+        out.append(f"{c.skill_set:10.10s} {c.player:10s} {c.player_level:>3} {c.enemy:10s} {c.enemy_level:>3} "
+                   f"{c.battles:>7} {d['win_rate']:>6.1%} {d['loss_rate']:>6.1%} {d['draw_rate']:>6.1%} "
+                   f"{c.mean_turns:>7.2f} {c.turns_to_ko:>6.2f} {c.exp_per_battle:>6.1f}")
+    return out
+
+
+def exp_curve(cells):
+    """(기술 구성, 내 종, 레벨) 별로 상대 조합 전체를 고르게 만났을 때의 EXP 곡선.
+
+    반환: [(기술, 종, 레벨, 승률, 전투당 EXP, 다음 레벨까지 EXP, 필요한 전투 수), ...]
+    """
+    from base_pokemon import growth_table
+    groups = {}
+    for c in cells:
+        key = (c.skill_set, c.player, c.player_level)
+        g = groups.setdefault(key, [0, 0, 0])
+        g[0] += c.battles
+        g[1] += c.wins
+        g[2] += c.exp
+    table = growth_table()
+    rows = []
+    for (skill_set, player, level), (battles, wins, exp) in groups.items():
+        per_battle = exp / battles if battles else 0.0
+        need = table.exp_to_next(level)
+        rows.append((skill_set, player, level, wins / battles if battles else 0.0, per_battle, need,
+                     need / per_battle if per_battle else float("inf")))
+    return rows
+
+
+def exp_curve_lines(rows):
+    out = [f"{'기술':10s} {'내 포켓몬':10s} {'Lv':>3} {'승률':>6} {'EXP/전투':>8} {'다음 Lv까지':>10} {'필요 전투':>9}"]
+    for skill_set, player, level, win_rate, per_battle, need, battles in rows:
+        out.append(f"{skill_set:10.10s} {player:10s} {level:>3} {win_rate:>6.1%} {per_battle:>8.1f} "
+                   f"{need:>10} {battles:>9.1f}")
+    return out
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="종 x 레벨 x 기술 구성 조합별 대량 전투 밸런스 표")
+    parser.add_argument("--players", default="1", help="내 포켓몬 종 id 목록 (쉼표, 기본 1=스타터)")
+    parser.add_argument("--levels", default=DEFAULT_LEVELS, help="내 레벨 (예: 5-15, 5-30:5, 5,10,20)")
+    parser.add_argument("--zone", default="grass", help="--enemies 가 없을 때 상대 종을 가져올 조우 구역")
+    parser.add_argument("--enemies", help="상대 종 id 목록 (쉼표)")
+    parser.add_argument("--enemy-levels", help="상대 레벨 (생략하면 각 종의 기본 레벨)")
+    parser.add_argument("--skills", default=DEFAULT_SKILLS,
+                        help=f"쉼표로 구분한 기술 구성 ({', '.join(SKILL_SETS)} 또는 '이름:위력:PP;...')")
+    parser.add_argument("--battles", type=int, default=2000, help="조합 하나당 전투 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--procs", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="작업 하나의 전투 수")
+    parser.add_argument("--json", help="결과를 JSON 으로 저장할 경로")
+    parser.add_argument("--scaling", action="store_true", help="프로세스 수 1..--procs 로 처리량만 비교")
+    args = parser.parse_args(argv)
+
+    db = shared_species_db()
+    players = [int(x) for x in args.players.split(",")]
+    levels = parse_levels(args.levels)
+    if args.enemies:
+        enemies = [int(x) for x in args.enemies.split(",")]
+    else:
+        table = db.zone(args.zone)
+        if table is None:
+            print(f"조우 구역이 없습니다: {args.zone}")
+            return 1
+        enemies = sorted(s.id for s in table.likely(len(table)))
+    enemy_levels = parse_levels(args.enemy_levels) if args.enemy_levels else None
+    skill_sets = [parse_skill_set(s) for s in args.skills.split(",")]
+    for sid in players + enemies:
+        if db.get(sid) is None:
+            print(f"종 id {sid} 가 없습니다.")
+            return 1
+
+    if args.scaling:
+        base = None
+        for procs in range(1, max(1, args.procs) + 1):
+            cells, jobs = build_matrix(db, players, levels, enemies, enemy_levels, skill_sets,
+                                       args.battles, args.seed, args.chunk)
+            elapsed = run_jobs(cells, jobs, procs)
+            rate = sum(c.battles for c in cells) / elapsed
+            base = base or rate
+            print(f"프로세스 {procs:>2}: {rate:>12,.0f} 전투/초  (x{rate / base:.2f})")
+        return 0
+
+    cells, jobs = build_matrix(db, players, levels, enemies, enemy_levels, skill_sets,
+                               args.battles, args.seed, args.chunk)
+
+    def progress(done, total):
+        if done == total or done % max(1, total // 20) == 0:
+            print(f"\r작업 {done}/{total}", end="", file=sys.stderr, flush=True)
+
+    elapsed = run_jobs(cells, jobs, args.procs, progress)
+    print(file=sys.stderr)
+    total = sum(c.battles for c in cells)
+
+    for line in win_rate_lines(cells):
+        print(line)
+    print()
+    curve = exp_curve(cells)
+    for line in exp_curve_lines(curve):
+        print(line)
+    print()
+    print(f"전투 {total:,}개, {elapsed:.2f}초 ({total / elapsed:,.0f} 전투/초, 프로세스 {args.procs}개)")
+
+    if args.json:
+        import json
+        data = {
+            "seed": args.seed,
+            "battles_per_cell": args.battles,
+            "cells": [c.as_dict() for c in cells],
+            "exp_curve": [dict(zip(("skills", "player", "level", "win_rate", "exp_per_battle",
+                                    "exp_to_next", "battles_to_next"), row)) for row in curve],
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
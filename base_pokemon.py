@@ -1,10 +1,81 @@
 # 난수를 발생시켜서 공격 데미지를 약간씩 다르게 만들기 위해 random 모듈을 불러옵니다.
 import random
+from bisect import bisect_right
+
+
+# -----------------------------
+# 📜 기본 포켓몬 데이터
+# -----------------------------
+# 스타터 포켓몬 (이름, 레벨, max_hp, attack, defense, speed)
+STARTER = ("초염몽", 5, 35, 12, 8, 10)
+
+# 야생 포켓몬 후보 목록 (이름, 레벨, max_hp, attack, defense, speed)
+WILD_CANDIDATES = (
+    ("이상해풀", 3, 30, 10, 8, 7),
+    ("꼬부기", 3, 28, 9, 9, 8),
+    ("잉어킹", 4, 30, 14, 6, 8),
+)
+
+# -----------------------------
+# 📈 성장 곡선 (레벨 -> 다음 레벨까지 필요한 EXP)
+# -----------------------------
+GROWTH_CURVES = {
+    "medium": lambda level: level ** 3,            # 기본 곡선 (기존 공식 level^3)
+    "fast": lambda level: level ** 3 * 4 // 5,     # 빨리 자라는 종
+    "slow": lambda level: level ** 3 * 5 // 4,     # 늦게 자라는 종
+}
+DEFAULT_GROWTH = "medium"
+
+# 레벨업 한 번마다 오르는 스탯 (max_hp, attack, defense, speed). 현재 체력도 max_hp 증가분만큼 회복합니다.
+LEVEL_UP_HP = 5
+LEVEL_UP_ATTACK = 2
+LEVEL_UP_DEFENSE = 2
+LEVEL_UP_SPEED = 1
+
+
+class GrowthTable:
+    """성장 곡선 하나의 누적 EXP 표. total[l] = 레벨 0 에서 레벨 l 이 되기까지 필요한 EXP 합.
+
+    표는 필요한 레벨까지만 늘려 가며 만들고, 최종 레벨은 bisect 로 한 번에 찾습니다.
+    """
+
+    __slots__ = ("cost", "total")
+
+    def __init__(self, cost):
+        self.cost = cost
+        self.total = [0]
+
+    def exp_to_next(self, level):
+        return max(1, self.cost(level))
+
+    def cumulative(self, level):
+        total = self.total
+        while len(total) <= level:
+            total.append(total[-1] + self.exp_to_next(len(total) - 1))
+        return total[level]
+
+    def level_for(self, total_exp):
+        """누적 EXP total_exp 로 도달하는 레벨."""
+        total = self.total
+        while total[-1] <= total_exp:
+            total.append(total[-1] + self.exp_to_next(len(total) - 1))
+        return bisect_right(total, total_exp) - 1
+
+
+_growth_tables = {name: GrowthTable(cost) for name, cost in GROWTH_CURVES.items()}
+
+
+def growth_table(name=DEFAULT_GROWTH):
+    return _growth_tables[name]
+
 
 # -----------------------------
 # ⚔️ 기술(Skill) 클래스 정의
 # -----------------------------
 class Skill:
+    # __slots__ 로 인스턴스마다 __dict__ 를 만들지 않아 메모리를 아낍니다.
+    __slots__ = ("name", "power", "max_pp", "current_pp")
+
     # 기술의 이름(name), 위력(power), 사용 횟수(pp)을 초기화합니다.
     def __init__(self, name, power, pp):
         self.name = name            # 기술 이름 (예: '몸통박치기')
@@ -25,14 +96,21 @@ class Skill:
 # 🐉 포켓몬(Pokemon) 클래스 정의
 # -----------------------------
 class Pokemon:
+    # __slots__ 로 인스턴스마다 __dict__ 를 만들지 않아 메모리를 아낍니다.
+    # (수만 마리를 다룰 때는 roster.Roster 의 배열 저장소를 사용하세요.)
+    __slots__ = ("name", "level", "max_hp", "current_hp", "exp", "attack", "defense", "speed", "skills",
+                 "growth")
+
     # 이름(name), 레벨(level), 체력(HP), 공격력/방어력/스피드, 그리고 기술 목록(skills)을 초기화합니다.
-    def __init__(self, name, level, max_hp, attack, defense, speed, skills=None):
+    # growth 는 성장 곡선 이름 (GROWTH_CURVES 의 키)
+    def __init__(self, name, level, max_hp, attack, defense, speed, skills=None, growth=DEFAULT_GROWTH):
         self.name = name            # 포켓몬 이름
         self.level = level          # 레벨 (현재는 단순 표시용)
         self.max_hp = max_hp        # 최대 체력
         self.current_hp = max_hp    # 현재 체력 (처음엔 최대체력으로 시작)
-        # 경험치(현재)와 다음 레벨까지 필요한 경험치 계산은 레벨^3 기반으로 간단히 설정
+        # 경험치(현재 레벨에서 모은 양). 다음 레벨까지 필요한 양은 성장 곡선(growth)으로 정해집니다.
         self.exp = 0
+        self.growth = growth
         self.attack = attack        # 공격력
         self.defense = defense      # 방어력
         self.speed = speed          # 속도 (턴 순서 등에 사용 가능)
@@ -49,15 +127,16 @@ class Pokemon:
         return self.current_hp <= 0
 
     # 데미지를 계산하는 메서드
-    def calc_damage(self, skill, target):
+    # rng: 난수 발생기 (전투마다 시드를 정한 random.Random 을 넘기면 같은 결과를 재현할 수 있음)
+    def calc_damage(self, skill, target, rng=random):
         # 간단한 공식: 내 공격력 + 기술 위력 - 상대 방어력 + 랜덤 보정(-2~+2)
         base = skill.power + self.attack - target.defense
         # 최소 데미지를 1로 보장하고, 랜덤 요소를 더해 자연스럽게 만듭니다.
-        damage = max(1, base + random.randint(-2, 2))
+        damage = max(1, base + rng.randint(-2, 2))
         return damage
 
     # target(상대 포켓몬)에게 공격을 수행하는 메서드
-    def attack_target(self, skill_index, target):
+    def attack_target(self, skill_index, target, rng=random):
         # 사용할 기술을 선택 (인덱스로 접근)
         skill = self.skills[skill_index]
 
@@ -66,7 +145,7 @@ class Pokemon:
             return 0, False  # 데미지 0, 사용 실패
 
         # 실제 데미지 계산
-        damage = self.calc_damage(skill, target)
+        damage = self.calc_damage(skill, target, rng)
 
         # 상대 포켓몬의 체력에서 데미지만큼 차감
         target.current_hp = max(0, target.current_hp - damage)
@@ -78,12 +157,14 @@ class Pokemon:
     # 경험치 및 레벨업 관련 메서드
     # -----------------------------
     def exp_to_next(self):
-        # 간단한 공식: 필요 EXP = level^3
-        return max(1, self.level ** 3)
+        # 성장 곡선의 필요 EXP (기본 곡선은 level^3)
+        return growth_table(self.growth).exp_to_next(self.level)
 
     def gain_exp(self, amount):
         """지정한 amount만큼 EXP를 획득하고, 필요 시 레벨업을 수행한다.
 
+        누적 EXP 표에서 최종 레벨을 한 번에 찾고 스탯도 한 번에 올리므로
+        EXP 가 아무리 커도 레벨 수만큼 반복하지 않습니다. (메시지는 레벨마다 하나씩 그대로 만듭니다)
         반환값: 메시지 리스트(예: ['Pikachu gained 20 EXP!', 'Pikachu grew to Lv5!'])
         """
         messages = []
@@ -93,21 +174,27 @@ class Pokemon:
         self.exp += int(amount)
         messages.append(f"{self.name} 는(은) {int(amount)} EXP 를 얻었다!")
 
-        # 레벨업 루프: 얻은 EXP로 여러 레벨을 한 번에 오를 수 있음
-        while self.exp >= self.exp_to_next():
-            self.exp -= self.exp_to_next()
-            self.level_up()
-            messages.append(f"{self.name} 은(는) Lv{self.level} 로 레벨업했다!")
+        # 얻은 EXP로 여러 레벨을 한 번에 오를 수 있음
+        table = growth_table(self.growth)
+        start = self.level
+        total = table.cumulative(start) + self.exp
+        new_level = table.level_for(total)
+        if new_level > start:
+            self.exp = total - table.cumulative(new_level)
+            self.level_up(new_level - start)
+            name = self.name
+            messages.extend(f"{name} 은(는) Lv{lv} 로 레벨업했다!" for lv in range(start + 1, new_level + 1))
 
         return messages
 
-    def level_up(self):
-        # 레벨을 1 올리고, 기본 스탯을 소폭 상승시킨다.
-        self.level += 1
-        # 예시 수치: max_hp +5, attack+2, defense+2, speed+1
-        self.max_hp += 5
-        self.attack += 2
-        self.defense += 2
-        self.speed += 1
+    def level_up(self, levels=1):
+        # 레벨을 levels 만큼 올리고, 기본 스탯을 레벨당 소폭 상승시킨다.
+        self.level += levels
+        # 레벨당 max_hp +5, attack+2, defense+2, speed+1
+        self.max_hp += LEVEL_UP_HP * levels
+        self.attack += LEVEL_UP_ATTACK * levels
+        self.defense += LEVEL_UP_DEFENSE * levels
+        self.speed += LEVEL_UP_SPEED * levels
         # 체력 증가분만큼 현재 체력도 회복시키기(플레이어가 더 유리하게 느껴짐)
-        self.current_hp = min(self.max_hp, self.current_hp + 5)
+        # (한 레벨씩 min(max_hp, hp + 5) 를 반복한 것과 같은 값)
+        self.current_hp = min(self.max_hp, self.current_hp + LEVEL_UP_HP * levels)
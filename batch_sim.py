@@ -0,0 +1,186 @@
+# batch_sim.py
+# NumPy 로 N 개의 전투를 한꺼번에 계산하는 일괄 전투 시뮬레이터입니다.
+# 규칙은 battle_engine.BattleEngine.run_to_end 와 같습니다:
+#   - 매 턴 플레이어가 먼저 0번 기술로 공격, 상대가 살아 있으면 상대가 반격
+#   - 데미지 = max(1, 위력 + 공격 - 방어 + 랜덤(-2~+2))
+#   - 플레이어 PP 가 바닥나면 무승부로 종료
+# (승률 추정처럼 같은 전투를 수만 번 돌려야 할 때 attack_target 루프 대신 사용합니다.)
+#
+# 실행 예:  python batch_sim.py   -> 스타터 vs 야생 후보들의 승률 출력
+
+import numpy as np
+
+# 결과 코드
+WIN = 1
+LOSS = -1
+DRAW = 0
+
+# 한 쪽 스탯 배열의 키 (모두 스칼라 또는 길이 N 의 배열)
+STAT_KEYS = ("level", "max_hp", "attack", "defense", "speed", "power", "pp")
+
+
+def side_from_pokemon(pokemon, skill_index=0):
+    """Pokemon 객체 하나를 simulate_batch 가 받는 스탯 딕셔너리로 바꿉니다."""
+    skill = pokemon.skills[skill_index]
+    return {
+        "level": pokemon.level,
+        "max_hp": pokemon.max_hp,
+        "hp": pokemon.current_hp,
+        "attack": pokemon.attack,
+        "defense": pokemon.defense,
+        "speed": pokemon.speed,
+        "power": skill.power,
+        "pp": skill.current_pp,
+    }
+
+
+class BatchResult:
+    """simulate_batch 의 결과 (모두 길이 N 의 배열)."""
+
+    def __init__(self, outcome, turns, attacker_hp, defender_hp):
+        self.outcome = outcome            # WIN / LOSS / DRAW (int8)
+        self.turns = turns                # 걸린 턴 수
+        self.attacker_hp = attacker_hp    # 전투 후 공격측(플레이어) 남은 HP
+        self.defender_hp = defender_hp    # 전투 후 방어측(상대) 남은 HP
+
+    @property
+    def win(self):
+        return self.outcome == WIN
+
+    @property
+    def loss(self):
+        return self.outcome == LOSS
+
+    def win_rate(self):
+        return float(self.win.mean()) if self.outcome.size else 0.0
+
+    def __len__(self):
+        return self.outcome.size
+
+
+def _side_arrays(side, n):
+    # 누락된 현재 HP 는 최대 HP 로 간주합니다.
+    arrays = {}
+    for key in STAT_KEYS:
+        arrays[key] = np.broadcast_to(np.asarray(side[key], dtype=np.int64), (n,))
+    arrays["hp"] = np.broadcast_to(np.asarray(side.get("hp", side["max_hp"]), dtype=np.int64), (n,))
+    return arrays
+
+
+def _batch_size(attacker, defender, n):
+    if n is not None:
+        return int(n)
+    sizes = [np.size(v) for side in (attacker, defender) for v in side.values()]
+    return max(sizes) if sizes else 1
+
+
+def simulate_batch(attacker, defender, n=None, rng=None, max_turns=1000):
+    """공격측(플레이어)과 방어측(상대) 스탯 배열로 N 개의 전투를 동시에 진행합니다.
+
+    attacker / defender: STAT_KEYS (+ 선택적으로 "hp") 를 키로 하는 딕셔너리.
+        값은 스칼라 또는 길이 N 의 배열이며 서로 브로드캐스트됩니다.
+    n: 전투 수 (생략하면 배열 길이에서 결정)
+    rng: numpy.random.Generator (생략하면 새로 생성)
+
+    반환값: BatchResult
+    """
+    n = _batch_size(attacker, defender, n)
+    rng = rng if rng is not None else np.random.default_rng()
+    a = _side_arrays(attacker, n)
+    d = _side_arrays(defender, n)
+
+    a_hp = a["hp"].astype(np.int32)
+    d_hp = d["hp"].astype(np.int32)
+    a_pp = a["pp"].astype(np.int32)
+    d_pp = d["pp"].astype(np.int32)
+    # 턴마다 바뀌지 않는 데미지 기본값 (위력 + 공격 - 방어)
+    a_base = (a["power"] + a["attack"] - d["defense"]).astype(np.int32)
+    d_base = (d["power"] + d["attack"] - a["defense"]).astype(np.int32)
+
+    outcome = np.zeros(n, dtype=np.int8)
+    turns = np.zeros(n, dtype=np.int32)
+    # 진행 중인 전투 마스크. 대부분의 전투가 몇 턴 안에 끝나므로 인덱스를 골라내는 대신
+    # 전체 배열에 마스크를 씌워 계산하는 편이 빠릅니다.
+    active = a_pp > 0
+    roll = np.empty(n, dtype=np.int32)
+    dmg = np.empty(n, dtype=np.int32)
+
+    for _ in range(max_turns):
+        if not active.any():
+            break
+        turns += active
+
+        # 플레이어 공격: 진행 중인 전투만 PP/HP 가 바뀝니다.
+        a_pp -= active
+        roll[:] = rng.integers(-2, 3, size=n, dtype=np.int8)
+        np.add(a_base, roll, out=dmg)
+        np.maximum(dmg, 1, out=dmg)
+        dmg *= active
+        d_hp -= dmg
+        np.maximum(d_hp, 0, out=d_hp)
+        ko = active & (d_hp <= 0)
+        outcome[ko] = WIN
+        active &= ~ko
+
+        # 상대 반격 (PP 가 없으면 아무 일도 일어나지 않음)
+        attacking = active & (d_pp > 0)
+        d_pp -= attacking
+        roll[:] = rng.integers(-2, 3, size=n, dtype=np.int8)
+        np.add(d_base, roll, out=dmg)
+        np.maximum(dmg, 1, out=dmg)
+        dmg *= attacking
+        a_hp -= dmg
+        np.maximum(a_hp, 0, out=a_hp)
+        ko = active & (a_hp <= 0)
+        outcome[ko] = LOSS
+        active &= ~ko
+
+        # 플레이어 PP 가 바닥난 전투는 무승부로 빠집니다.
+        active &= a_pp > 0
+
+    return BatchResult(outcome, turns, a_hp, d_hp)
+
+
+def _loop_baseline(player_stats, wild_stats, n, skill_power=10, skill_pp=35):
+    # 비교용: Pokemon.attack_target 을 파이썬 루프로 돌리는 기존 방식
+    from base_pokemon import Pokemon, Skill
+    wins = 0
+    for _ in range(n):
+        name, lvl, hp, atk, df, sp = player_stats
+        p = Pokemon(name, lvl, hp, atk, df, sp, [Skill("Tackle", skill_power, skill_pp)])
+        name, lvl, hp, atk, df, sp = wild_stats
+        e = Pokemon(name, lvl, hp, atk, df, sp, [Skill("Tackle", skill_power, skill_pp)])
+        while p.skills[0].current_pp > 0:
+            p.attack_target(0, e)
+            if e.is_fainted():
+                wins += 1
+                break
+            e.attack_target(0, p)
+            if p.is_fainted():
+                break
+    return wins / float(n)
+
+
+if __name__ == "__main__":
+    import time
+    from base_pokemon import Pokemon, STARTER, WILD_CANDIDATES
+
+    N = 200_000
+    name, lvl, hp, atk, df, sp = STARTER
+    starter = side_from_pokemon(Pokemon(name, lvl, hp, atk, df, sp))
+    rng = np.random.default_rng(0)
+    for wild in WILD_CANDIDATES:
+        name, lvl, hp, atk, df, sp = wild
+        enemy = side_from_pokemon(Pokemon(name, lvl, hp, atk, df, sp))
+
+        t0 = time.perf_counter()
+        res = simulate_batch(starter, enemy, n=N, rng=rng)
+        vec_rate = N / (time.perf_counter() - t0)
+
+        loop_n = 5_000
+        t0 = time.perf_counter()
+        _loop_baseline(STARTER, wild, loop_n)
+        loop_rate = loop_n / (time.perf_counter() - t0)
+
+        print(f"{name}: 승률 {res.win_rate():.3f}, 평균 턴 {res.turns.mean():.2f}, "
+              f"{vec_rate:,.0f} 전투/초 (루프 {loop_rate:,.0f} 전투/초, x{vec_rate / loop_rate:.0f})")
@@ -1,267 +1,340 @@
 # battle.py
 import pygame
-import os
 from scenes import BaseScene
+from sprite_cache import shared_cache
+from text_cache import render_text
+from font_manager import get_font, UI_FONT
+from sprite_atlas import SpriteBatch
+from hud import battle_hud
+from enemy_ai import shared_ai
+from battle_engine import (
+    BattleEngine, MENU, SKILL_SELECT, FINISHED, PLAYER, ENEMY,
+    EV_START, EV_ATTACK, EV_NO_PP, EV_FAINT, EV_EXP, EV_FLEE, EV_END,
+)
 
 FONT = None  # 전역 폰트 (초기화는 __init__에서)
+SPRITE_SIZE = (120, 120)  # 전투 화면 포켓몬 이미지 크기
+PLACEHOLDER_COLOR = (180, 180, 180)  # 이미지가 아직 읽히는 중일 때 그리는 대체 사각형 색
+# 기술 선택 키 (1~9번 기술)
+SKILL_KEYS = (pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+              pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9)
+
+# 전투 화면 박스 영역 (더티 렉트 모드에서 바뀐 영역 단위로도 사용)
+PLAYER_BOX = (50, 50, 300, 100)
+ENEMY_BOX = (450, 50, 300, 100)
+MESSAGE_BOX = (50, 400, 700, 150)
+BOX_RECTS = (PLAYER_BOX, ENEMY_BOX, MESSAGE_BOX)
 
 class BattleScene(BaseScene):
-    def __init__(self, game, player_pokemon, enemy_pokemon, origin_scene=None):
+    # seed: 이 전투의 난수 시드 (없으면 엔진이 새로 뽑음). game.battle_log 가 있으면 전투를 기록합니다.
+    def __init__(self, game, player_pokemon, enemy_pokemon, origin_scene=None, seed=None):
         super().__init__(game)
         global FONT
         if FONT is None:
-            FONT = pygame.font.SysFont("malgungothic", 24)
+            FONT = get_font(UI_FONT, 24)
 
         self.player_pokemon = player_pokemon
         self.enemy_pokemon = enemy_pokemon
         # 전투를 시작한 원래 씬을 보관(맵으로 되돌아갈 때 같은 인스턴스로 복귀하기 위해)
         self.origin_scene = origin_scene
 
-        # 전투 화면에 표시할 포켓몬 이미지를 로드합니다. 파일 경로는
+        # 전투 화면에 표시할 포켓몬 이미지를 가져옵니다. 파일 경로는
         # project_root/<name>.(png|jpg) 또는 assets/pokemon/<name>.(png|jpg)
-        def find_image(name):
-            exts = ("png", "jpg", "jpeg")
-            candidates = []
-            # 우선 루트 폴더
-            for e in exts:
-                candidates.append(os.path.join(f"{name}.{e}"))
-            # assets/pokemon 폴더
-            for e in exts:
-                candidates.append(os.path.join("assets", "pokemon", f"{name}.{e}"))
-            for p in candidates:
-                if os.path.exists(p):
-                    return p
-            return None
+        # 공유 스프라이트 캐시가 디스크 로드/스케일 결과를 보관하므로
+        # 같은 포켓몬과 다시 만나면 바로 재사용됩니다.
+        # 캐시에 없으면 작업 스레드에 읽기를 맡기고, 도착할 때까지 대체 사각형을 그립니다.
+        # (풀숲에 들어설 때 MapScene 이 미리 요청해 두므로 보통은 이미 캐시에 있습니다.)
+        cache = shared_cache()
+        self.player_image = cache.get_async(self.player_pokemon.name, SPRITE_SIZE)
+        self.enemy_image = cache.get_async(self.enemy_pokemon.name, SPRITE_SIZE)
+        # 한 프레임의 텍스트/이미지 blit 을 모아 Surface.blits 로 그립니다.
+        self._batch = SpriteBatch()
 
-        # 로드 시도
-        try:
-            ppath = find_image(self.player_pokemon.name)
-            if ppath:
-                self.player_image = pygame.image.load(ppath).convert_alpha()
-                self.player_image = pygame.transform.smoothscale(self.player_image, (120, 120))
-            else:
-                self.player_image = None
-        except Exception:
-            self.player_image = None
+        # 전투 규칙(턴 진행, 데미지, EXP)은 pygame 과 무관한 BattleEngine 이 담당합니다.
+        # 이 씬은 엔진이 내보내는 이벤트를 로그 문자열로 바꿔 보여주기만 합니다.
+        self.engine = BattleEngine(self.player_pokemon, self.enemy_pokemon, seed=seed,
+                                   battle_log=getattr(game, 'battle_log', None))
+        self.log = ""
+        self.selected_skill = 0
+        # 상대 기술을 고르는 중인 AI 탐색 (enemy_ai.AiJob, 없으면 None)
+        self.ai_job = None
+        self.apply_events()
 
-        try:
-            epath = find_image(self.enemy_pokemon.name)
-            if epath:
-                self.enemy_image = pygame.image.load(epath).convert_alpha()
-                self.enemy_image = pygame.transform.smoothscale(self.enemy_image, (120, 120))
-            else:
-                self.enemy_image = None
-        except Exception:
-            self.enemy_image = None
+        # 이름/레벨, HP 바, HP 수치는 맵과 같은 HUD 위젯을 씁니다.
+        # 화면에 표시할 HP는 실제 HP와 분리하여 HP 바가 부드럽게 애니메이션(감소)합니다.
+        self.player_hud = battle_hud(lambda: self.player_pokemon, 60, 60, FONT)
+        self.enemy_hud = battle_hud(lambda: self.enemy_pokemon, 460, 60, FONT)
 
-        self.state = "MENU"  # MENU -> SKILL_SELECT -> ANIMATION/LOG 등
-        self.log = "야생 {} 이(가) 나타났다!".format(enemy_pokemon.name)
-        self.selected_skill = 0
+    # 전투 상태/턴은 엔진의 값을 그대로 보여줍니다.
+    @property
+    def state(self):
+        return self.engine.state  # MENU -> SKILL_SELECT -> FINISHED / FLED
 
-        self.turn = "PLAYER"  # PLAYER / ENEMY
-        # 화면에 표시할 HP는 실제 HP와 분리하여 애니메이션(감소)을 표현합니다.
-        # float로 보간해서 매 프레임 부드럽게 변경됩니다.
-        self.player_display_hp = float(self.player_pokemon.current_hp)
-        self.enemy_display_hp = float(self.enemy_pokemon.current_hp)
+    @property
+    def turn(self):
+        return self.engine.turn  # PLAYER / ENEMY
 
     def handle_events(self, events):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 # 전투가 끝나면 아무 키나 누르면 필드로 돌아가거나 게임오버로 이동
-                if self.state == "FINISHED":
+                if self.state == FINISHED:
                     # 플레이어가 기절 상태라면 게임오버 씬으로
                     if self.player_pokemon.is_fainted():
                         from scenes import GameOverScene
                         self.game.change_scene(GameOverScene(self.game))
                     else:
-                        # origin_scene 이 있으면 같은 인스턴스로 복귀
-                        if getattr(self, 'origin_scene', None) is not None:
-                            self.game.change_scene(self.origin_scene)
-                        else:
-                            from scenes import MapScene
-                            self.game.change_scene(MapScene(self.game))
+                        self.return_to_map()
                     return
 
-                if self.state == "MENU":
+                # 상대가 기술을 고르는 동안에는 입력을 받지 않습니다.
+                if self.ai_job is not None:
+                    continue
+
+                if self.state == MENU:
                     if event.key == pygame.K_1:
-                        self.state = "SKILL_SELECT"
+                        self.engine.open_skills()
                     elif event.key == pygame.K_2:
-                        # 도망
-                        self.log = "성공적으로 도망쳤다!"
-                        # 필드로 돌아가기: origin_scene이 있으면 같은 인스턴스로 복귀 (HP 리셋 방지)
-                        # 도망 횟수 누적 및 연속 도망 체크
-                        try:
-                            self.game.flee_count = getattr(self.game, 'flee_count', 0) + 1
-                        except Exception:
-                            pass
-
-                        # 두 번 연속 도망이면 게임 오버 처리
-                        if getattr(self.game, 'flee_count', 0) >= 2:
-                            try:
-                                self.game.last_gameover_reason = "포켓몬이 실망했다..."
-                            except Exception:
-                                pass
-                            from scenes import GameOverScene
-                            self.game.change_scene(GameOverScene(self.game))
-                            return
+                        self.flee()
+                        return
+                elif self.state == SKILL_SELECT:
+                    # 숫자 키로 기술 선택, Esc/Backspace 로 메뉴로 돌아가기
+                    if event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
+                        self.engine.close_skills()
+                    elif event.key in SKILL_KEYS:
+                        index = SKILL_KEYS.index(event.key)
+                        if index < len(self.player_pokemon.skills):
+                            self.player_attack(index)
 
-                        if getattr(self, 'origin_scene', None) is not None:
-                            try:
-                                # 짧은 쿨다운을 걸어 즉시 재전투 발생을 방지
-                                self.origin_scene.battle_cooldown = 1.0
-                            except Exception:
-                                pass
-                            self.game.change_scene(self.origin_scene)
-                        else:
-                            from scenes import MapScene
-                            self.game.change_scene(MapScene(self.game))
-                elif self.state == "SKILL_SELECT":
-                    # 예: 1번 스킬만 있다고 가정
-                    if event.key == pygame.K_1:
-                        self.player_attack()
+    def return_to_map(self):
+        # origin_scene 이 있으면 같은 인스턴스로 복귀 (HP 리셋 방지)
+        if getattr(self, 'origin_scene', None) is not None:
+            self.game.change_scene(self.origin_scene)
+        else:
+            from scenes import MapScene
+            self.game.change_scene(MapScene(self.game))
 
-    def player_attack(self):
-        damage, ok = self.player_pokemon.attack_target(0, self.enemy_pokemon)
-        if not ok:
-            self.log = "PP가 부족하다!"
+    def flee(self):
+        if self.turn != PLAYER:
             return
+        self.engine.flee()
+        self.apply_events()
+        # 도망 횟수 누적 및 연속 도망 체크
+        try:
+            self.game.flee_count = getattr(self.game, 'flee_count', 0) + 1
+        except Exception:
+            pass
 
-        self.log = f"{self.player_pokemon.name} 의 {self.player_pokemon.skills[0].name}! {damage} 데미지!"
-        if self.enemy_pokemon.is_fainted():
-            self.log += f"\n야생 {self.enemy_pokemon.name} 은(는) 쓰러졌다!"
-            # EXP 지급: 간단한 공식으로 경험치 지급 (예: 상대 레벨 * 10)
-            exp_gain = max(1, int(self.enemy_pokemon.level * 10))
-            # 게임 전체 누적 EXP에 추가
+        # 두 번 연속 도망이면 게임 오버 처리
+        if getattr(self.game, 'flee_count', 0) >= 2:
             try:
-                self.game.total_exp = getattr(self.game, 'total_exp', 0) + exp_gain
+                self.game.last_gameover_reason = "포켓몬이 실망했다..."
             except Exception:
                 pass
+            from scenes import GameOverScene
+            self.game.change_scene(GameOverScene(self.game))
+            return
+
+        if getattr(self, 'origin_scene', None) is not None:
             try:
-                msgs = self.player_pokemon.gain_exp(exp_gain)
-                for m in msgs:
-                    self.log += "\n" + m
-            except Exception:
-                # 안전하게 무시 (포켓몬 객체에 exp 메서드가 없을 수 있음)
-                pass
-            # 연속 도망 카운트 초기화 (승리하면 '연속'이 깨집니다)
-            try:
-                self.game.flee_count = 0
+                # 짧은 쿨다운을 걸어 즉시 재전투 발생을 방지
+                self.origin_scene.battle_cooldown = 1.0
             except Exception:
                 pass
-            # 전투 종료 상태로 전환 (아무 키나 누르면 필드로 복귀)
-            self.state = "FINISHED"
-            # 전투가 끝난 시 origin_scene이 있으면 그 맵에 쿨다운을 설정하여
-            # 즉시 재전투가 발생하지 않도록 보호합니다.
-            if getattr(self, 'origin_scene', None) is not None:
+        self.return_to_map()
+
+    def player_attack(self, skill_index=0):
+        if self.turn != PLAYER:
+            # 상대가 기술을 고르는 중
+            return
+        self.selected_skill = skill_index
+        if len(self.enemy_pokemon.skills) <= 1:
+            # 상대 기술이 하나뿐이면 고를 것이 없으므로 상대 턴까지 바로 진행합니다.
+            self.engine.player_attack(skill_index)
+            self.apply_events()
+            return
+        # 상대 턴은 AI 가 작업 스레드에서 기술을 고른 뒤 update() 에서 진행합니다.
+        self.engine.player_attack(skill_index, enemy_turn=False)
+        self.apply_events()
+        if self.turn == ENEMY and not self.engine.finished:
+            self.ai_job = shared_ai().think(self.enemy_pokemon, self.player_pokemon)
+
+    def enemy_attack(self, skill_index=0):
+        self.engine.enemy_attack(skill_index)
+        self.apply_events()
+
+    def poll_ai(self):
+        # 탐색이 끝났거나 제한 시간이 지났으면 지금까지의 최선 수로 상대 턴을 진행합니다.
+        job = self.ai_job
+        if job is None or not job.finished:
+            return
+        job.cancel()
+        self.ai_job = None
+        if self.turn == ENEMY and not self.engine.finished:
+            self.enemy_attack(job.best)
+
+    def apply_events(self):
+        """엔진에 쌓인 이벤트를 꺼내 로그와 게임 상태(누적 EXP, 도망 횟수 등)에 반영합니다."""
+        for ev in self.engine.drain_events():
+            if ev.kind == EV_START:
+                self.log = "야생 {} 이(가) 나타났다!".format(ev.actor.name)
+            elif ev.kind == EV_ATTACK:
+                if ev.side == PLAYER:
+                    self.log = f"{ev.actor.name} 의 {ev.skill.name}! {ev.damage} 데미지!"
+                else:
+                    self.log += f"\n야생 {ev.actor.name} 의 공격! {ev.damage} 데미지!"
+            elif ev.kind == EV_NO_PP:
+                if ev.side == PLAYER:
+                    self.log = "PP가 부족하다!"
+                else:
+                    self.log = f"야생 {ev.actor.name} 은(는) 아무 일도 일어나지 않았다."
+            elif ev.kind == EV_FAINT:
+                if ev.side == ENEMY:
+                    self.log += f"\n야생 {ev.target.name} 은(는) 쓰러졌다!"
+                else:
+                    self.log += f"\n{ev.target.name} 은(는) 기절했다..."
+            elif ev.kind == EV_EXP:
+                # 게임 전체 누적 EXP에 추가
                 try:
-                    self.origin_scene.battle_cooldown = 1.0
+                    self.game.total_exp = getattr(self.game, 'total_exp', 0) + ev.amount
                 except Exception:
                     pass
-            self.log += "\n아무 키나 눌러 필드로 돌아갑니다."
-        else:
-            self.turn = "ENEMY"
-            self.enemy_attack()
+                for m in ev.messages:
+                    self.log += "\n" + m
+                # 연속 도망 카운트 초기화 (승리하면 '연속'이 깨집니다)
+                try:
+                    self.game.flee_count = 0
+                except Exception:
+                    pass
+            elif ev.kind == EV_FLEE:
+                self.log = "성공적으로 도망쳤다!"
+            elif ev.kind == EV_END:
+                # 승리했다면 origin_scene 맵에 쿨다운을 설정하여
+                # 즉시 재전투가 발생하지 않도록 보호합니다.
+                if ev.side == PLAYER and getattr(self, 'origin_scene', None) is not None:
+                    try:
+                        self.origin_scene.battle_cooldown = 1.0
+                    except Exception:
+                        pass
+                self.log += "\n아무 키나 눌러 필드로 돌아갑니다."
 
-    def enemy_attack(self):
-        damage, ok = self.enemy_pokemon.attack_target(0, self.player_pokemon)
-        if not ok:
-            self.log = f"야생 {self.enemy_pokemon.name} 은(는) 아무 일도 일어나지 않았다."
-        else:
-            self.log += f"\n야생 {self.enemy_pokemon.name} 의 공격! {damage} 데미지!"
-        # 플레이어 기절 체크
-        if self.player_pokemon.is_fainted():
-            self.log += f"\n{self.player_pokemon.name} 은(는) 기절했다..."
-            self.state = "FINISHED"
-            self.log += "\n아무 키나 눌러 필드로 돌아갑니다."
-        self.turn = "PLAYER"
+    def poll_sprites(self):
+        # 작업 스레드에서 도착한 스프라이트를 받아 화면을 다시 그리게 합니다.
+        cache = shared_cache()
+        if self.player_image is None:
+            self.player_image = cache.peek(self.player_pokemon.name, SPRITE_SIZE)
+            if self.player_image is not None:
+                self.invalidate()
+        if self.enemy_image is None:
+            self.enemy_image = cache.peek(self.enemy_pokemon.name, SPRITE_SIZE)
+            if self.enemy_image is not None:
+                self.invalidate()
+
+    def sprite_pending(self, pokemon):
+        # 이미지가 없을 때, 아직 읽히는 중인지 (파일이 없는 포켓몬은 대체 사각형도 그리지 않음)
+        return not shared_cache().is_missing(pokemon.name)
 
     def update(self, dt):
+        if self.player_image is None or self.enemy_image is None:
+            self.poll_sprites()
+        if self.ai_job is not None:
+            self.poll_ai()
         # 둘 중 하나라도 쓰러지면 아무 키나 누르면 필드로 복귀하도록 바꿀 수도 있습니다.
         if self.player_pokemon.is_fainted() or self.enemy_pokemon.is_fainted():
             # 간단하게 엔터 누르면 돌아간다든지, 추가 로직 가능
             pass
         # HP 애니메이션: 실제 HP 쪽으로 부드럽게 접근
-        lerp_speed = 6.0  # 클수록 더 빨리 줄어듬 (단위: 1/초에 가까워지는 비율)
-        # 플레이어
-        target_p = float(self.player_pokemon.current_hp)
-        if abs(self.player_display_hp - target_p) > 0.01:
-            self.player_display_hp += (target_p - self.player_display_hp) * min(1.0, lerp_speed * dt)
-        else:
-            self.player_display_hp = target_p
-        # 상대
-        target_e = float(self.enemy_pokemon.current_hp)
-        if abs(self.enemy_display_hp - target_e) > 0.01:
-            self.enemy_display_hp += (target_e - self.enemy_display_hp) * min(1.0, lerp_speed * dt)
-        else:
-            self.enemy_display_hp = target_e
+        self.player_hud.update(dt)
+        self.enemy_hud.update(dt)
 
     def draw(self, screen):
+        if not self.dirty_mode:
+            self.draw_scene(screen)
+            return None
+        # 더티 렉트 모드: 바뀐 영역(내 포켓몬 / 상대 / 메시지 박스)만 그 영역 안에서 다시 그립니다.
+        regions = self.changed_regions(screen)
+        for rect in regions:
+            self.draw_scene(screen, rect)
+        return regions
+
+    def changed_regions(self, screen):
+        p, e = self.player_pokemon, self.enemy_pokemon
+        # HUD 는 보이는 값(이름/레벨, 바 너비와 색, HP 수치)이 바뀔 때만 바뀐 것으로 봅니다.
+        state = (
+            self.player_hud.state(),
+            self.enemy_hud.state(),
+            (self.log, self.state, p.is_fainted() or e.is_fainted(),
+             tuple(s.current_pp for s in p.skills)),
+        )
+        if self.needs_full_redraw:
+            self.needs_full_redraw = False
+            self._drawn_state = state
+            return [screen.get_rect()]
+        drawn = getattr(self, '_drawn_state', None)
+        self._drawn_state = state
+        regions = []
+        for rect, now, before in zip(BOX_RECTS, state, drawn or (None, None, None)):
+            if now != before:
+                regions.append(pygame.Rect(rect))
+        return regions
+
+    def draw_scene(self, screen, area=None):
+        """전투 화면을 그립니다. area(Rect) 를 주면 그 영역만 (그 영역에 걸친 박스의 내용만) 다시 그립니다."""
+        if area is not None:
+            screen.set_clip(area)
         screen.fill((255, 255, 255))
+        # 박스마다 내용(포켓몬 이미지, HUD, 로그)이 겹치지 않으므로 area 에 걸친 박스만 그립니다.
+        player = area is None or area.colliderect(PLAYER_BOX)
+        enemy = area is None or area.colliderect(ENEMY_BOX)
+        message = area is None or area.colliderect(MESSAGE_BOX)
 
         # 간단한 박스 UI
-        pygame.draw.rect(screen, (200, 200, 200), (50, 50, 300, 100))   # 내 포켓몬
-        pygame.draw.rect(screen, (200, 200, 200), (450, 50, 300, 100))  # 야생 포켓몬
-        pygame.draw.rect(screen, (230, 230, 230), (50, 400, 700, 150))  # 메뉴/메시지
+        if player:
+            pygame.draw.rect(screen, (200, 200, 200), PLAYER_BOX)   # 내 포켓몬
+        if enemy:
+            pygame.draw.rect(screen, (200, 200, 200), ENEMY_BOX)    # 야생 포켓몬
+        if message:
+            pygame.draw.rect(screen, (230, 230, 230), MESSAGE_BOX)  # 메뉴/메시지
 
-        # 이름 + 레벨 텍스트
-        p_name = f"{self.player_pokemon.name} Lv{self.player_pokemon.level}"
-        e_name = f"{self.enemy_pokemon.name} Lv{self.enemy_pokemon.level}"
-        p_text = FONT.render(p_name, True, (0, 0, 0))
-        e_text = FONT.render(e_name, True, (0, 0, 0))
-        screen.blit(p_text, (60, 60))
-        screen.blit(e_text, (460, 60))
+        # 대체 사각형은 도형이므로 먼저 그리고, 나머지(이미지, HUD, 텍스트)는 모아서 한 번에 blit 합니다.
+        # (포켓몬 이미지는 보통 스프라이트 아틀라스 시트의 일부입니다)
+        enemy_pos = (460 + 80, 60)      # 적: 오른쪽 박스 위쪽
+        player_pos = (60 + 20, 90)      # 아군: 왼쪽 박스 아래쪽
+        if enemy and self.enemy_image is None and self.sprite_pending(self.enemy_pokemon):
+            pygame.draw.rect(screen, PLACEHOLDER_COLOR, (enemy_pos, SPRITE_SIZE))
+        if player and self.player_image is None and self.sprite_pending(self.player_pokemon):
+            pygame.draw.rect(screen, PLACEHOLDER_COLOR, (player_pos, SPRITE_SIZE))
 
+        batch = self._batch
         # 포켓몬 이미지 표시 (적은 상단 우측, 아군은 하단 좌측 느낌)
-        # enemy: 오른쪽 박스 위쪽 쪽에 배치
-        if getattr(self, 'enemy_image', None) is not None:
-            try:
-                screen.blit(self.enemy_image, (460 + 80, 60))
-            except Exception:
-                pass
-        # player: 왼쪽 박스 아래쪽 쪽에 배치
-        if getattr(self, 'player_image', None) is not None:
-            try:
-                screen.blit(self.player_image, (60 + 20, 90))
-            except Exception:
-                pass
-
-        # HP 바 그리기 함수(내부)
-        def draw_hp_bar(screen, x, y, w, h, display_hp, max_hp):
-            # 백그라운드
-            pygame.draw.rect(screen, (100, 100, 100), (x - 1, y - 1, w + 2, h + 2))
-            pygame.draw.rect(screen, (210, 210, 210), (x, y, w, h))
-            # 비율 계산
-            fraction = 0.0 if max_hp <= 0 else max(0.0, min(1.0, display_hp / float(max_hp)))
-            fill_w = int(w * fraction)
-            # 색상: 초록 -> 노랑 -> 빨강
-            if fraction > 0.5:
-                color = (88, 200, 115)  # 녹색
-            elif fraction > 0.2:
-                color = (240, 200, 80)  # 노랑
-            else:
-                color = (220, 60, 60)   # 빨강
-            if fill_w > 0:
-                pygame.draw.rect(screen, color, (x, y, fill_w, h))
-
-        # 내 포켓몬 HP 바
-        draw_hp_bar(screen, 60, 90, 220, 18, self.player_display_hp, self.player_pokemon.max_hp)
-        # 상대 포켓몬 HP 바
-        draw_hp_bar(screen, 460, 90, 220, 18, self.enemy_display_hp, self.enemy_pokemon.max_hp)
-
-        # HP 수치 텍스트 (우측에 표시)
-        p_hp_text = FONT.render(f"{int(self.player_display_hp)}/{self.player_pokemon.max_hp}", True, (0, 0, 0))
-        e_hp_text = FONT.render(f"{int(self.enemy_display_hp)}/{self.enemy_pokemon.max_hp}", True, (0, 0, 0))
-        screen.blit(p_hp_text, (60, 115))
-        screen.blit(e_hp_text, (460, 115))
+        # 이름/레벨, HP 바, HP 수치 (값이 바뀐 위젯만 다시 렌더링되고, 나머지는 캐시된 Surface)
+        if enemy:
+            if self.enemy_image is not None:
+                batch.add(self.enemy_image, enemy_pos)
+            self.enemy_hud.draw(screen, batch)
+        if player:
+            if self.player_image is not None:
+                batch.add(self.player_image, player_pos)
+            self.player_hud.draw(screen, batch)
+        if message:
+            self.add_message(batch)
+        batch.flush(screen)
+        if area is not None:
+            screen.set_clip(None)
 
+    def add_message(self, batch):
         # 메뉴/로그
         y = 410
         for i, line in enumerate(self.log.split("\n")):
-            log_text = FONT.render(line, True, (0, 0, 0))
-            screen.blit(log_text, (60, y + i * 30))
+            batch.add(render_text(FONT, line, (0, 0, 0)), (60, y + i * 30))
 
-        if not (self.player_pokemon.is_fainted() or self.enemy_pokemon.is_fainted()):
-            menu_text1 = FONT.render("1) 공격", True, (0, 0, 0))
-            menu_text2 = FONT.render("2) 도망", True, (0, 0, 0))
-            screen.blit(menu_text1, (60, 470))
-            screen.blit(menu_text2, (200, 470))
+        if self.player_pokemon.is_fainted() or self.enemy_pokemon.is_fainted():
+            pass
+        elif self.state == SKILL_SELECT:
+            # 기술 목록 (한 줄에 넷, 남은 PP 표시)
+            for i, skill in enumerate(self.player_pokemon.skills[:len(SKILL_KEYS)]):
+                label = f"{i + 1}) {skill.name} {skill.current_pp}/{skill.max_pp}"
+                batch.add(render_text(FONT, label, (0, 0, 0)), (60 + (i % 4) * 170, 470 + (i // 4) * 30))
+        else:
+            batch.add(render_text(FONT, "1) 공격", (0, 0, 0)), (60, 470))
+            batch.add(render_text(FONT, "2) 도망", (0, 0, 0)), (200, 470))
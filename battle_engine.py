@@ -0,0 +1,231 @@
+# battle_engine.py
+# pygame 없이 전투 규칙만 처리하는 순수 파이썬 전투 엔진입니다.
+# BattleScene 은 이 엔진이 만들어 내는 이벤트를 글자/그림으로 보여주기만 합니다.
+# (밸런스 작업처럼 창을 띄우지 않고 전투를 대량으로 돌릴 때도 이 모듈만 쓰면 됩니다.)
+#
+# 전투마다 시드를 정한 난수(random.Random)를 따로 쓰므로, 시드와 입력이 같으면 결과도 같습니다.
+# battle_log 를 넘기면 시드/입력/이벤트를 파일에 바로바로 기록합니다 (replay.py 로 재현·검증).
+import random
+
+# -----------------------------
+# 📋 전투 상태 / 이벤트 종류
+# -----------------------------
+MENU = "MENU"                  # 행동 선택 대기
+SKILL_SELECT = "SKILL_SELECT"  # 기술 선택 대기
+FINISHED = "FINISHED"          # 한쪽이 쓰러져 전투 종료
+FLED = "FLED"                  # 플레이어가 도망쳐 전투 종료
+
+PLAYER = "PLAYER"
+ENEMY = "ENEMY"
+
+EV_START = "start"        # 전투 시작 (target=야생 포켓몬)
+EV_ATTACK = "attack"      # 공격 성공 (actor, target, skill, damage)
+EV_NO_PP = "no_pp"        # PP 부족으로 기술 사용 실패 (actor, skill)
+EV_FAINT = "faint"        # 기절 (target)
+EV_EXP = "exp"            # 경험치 획득 (actor, amount, messages=gain_exp 메시지)
+EV_FLEE = "flee"          # 도망 성공 (actor)
+EV_END = "end"            # 전투 종료 (winner=PLAYER/ENEMY/None)
+
+# 기록되는 입력 종류
+INPUT_ATTACK = 1          # player_attack(skill)
+INPUT_FLEE = 2            # flee()
+INPUT_ENEMY_ATTACK = 3    # enemy_attack(skill) 를 따로 부른 경우
+INPUT_ATTACK_ONLY = 4     # player_attack(skill, enemy_turn=False) (상대 턴은 뒤이은 INPUT_ENEMY_ATTACK)
+
+# 기록/통신용 번호 (battle_log, ws_server 가 1바이트로 저장할 때 사용. 순서를 바꾸지 마세요)
+STATE_CODES = (MENU, SKILL_SELECT, FINISHED, FLED)
+EVENT_CODES = (EV_START, EV_ATTACK, EV_NO_PP, EV_FAINT, EV_EXP, EV_FLEE, EV_END)
+SIDE_CODES = (None, PLAYER, ENEMY)
+STATE_ID = {s: i for i, s in enumerate(STATE_CODES)}
+EVENT_ID = {k: i for i, k in enumerate(EVENT_CODES)}
+SIDE_ID = {s: i for i, s in enumerate(SIDE_CODES)}
+
+
+class BattleEvent:
+    """전투 중에 일어난 일 하나를 나타내는 구조화된 이벤트."""
+
+    __slots__ = ("kind", "side", "actor", "target", "skill", "damage", "amount", "messages")
+
+    def __init__(self, kind, side=None, actor=None, target=None, skill=None,
+                 damage=0, amount=0, messages=None):
+        self.kind = kind            # EV_* 상수
+        self.side = side            # 행동한 쪽 (PLAYER / ENEMY)
+        self.actor = actor          # 행동한 포켓몬
+        self.target = target        # 대상 포켓몬
+        self.skill = skill          # 사용한 Skill
+        self.damage = damage        # 가한 데미지
+        self.amount = amount        # 경험치 등 수치
+        self.messages = messages or []
+
+    @property
+    def value(self):
+        # 기록용 대표 수치 (공격이면 데미지, 그 외에는 amount)
+        return self.damage if self.kind == EV_ATTACK else self.amount
+
+    def __repr__(self):
+        return f"BattleEvent({self.kind!r}, side={self.side!r}, damage={self.damage}, amount={self.amount})"
+
+
+def exp_reward(enemy):
+    # 간단한 공식으로 경험치 지급 (예: 상대 레벨 * 10)
+    return max(1, int(enemy.level * 10))
+
+
+# -----------------------------
+# ⚔️ 전투 엔진 (상태 기계)
+# -----------------------------
+class BattleEngine:
+    # player / enemy 는 base_pokemon.Pokemon (또는 같은 속성을 가진 객체)
+    # seed: 이 전투의 난수 시드 (생략하면 전역 random 에서 하나 뽑음)
+    # battle_log: battle_log.BattleLog (주면 시드/입력/이벤트를 기록)
+    # record_events=False: events 목록을 쌓지 않음 (결과만 필요한 대량 시뮬레이션용, 승자/턴/exp_gained 로 확인)
+    # rng: 다시 쓸 random.Random (주면 새로 만들지 않고 seed 로 다시 시드만 정함, 대량 시뮬레이션용)
+    def __init__(self, player_pokemon, enemy_pokemon, seed=None, battle_log=None,
+                 record_events=True, rng=None):
+        self.player = player_pokemon
+        self.enemy = enemy_pokemon
+        self.state = MENU
+        self.turn = PLAYER
+        self.winner = None
+        self.turns = 0
+        self.seed = random.getrandbits(32) if seed is None else seed & 0xFFFFFFFF
+        if rng is None:
+            rng = random.Random(self.seed)
+        else:
+            rng.seed(self.seed)
+        self.rng = rng
+        self.record_events = record_events
+        # 이번 전투에서 얻은 경험치 (이벤트를 쌓지 않을 때도 확인할 수 있도록)
+        self.exp_gained = 0
+        self.battle_log = battle_log
+        self.log_id = battle_log.start(self) if battle_log is not None else 0
+        # 아직 화면 등에서 가져가지 않은 이벤트 목록
+        self.events = []
+        self._emit(EV_START, side=ENEMY, actor=enemy_pokemon)
+
+    @property
+    def finished(self):
+        return self.state in (FINISHED, FLED)
+
+    def drain_events(self):
+        """쌓인 이벤트를 꺼내고 목록을 비웁니다."""
+        events = self.events
+        self.events = []
+        return events
+
+    # MENU -> SKILL_SELECT
+    def open_skills(self):
+        if self.state == MENU:
+            self.state = SKILL_SELECT
+
+    # SKILL_SELECT -> MENU
+    def close_skills(self):
+        if self.state == SKILL_SELECT:
+            self.state = MENU
+
+    def flee(self):
+        # 상대 차례(기술을 고르는 중)에는 도망칠 수 없습니다.
+        if self.finished or self.turn != PLAYER:
+            return
+        self._input(INPUT_FLEE)
+        self._emit(EV_FLEE, side=PLAYER, actor=self.player)
+        self.state = FLED
+        self._end()
+
+    def player_attack(self, skill_index=0, enemy_turn=True):
+        """플레이어 턴을 처리하고, 상대가 살아 있으면 곧바로 상대 턴까지 진행합니다.
+
+        enemy_turn=False 이면 turn 을 ENEMY 로 두고 멈춥니다. 상대 기술을 따로 고른 뒤
+        (enemy_ai 등) enemy_attack(skill) 로 상대 턴을 진행하세요.
+        """
+        if self.finished or self.turn != PLAYER:
+            return
+        self._input(INPUT_ATTACK if enemy_turn else INPUT_ATTACK_ONLY, skill_index)
+        if not self._attack(PLAYER, self.player, self.enemy, skill_index):
+            # PP 부족: 턴이 넘어가지 않으므로 턴 수도 세지 않습니다.
+            return
+        self.turns += 1
+        if self.enemy.is_fainted():
+            self._emit(EV_FAINT, side=ENEMY, target=self.enemy)
+            amount = exp_reward(self.enemy)
+            self.exp_gained += amount
+            try:
+                msgs = self.player.gain_exp(amount)
+            except Exception:
+                # 안전하게 무시 (포켓몬 객체에 exp 메서드가 없을 수 있음)
+                msgs = []
+            self._emit(EV_EXP, side=PLAYER, actor=self.player,
+                       amount=amount, messages=msgs)
+            self._finish(PLAYER)
+        else:
+            self.turn = ENEMY
+            if enemy_turn:
+                self._enemy_turn()
+
+    def enemy_attack(self, skill_index=0):
+        # 상대 차례에만 (player_attack(enemy_turn=False) 다음에 한 번)
+        if self.finished or self.turn != ENEMY:
+            return
+        self._input(INPUT_ENEMY_ATTACK, skill_index)
+        self._enemy_turn(skill_index)
+
+    def _enemy_turn(self, skill_index=0):
+        # 상대 턴 (플레이어 턴에 이어서 진행될 때는 따로 입력으로 기록하지 않음)
+        self._attack(ENEMY, self.enemy, self.player, skill_index)
+        if self.player.is_fainted():
+            self._emit(EV_FAINT, side=PLAYER, target=self.player)
+            self._finish(ENEMY)
+        self.turn = PLAYER
+
+    def run_to_end(self, max_turns=1000):
+        """양쪽 모두 0번 기술만 쓴다고 보고 전투 끝까지 진행합니다 (창 없는 대량 시뮬레이션용).
+
+        반환값: 승자 (PLAYER / ENEMY, 턴 제한에 걸리면 None)
+        """
+        while not self.finished and self.turns < max_turns:
+            if self.player.skills[0].current_pp <= 0:
+                # 더 이상 공격할 수 없으면 무승부로 끝냅니다.
+                break
+            self.player_attack(0)
+        if not self.finished:
+            # 무승부/턴 제한: 기록은 여기서 닫습니다.
+            self._end()
+        return self.winner
+
+    # -----------------------------
+    # 내부 도우미
+    # -----------------------------
+    def _attack(self, side, attacker, defender, skill_index):
+        damage, ok = attacker.attack_target(skill_index, defender, self.rng)
+        skill = attacker.skills[skill_index]
+        if not ok:
+            self._emit(EV_NO_PP, side=side, actor=attacker, skill=skill)
+            return False
+        self._emit(EV_ATTACK, side=side, actor=attacker, target=defender,
+                   skill=skill, damage=damage)
+        return True
+
+    def _emit(self, kind, side=None, actor=None, target=None, skill=None,
+              damage=0, amount=0, messages=None):
+        # 이벤트를 가져갈 곳(events 목록, 기록 파일)이 없으면 BattleEvent 를 만들지도 않습니다.
+        if not self.record_events and self.battle_log is None:
+            return
+        event = BattleEvent(kind, side, actor, target, skill, damage, amount, messages)
+        if self.record_events:
+            self.events.append(event)
+        if self.battle_log is not None:
+            self.battle_log.event(self, event)
+
+    def _input(self, action, skill_index=0):
+        if self.battle_log is not None:
+            self.battle_log.input(self, action, skill_index)
+
+    def _end(self):
+        if self.battle_log is not None:
+            self.battle_log.end(self)
+
+    def _finish(self, winner):
+        self.winner = winner
+        self.state = FINISHED
+        self._emit(EV_END, side=winner)
+        self._end()
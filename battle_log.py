@@ -0,0 +1,192 @@
+# battle_log.py
+# 전투 기록(시드, 입력, 결과 이벤트)을 작은 바이너리 레코드로 파일 끝에 계속 덧붙입니다.
+#  - 전투가 진행되는 동안 턴마다 바로 파일로 내보내므로, 게임이 멈춰도 그 직전까지 남습니다.
+#  - 한 파일에 여러 전투가 들어가고, 레코드마다 전투 번호가 있어 서버처럼 여러 전투가 섞여도 됩니다.
+#    (전투 번호는 파일 안에서 겹치지 않습니다. 실행할 때마다 같은 파일에 덧붙여도 이어서 번호를 매깁니다)
+#  - replay.py 가 이 파일을 처음부터 끝까지 흘려 읽으며(메모리 일정) 전투를 다시 돌려 결과를 검증합니다.
+#
+# 파일 구조 (모두 little-endian)
+#   파일 헤더(magic, version) | 레코드 ...
+#   레코드 = 종류(u8), 전투 번호(u32), 본문 길이(u16), 본문
+#     START : 시드(u32) + 내 포켓몬 + 상대 포켓몬 (savegame 의 포켓몬 형식, 전투 시작 시점 상태)
+#     INPUT : 입력 종류(u8), 기술 번호(u8)
+#     EVENT : 이벤트 종류(u8), 쪽(u8), 수치(u32)
+#     END   : 승자(u8), 상태(u8), 턴 수(u32)
+import itertools
+import os
+import struct
+
+from battle_engine import EVENT_ID, SIDE_ID, STATE_ID
+from savegame import encode_pokemon, decode_pokemon
+
+MAGIC = b"PKBL"
+VERSION = 1
+FILE_HEADER = struct.Struct("<4sH")
+RECORD = struct.Struct("<BIH")
+
+REC_START = 1
+REC_INPUT = 2
+REC_EVENT = 3
+REC_END = 4
+
+SEED = struct.Struct("<I")
+INPUT = struct.Struct("<BB")
+EVENT = struct.Struct("<BBI")
+END = struct.Struct("<BBI")
+
+
+class BattleLogError(Exception):
+    """전투 기록 파일 형식이 맞지 않을 때 발생합니다."""
+
+
+class BattleLog:
+    """전투 기록 파일에 레코드를 덧붙이는 기록기. BattleEngine(battle_log=...) 으로 넘깁니다.
+
+    flush_every_turn=True 면 입력 하나(턴)가 끝날 때마다 파일로 내보냅니다.
+    """
+
+    def __init__(self, path, flush_every_turn=True):
+        self.path = path
+        self.flush_every_turn = flush_every_turn
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        last_id = end = 0
+        if not new:
+            # 이전 실행들이 남긴 기록 뒤에 덧붙이므로, 전투 번호는 파일에 있는 가장 큰 번호 다음부터 씁니다.
+            last_id, end = scan_log(path)
+        self._file = open(path, "ab")
+        if new:
+            self._file.write(FILE_HEADER.pack(MAGIC, VERSION))
+        elif end < self._file.tell():
+            # 이전 실행이 레코드를 쓰다가 멈췄으면 잘린 부분을 버립니다 (뒤에 붙는 레코드가 어긋나지 않도록).
+            self._file.truncate(end)
+        self._ids = itertools.count(last_id + 1)
+        self.battles = 0
+
+    def _write(self, tag, battle_id, body):
+        self._file.write(RECORD.pack(tag, battle_id, len(body)) + body)
+
+    def start(self, engine):
+        """전투 시작 기록. 이 파일 안의 전투 번호를 돌려줍니다."""
+        battle_id = next(self._ids) & 0xFFFFFFFF
+        body = bytearray(SEED.pack(engine.seed))
+        encode_pokemon(body, engine.player)
+        encode_pokemon(body, engine.enemy)
+        self._write(REC_START, battle_id, bytes(body))
+        self.battles += 1
+        return battle_id
+
+    def input(self, engine, action, skill_index=0):
+        if self.flush_every_turn:
+            # 직전 턴의 기록을 내보냅니다 (한 턴 = 입력 + 그 결과 이벤트)
+            self._file.flush()
+        self._write(REC_INPUT, engine.log_id, INPUT.pack(action, skill_index))
+
+    def event(self, engine, event):
+        self._write(REC_EVENT, engine.log_id,
+                    EVENT.pack(EVENT_ID[event.kind], SIDE_ID.get(event.side, 0), min(0xFFFFFFFF, int(event.value))))
+
+    def end(self, engine):
+        self._write(REC_END, engine.log_id,
+                    END.pack(SIDE_ID.get(engine.winner, 0), STATE_ID[engine.state], engine.turns))
+        self._file.flush()
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+def scan_log(path):
+    """기존 기록 파일의 (가장 큰 전투 번호, 마지막 온전한 레코드가 끝나는 위치).
+
+    레코드 머리만 읽고 본문은 건너뜁니다. 기록 파일이 아니면 BattleLogError.
+    """
+    last_id = 0
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(FILE_HEADER.size)
+        if len(head) < FILE_HEADER.size or FILE_HEADER.unpack(head) != (MAGIC, VERSION):
+            raise BattleLogError(f"{path} 은(는) 이 버전의 전투 기록 파일이 아닙니다.")
+        end = f.tell()
+        while True:
+            head = f.read(RECORD.size)
+            if len(head) < RECORD.size:
+                break
+            tag, battle_id, n = RECORD.unpack(head)
+            if end + RECORD.size + n > size:
+                break
+            if tag == REC_START and battle_id > last_id:
+                last_id = battle_id
+            end = f.seek(n, os.SEEK_CUR)
+    return last_id, end
+
+
+def read_records(f):
+    """열린 파일에서 (종류, 전투 번호, 본문) 을 하나씩 읽습니다. 파일 끝이 잘려 있으면 거기서 멈춥니다."""
+    head = f.read(FILE_HEADER.size)
+    if len(head) < FILE_HEADER.size:
+        return
+    magic, version = FILE_HEADER.unpack(head)
+    if magic != MAGIC:
+        raise BattleLogError("전투 기록 파일이 아닙니다.")
+    if version != VERSION:
+        raise BattleLogError(f"지원하지 않는 전투 기록 버전입니다: {version}")
+    size = RECORD.size
+    while True:
+        head = f.read(size)
+        if len(head) < size:
+            return
+        tag, battle_id, n = RECORD.unpack(head)
+        body = f.read(n)
+        if len(body) < n:
+            return
+        yield tag, battle_id, body
+
+
+class LoggedBattle:
+    """기록에서 읽은 전투 하나 (replay 용)."""
+
+    __slots__ = ("battle_id", "seed", "player", "enemy", "steps", "end")
+
+    def __init__(self, battle_id, seed, player, enemy):
+        self.battle_id = battle_id
+        self.seed = seed
+        self.player = player        # 전투 시작 시점의 Pokemon
+        self.enemy = enemy
+        self.steps = []             # ("input", 종류, 기술) / ("event", 종류, 쪽, 수치) 순서대로
+        self.end = None             # (승자, 상태, 턴 수), 끝나지 않은 전투면 None
+
+
+def iter_battles(f):
+    """기록 파일을 흘려 읽으며 전투를 하나씩 돌려줍니다.
+
+    메모리에는 아직 끝나지 않은 전투만 들고 있습니다 (보통 하나, 서버 기록이면 동시 전투 수만큼).
+    끝나지 않고 파일이 끝난 전투(게임이 꺼진 경우 등)는 마지막에 end=None 으로 돌려줍니다.
+    """
+    open_battles = {}
+    for tag, battle_id, body in read_records(f):
+        if tag == REC_START:
+            stale = open_battles.pop(battle_id, None)
+            if stale is not None:
+                # 같은 번호로 새 전투가 시작됨 = 이전 실행이 전투 도중에 끝남
+                yield stale
+            (seed,) = SEED.unpack_from(body, 0)
+            player, off = decode_pokemon(body, SEED.size)
+            enemy, off = decode_pokemon(body, off)
+            open_battles[battle_id] = LoggedBattle(battle_id, seed, player, enemy)
+            continue
+        battle = open_battles.get(battle_id)
+        if battle is None:
+            continue
+        if tag == REC_INPUT:
+            battle.steps.append(("input",) + INPUT.unpack(body))
+        elif tag == REC_EVENT:
+            battle.steps.append(("event",) + EVENT.unpack(body))
+        elif tag == REC_END:
+            battle.end = END.unpack(body)
+            del open_battles[battle_id]
+            yield battle
+    for battle in open_battles.values():
+        yield battle
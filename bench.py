@@ -0,0 +1,297 @@
+# bench.py
+# 성능 벤치마크 모음입니다. 창 없이(SDL dummy 드라이버) 실행되며 결과를 JSON 으로 저장합니다.
+#  - 씬별 프레임 시간 백분위수 (MapScene / BattleScene / GameOverScene 의 update + draw)
+#  - 타일 월드를 계속 걸어갈 때의 프레임 시간과 올라와 있는 청크 수
+#  - 전투 진입 지연 (BattleScene.__init__: 이미지 캐시가 빈 상태 / 찬 상태, 빈 상태에서 스프라이트 도착까지)
+#  - 전투 처리량 (Pokemon.attack_target, BattleEngine, gain_exp, NumPy 일괄 시뮬레이터)
+#
+# 실행 예:
+#   python bench.py --out bench.json                       # 측정하고 저장
+#   python bench.py --compare bench.json --threshold 0.2   # 기준 대비 20% 넘게 나빠지면 실패(종료 코드 1)
+import os
+
+# pygame 을 불러오기 전에 창/소리가 없는 드라이버를 지정합니다.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import json
+import platform
+import random
+import sys
+import time
+
+import pygame
+
+from base_pokemon import Pokemon, STARTER, WILD_CANDIDATES
+from battle_engine import BattleEngine
+from profiler import percentile
+
+LOWER = "lower"    # 값이 작을수록 좋음 (시간)
+HIGHER = "higher"  # 값이 클수록 좋음 (처리량)
+
+
+def make_pokemon(stats):
+    name, lvl, hp, atk, df, sp = stats
+    return Pokemon(name, level=lvl, max_hp=hp, attack=atk, defense=df, speed=sp)
+
+
+class Bench:
+    def __init__(self, frames=600, quick=False):
+        self.frames = frames if not quick else max(60, frames // 5)
+        self.quick = quick
+        self.metrics = {}
+        self.game = None
+
+    # gate=False 인 지표(최악 프레임 등 잡음이 큰 값)는 기록만 하고 비교 실패 조건에는 쓰지 않습니다.
+    def record(self, name, value, unit, better, gate=True):
+        self.metrics[name] = {"value": value, "unit": unit, "better": better, "gate": gate}
+
+    def record_times(self, prefix, samples_ms):
+        # 프레임 시간 분포를 p50/p95/p99/최악 으로 기록합니다.
+        ordered = sorted(samples_ms)
+        for p in (50, 95, 99):
+            self.record(f"{prefix}.p{p}_ms", percentile(ordered, p), "ms", LOWER)
+        self.record(f"{prefix}.max_ms", max(samples_ms) if samples_ms else 0.0, "ms", LOWER, gate=False)
+
+    # -----------------------------
+    # 씬 프레임 시간
+    # -----------------------------
+    def setup_game(self):
+        from game import Game
+        from input_source import ScriptedInput
+        random.seed(0)
+        self.game = Game()
+        # 오른쪽 아래로 걸었다가 돌아오는 입력을 반복 (플레이어가 움직이는 프레임 측정)
+        self.game.input = ScriptedInput([(["right"], [], 60), (["down"], [], 30),
+                                         (["left"], [], 60), (["up"], [], 30)], loop=True)
+
+    def time_frames(self, scene, frames):
+        from asset_loader import shared_loader
+        game, screen = self.game, self.game.screen
+        loader = shared_loader()
+        samples = []
+        clock = time.perf_counter
+        for _ in range(frames):
+            t0 = clock()
+            loader.pump()
+            events = game.input.poll()
+            scene.handle_events(events)
+            scene.update(1 / 60)
+            scene.draw(screen)
+            samples.append((clock() - t0) * 1000.0)
+        return samples
+
+    def bench_map(self):
+        from scenes import MapScene
+        for dirty in (False, True):
+            self.game.dirty_rendering = dirty
+            scene = MapScene(self.game)
+            scene.battle_cooldown = 1e9  # 측정 중 전투로 넘어가지 않도록
+            scene.invalidate()
+            samples = self.time_frames(scene, self.frames)
+            self.record_times("map.dirty" if dirty else "map.frame", samples)
+        self.game.dirty_rendering = False
+
+    def bench_world_walk(self):
+        # 타일 월드를 대각선으로 계속 걸어가며 청크 스트리밍이 프레임 시간에 주는 영향을 잽니다.
+        from scenes import MapScene
+        from input_source import ScriptedInput
+        saved_input = self.game.input
+        self.game.input = ScriptedInput([(["right", "down"], [], self.frames)])
+        scene = MapScene(self.game)
+        scene.battle_cooldown = 1e9
+        scene.invalidate()
+        samples = self.time_frames(scene, self.frames)
+        self.game.input = saved_input
+        self.record_times("world.walk", samples)
+        # 올라와 있던 청크 수의 최댓값 (월드 크기와 무관하게 화면 크기로만 정해져야 함)
+        self.record("world.chunks_max", scene.world.max_loaded, "chunks", LOWER, gate=False)
+
+    def bench_battle_scene(self):
+        from battle import BattleScene
+        player, enemy = make_pokemon(STARTER), make_pokemon(WILD_CANDIDATES[0])
+        enemy.max_hp = enemy.current_hp = 10 ** 6   # 측정 중 전투가 끝나지 않도록
+        scene = BattleScene(self.game, player, enemy)
+        samples = self.time_frames(scene, self.frames)
+        self.record_times("battle.frame", samples)
+
+    def bench_gameover(self):
+        from scenes import GameOverScene
+        scene = GameOverScene(self.game)
+        samples = self.time_frames(scene, self.frames)
+        self.record_times("gameover.frame", samples)
+
+    # -----------------------------
+    # 전투 진입 지연
+    # -----------------------------
+    def bench_transition(self):
+        from battle import BattleScene
+        from sprite_cache import shared_cache
+        from asset_loader import shared_loader
+        import sprite_atlas
+        cache = shared_cache()
+        loader = shared_loader()
+        rounds = 10 if self.quick else 40
+        cold, ready, warm = [], [], []
+        # 아틀라스가 있으면 캐시를 비워도 시트에서 바로 나오므로, 측정하는 동안은 빈 아틀라스로 바꿔
+        # 스프라이트 파일 읽기/스케일 경로(진짜 처음 만나는 경우)를 잽니다.
+        saved_atlas = sprite_atlas._shared
+        sprite_atlas._shared = sprite_atlas.SpriteAtlas(os.devnull)
+        try:
+            for i in range(rounds):
+                wild = WILD_CANDIDATES[i % len(WILD_CANDIDATES)]
+                cache.clear()
+                t0 = time.perf_counter()
+                BattleScene(self.game, make_pokemon(STARTER), make_pokemon(wild))
+                cold.append((time.perf_counter() - t0) * 1000.0)
+                # 캐시가 빈 상태에서 스프라이트가 작업 스레드로부터 도착하기까지의 시간
+                loader.wait()
+                ready.append((time.perf_counter() - t0) * 1000.0)
+                t0 = time.perf_counter()
+                BattleScene(self.game, make_pokemon(STARTER), make_pokemon(wild))
+                warm.append((time.perf_counter() - t0) * 1000.0)
+        finally:
+            sprite_atlas._shared = saved_atlas
+            cache.clear()
+        self.record("transition.cold_p50_ms", percentile(sorted(cold), 50), "ms", LOWER)
+        self.record("transition.cold_ready_p50_ms", percentile(sorted(ready), 50), "ms", LOWER)
+        self.record("transition.warm_p50_ms", percentile(sorted(warm), 50), "ms", LOWER)
+        self.record("transition.warm_max_ms", max(warm), "ms", LOWER, gate=False)
+
+    # -----------------------------
+    # 전투 처리량
+    # -----------------------------
+    def throughput(self, name, fn, unit_count, min_seconds):
+        # fn() 한 번이 unit_count 개를 처리한다고 보고 초당 처리량을 기록합니다.
+        done = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            done += unit_count
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+        self.record(name, done / elapsed, "per_s", HIGHER)
+
+    def bench_resolution(self):
+        random.seed(0)
+        secs = 0.2 if self.quick else 1.0
+        wild = WILD_CANDIDATES[0]
+
+        def attack_loop():
+            p, e = make_pokemon(STARTER), make_pokemon(wild)
+            while p.skills[0].current_pp > 0:
+                p.attack_target(0, e)
+                if e.is_fainted():
+                    break
+                e.attack_target(0, p)
+                if p.is_fainted():
+                    break
+
+        def engine_battle():
+            BattleEngine(make_pokemon(STARTER), make_pokemon(wild)).run_to_end()
+
+        # balance.py 처럼 결과만 필요한 대량 실행 (이벤트 없음, 난수 생성기 재사용)
+        bulk_rng = random.Random()
+
+        def engine_battle_bulk():
+            BattleEngine(make_pokemon(STARTER), make_pokemon(wild),
+                         record_events=False, rng=bulk_rng).run_to_end()
+
+        def exp_gain():
+            make_pokemon(STARTER).gain_exp(100_000)
+
+        self.throughput("resolve.attack_target_battles", attack_loop, 1, secs)
+        self.throughput("resolve.engine_battles", engine_battle, 1, secs)
+        self.throughput("resolve.engine_battles_bulk", engine_battle_bulk, 1, secs)
+        self.throughput("resolve.gain_exp_100k", exp_gain, 1, secs)
+
+        try:
+            import numpy as np
+            from batch_sim import simulate_batch, side_from_pokemon
+        except ImportError:
+            # NumPy 가 없으면 일괄 시뮬레이터 측정은 건너뜁니다.
+            return
+        rng = np.random.default_rng(0)
+        a = side_from_pokemon(make_pokemon(STARTER))
+        d = side_from_pokemon(make_pokemon(wild))
+        n = 100_000
+        self.throughput("resolve.batch_sim_battles", lambda: simulate_batch(a, d, n=n, rng=rng), n, secs)
+
+    def run(self):
+        self.setup_game()
+        self.bench_map()
+        self.bench_world_walk()
+        self.bench_battle_scene()
+        self.bench_gameover()
+        self.bench_transition()
+        self.bench_resolution()
+        return {
+            "meta": {
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "platform": platform.platform(),
+                "frames": self.frames,
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "metrics": self.metrics,
+        }
+
+
+def compare(current, baseline, threshold):
+    """기준 결과와 비교해 threshold(비율) 이상 나빠진 지표 목록을 돌려줍니다."""
+    regressions = []
+    rows = []
+    for name, base in sorted(baseline.get("metrics", {}).items()):
+        cur = current["metrics"].get(name)
+        if cur is None:
+            continue
+        b, c = base["value"], cur["value"]
+        if b <= 0:
+            continue
+        # 나빠진 비율 (양수면 나빠짐)
+        if base["better"] == LOWER:
+            change = (c - b) / b
+        else:
+            change = (b - c) / b
+        rows.append((name, b, c, change))
+        if change > threshold and base.get("gate", True):
+            regressions.append((name, b, c, change))
+    return rows, regressions
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="씬/전투 성능 벤치마크")
+    parser.add_argument("--out", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.2, help="허용하는 악화 비율 (기본 0.2 = 20%%)")
+    parser.add_argument("--frames", type=int, default=600, help="씬마다 측정할 프레임 수")
+    parser.add_argument("--quick", action="store_true", help="짧게 측정 (CI 용)")
+    args = parser.parse_args(argv)
+
+    result = Bench(frames=args.frames, quick=args.quick).run()
+    for name, m in sorted(result["metrics"].items()):
+        print(f"{name:40s} {m['value']:>14,.3f} {m['unit']}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows, regressions = compare(result, baseline, args.threshold)
+        print()
+        failed = {r[0] for r in regressions}
+        for name, b, c, change in rows:
+            mark = "  <-- 악화" if name in failed else ""
+            print(f"{name:40s} {b:>12,.3f} -> {c:>12,.3f} (악화율 {change:+.1%}){mark}")
+        if regressions:
+            print(f"\n{len(regressions)}개 지표가 {args.threshold:.0%} 넘게 나빠졌습니다.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
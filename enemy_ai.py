@@ -0,0 +1,275 @@
+# enemy_ai.py
+# 야생/트레이너 포켓몬의 기술 선택 AI (pygame 없이 동작)
+#  - 기대값 탐색(expectimax): 상대(AI)는 기대값이 가장 큰 기술을, 플레이어는 AI 에게 가장 불리한 기술을 고르고,
+#    데미지 난수(calc_damage 의 -2~+2 보정)는 나올 수 있는 값마다 확률을 곱해 평균냅니다.
+#  - 승패는 빨리 날수록 큰 값을 줍니다 (깊이 볼수록 "언젠가 이김" 만 보고 약한 기술을 고르지 않도록).
+#    루트에서 값이 같은 기술끼리는 기대 데미지가 큰 쪽을 고릅니다.
+#  - 같은 상태(양쪽 HP, 남은 PP, 차례, 남은 깊이)를 여러 경로로 만나면 전치표(transposition table)의 값을 다시 씁니다.
+#  - 반복 심화: 1수 깊이부터 한 수씩 깊게 탐색하다가 제한 시간이 되면 멈추고,
+#    마지막으로 끝까지 탐색한 깊이의 최선 수를 씁니다 (한 번도 못 끝냈으면 기대 데미지가 가장 큰 기술).
+#  - 탐색은 작업 스레드에서 하므로 렌더링 루프가 멈추지 않습니다. 씬은 think() 가 돌려준 AiJob 을
+#    프레임마다 확인하다가, 끝났거나 제한 시간이 지나면 job.best 를 씁니다.
+#  - 전투 시작 시점의 스탯/기술을 복사해 탐색하므로, 작업 스레드가 실제 포켓몬 객체를 건드리지 않습니다.
+import queue
+import threading
+import time
+
+# 적 레벨별 탐색 한도: (이 레벨 이상, 최대 깊이(수), 제한 시간(초)). 강한 상대일수록 깊이 생각합니다.
+AI_LEVELS = (
+    (1, 2, 0.05),
+    (10, 4, 0.10),
+    (20, 8, 0.20),
+    (35, 16, 0.35),
+)
+
+WIN = 2.0               # AI 가 이긴 상태의 값 (평가값은 -1 ~ 1)
+LOSS = -2.0
+# 승패가 빨리 날수록 더 크게 (남은 깊이 1 마다): 빨리 이기는 수 > 늦게 이기는 수, 늦게 지는 수 > 빨리 지는 수
+MATE_STEP = 0.1
+TIE_EPS = 1e-9          # 루트에서 값이 이만큼 안쪽이면 같은 값으로 보고 기대 데미지로 고름
+CHECK_EVERY = 512       # 이 노드 수마다 시간/취소 확인
+TT_MAX = 200000         # 전치표 최대 항목 수 (넘으면 비움)
+
+# 노드 종류 (누구 차례인지)
+_AI = 0
+_FOE = 1
+
+
+def search_limits(level):
+    """적 레벨에 맞는 (최대 깊이, 제한 시간)."""
+    depth, budget = AI_LEVELS[0][1:]
+    for min_level, d, b in AI_LEVELS:
+        if level >= min_level:
+            depth, budget = d, b
+    return depth, budget
+
+
+class _FixedRoll:
+    """randint 가 항상 정해진 값을 돌려주는 난수 대용 (calc_damage 의 결과를 하나씩 뽑아 보기 위해)."""
+
+    def __init__(self, value=None):
+        self.value = value
+        self.range = None
+
+    def randint(self, a, b):
+        self.range = (a, b)
+        return a if self.value is None else max(a, min(b, self.value))
+
+
+def damage_outcomes(attacker, skill, defender):
+    """calc_damage 로 나올 수 있는 (데미지, 확률) 목록."""
+    probe = _FixedRoll()
+    attacker.calc_damage(skill, defender, probe)
+    if probe.range is None:
+        # 난수를 쓰지 않는 공식
+        return [(attacker.calc_damage(skill, defender, probe), 1.0)]
+    a, b = probe.range
+    counts = {}
+    for v in range(a, b + 1):
+        damage = attacker.calc_damage(skill, defender, _FixedRoll(v))
+        counts[damage] = counts.get(damage, 0) + 1
+    n = float(b - a + 1)
+    return [(damage, c / n) for damage, c in sorted(counts.items())]
+
+
+class BattleModel:
+    """탐색용 전투 사본: 데미지 분포표와 처음 상태만 가진 불변 데이터."""
+
+    def __init__(self, ai, foe):
+        self.ai_max_hp = max(1, ai.max_hp)
+        self.foe_max_hp = max(1, foe.max_hp)
+        # [기술 번호] -> [(데미지, 확률), ...]
+        self.ai_damage = [damage_outcomes(ai, s, foe) for s in ai.skills]
+        self.foe_damage = [damage_outcomes(foe, s, ai) for s in foe.skills]
+        self.root = (foe.current_hp, ai.current_hp,
+                     tuple(s.current_pp for s in foe.skills), tuple(s.current_pp for s in ai.skills))
+
+    def usable(self, pps):
+        return [i for i, pp in enumerate(pps) if pp > 0]
+
+    def expected_damage(self, move):
+        return sum(d * p for d, p in self.ai_damage[move])
+
+    def greedy(self):
+        """기대 데미지가 가장 큰 (PP 가 남은) 기술 번호. 탐색을 한 번도 못 끝냈을 때 씁니다."""
+        moves = self.usable(self.root[3]) or [0]
+        return max(moves, key=lambda i: (self.expected_damage(i), -i))
+
+    def evaluate(self, foe_hp, ai_hp):
+        return ai_hp / self.ai_max_hp - foe_hp / self.foe_max_hp
+
+
+class _Timeout(Exception):
+    pass
+
+
+class AiJob:
+    """작업 스레드에서 진행 중인 탐색 하나. best 는 언제 읽어도 지금까지의 최선 수입니다."""
+
+    def __init__(self, model, max_depth, budget):
+        self.model = model
+        self.max_depth = max_depth
+        self.deadline = time.perf_counter() + budget
+        self.best = model.greedy()
+        self.value = None
+        self.depth = 0              # 끝까지 탐색한 깊이
+        self.nodes = 0
+        self.done = False
+        self.cancelled = False
+
+    def expired(self):
+        return time.perf_counter() >= self.deadline
+
+    @property
+    def finished(self):
+        """결과를 써도 되는지 (탐색이 끝났거나 제한 시간이 지남)."""
+        return self.done or self.expired()
+
+    def cancel(self):
+        self.cancelled = True
+
+    # -----------------------------
+    # 🔍 탐색 (작업 스레드)
+    # -----------------------------
+    def run(self):
+        model = self.model
+        if len(model.usable(model.root[3])) <= 1:
+            # 고를 게 없으면 탐색하지 않음
+            self.done = True
+            return
+        self._table = {}
+        try:
+            for depth in range(1, self.max_depth + 1):
+                best, value = self._root(depth)
+                self.best, self.value, self.depth = best, value, depth
+        except _Timeout:
+            pass
+        finally:
+            self._table = None
+            self.done = True
+
+    def _tick(self):
+        self.nodes += 1
+        if self.nodes % CHECK_EVERY == 0 and (self.cancelled or self.expired()):
+            raise _Timeout()
+
+    def _root(self, depth):
+        model = self.model
+        foe_hp, ai_hp, foe_pp, ai_pp = model.root
+        best, best_value = None, None
+        for move in model.usable(ai_pp):
+            value = self._ai_move(move, foe_hp, ai_hp, foe_pp, ai_pp, depth)
+            if (best_value is None or value > best_value + TIE_EPS
+                    or (value >= best_value - TIE_EPS
+                        and model.expected_damage(move) > model.expected_damage(best))):
+                best, best_value = move, value
+        return best, best_value
+
+    def _ai_move(self, move, foe_hp, ai_hp, foe_pp, ai_pp, depth):
+        # AI 가 move 를 썼을 때의 기대값 (데미지 난수 평균)
+        ai_pp = ai_pp[:move] + (ai_pp[move] - 1,) + ai_pp[move + 1:]
+        total = 0.0
+        for damage, p in self.model.ai_damage[move]:
+            hp = foe_hp - damage
+            if hp <= 0:
+                total += p * (WIN + depth * MATE_STEP)
+            else:
+                total += p * self._node(_FOE, hp, ai_hp, foe_pp, ai_pp, depth - 1)
+        return total
+
+    def _foe_move(self, move, foe_hp, ai_hp, foe_pp, ai_pp, depth):
+        foe_pp = foe_pp[:move] + (foe_pp[move] - 1,) + foe_pp[move + 1:]
+        total = 0.0
+        for damage, p in self.model.foe_damage[move]:
+            hp = ai_hp - damage
+            if hp <= 0:
+                total += p * (LOSS - depth * MATE_STEP)
+            else:
+                total += p * self._node(_AI, foe_hp, hp, foe_pp, ai_pp, depth - 1)
+        return total
+
+    def _node(self, turn, foe_hp, ai_hp, foe_pp, ai_pp, depth):
+        model = self.model
+        if depth <= 0:
+            return model.evaluate(foe_hp, ai_hp)
+        # 승패 값이 남은 깊이에 따라 다르므로 깊이까지 같은 상태만 다시 씁니다.
+        key = (turn, foe_hp, ai_hp, foe_pp, ai_pp, depth)
+        value = self._table.get(key)
+        if value is not None:
+            return value
+        self._tick()
+        if turn == _AI:
+            moves = model.usable(ai_pp)
+            if moves:
+                value = max(self._ai_move(m, foe_hp, ai_hp, foe_pp, ai_pp, depth) for m in moves)
+            else:
+                # PP 가 없으면 아무 일도 일어나지 않고 차례만 넘어갑니다.
+                value = self._node(_FOE, foe_hp, ai_hp, foe_pp, ai_pp, depth - 1)
+        else:
+            moves = model.usable(foe_pp)
+            if moves:
+                value = min(self._foe_move(m, foe_hp, ai_hp, foe_pp, ai_pp, depth) for m in moves)
+            else:
+                # 플레이어가 더 공격할 수 없으면 지금 상태로 평가
+                value = model.evaluate(foe_hp, ai_hp)
+        if len(self._table) >= TT_MAX:
+            self._table.clear()
+        self._table[key] = value
+        return value
+
+
+# -----------------------------
+# 🧵 작업 스레드
+# -----------------------------
+class EnemyAI:
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._thread = None
+        self.searches = 0
+
+    def _ensure_thread(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker, name="enemy-ai", daemon=True)
+            self._thread.start()
+
+    def think(self, ai, foe, max_depth=None, budget=None):
+        """ai 포켓몬이 foe 를 상대로 쓸 기술을 작업 스레드에서 고르기 시작하고 AiJob 을 돌려줍니다.
+
+        max_depth / budget 을 생략하면 ai 의 레벨에 맞는 한도(search_limits)를 씁니다.
+        """
+        depth, seconds = search_limits(ai.level)
+        job = AiJob(BattleModel(ai, foe),
+                    depth if max_depth is None else max_depth,
+                    seconds if budget is None else budget)
+        self._ensure_thread()
+        self._jobs.put(job)
+        return job
+
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if not job.cancelled and not job.expired():
+                job.run()
+            job.done = True
+            self.searches += 1
+
+
+# 프로세스 전체에서 함께 쓰는 AI 작업 스레드
+_shared = None
+
+
+def shared_ai():
+    global _shared
+    if _shared is None:
+        _shared = EnemyAI()
+    return _shared
+
+
+def choose_skill(ai, foe, max_depth=None, budget=None):
+    """작업 스레드 없이 바로 탐색해 기술 번호를 돌려줍니다 (창 없는 시뮬레이션/측정용)."""
+    depth, seconds = search_limits(ai.level)
+    job = AiJob(BattleModel(ai, foe),
+                depth if max_depth is None else max_depth,
+                seconds if budget is None else budget)
+    job.run()
+    return job.best
@@ -3,9 +3,11 @@ import pygame
 
 # 플레이어 캐릭터를 나타내는 클래스입니다.
 # pygame의 Sprite(스프라이트) 클래스를 상속받아 화면에 표시 가능한 객체로 만듭니다.
+# 다시 그릴 영역은 MapScene 이 이전/현재 rect 를 비교해서 정합니다.
 class Player(pygame.sprite.Sprite):
     # 생성자: 플레이어의 초기 위치(x, y)와 이동 속도(speed)를 설정합니다.
-    def __init__(self, x, y, speed=200):
+    # bounds(pygame.Rect) 를 주면 그 영역(월드) 밖으로 나가지 못합니다.
+    def __init__(self, x, y, speed=200, bounds=None):
         # 부모 클래스(Sprite)의 생성자를 먼저 호출합니다.
         super().__init__()
 
@@ -21,9 +23,20 @@ class Player(pygame.sprite.Sprite):
 
         # 플레이어 이동 속도를 저장합니다. 초당 200픽셀 정도로 설정.
         self.speed = speed
+        self.bounds = bounds
 
-    # update() 메서드: 매 프레임마다 실행되어, 키 입력에 따라 위치를 변경합니다.
+        # 실제 위치는 소수점까지 보관합니다. (rect 는 정수라 작은 이동이 잘려 나가기 때문)
+        # prev_pos 는 직전 틱의 위치로, 렌더링 보간(interpolate)에 사용됩니다.
+        self.pos = [float(x), float(y)]
+        self.prev_pos = [float(x), float(y)]
+        # 마지막으로 rect 에 써 넣은 좌표 (외부에서 rect 를 옮겼는지 알아내는 데 사용)
+        self._rect_pos = self.rect.topleft
+
+    # update() 메서드: 고정된 틱마다 실행되어, 키 입력에 따라 위치를 변경합니다.
     def update(self, dt, keys):
+        self._sync_external_move()
+        self.prev_pos = list(self.pos)
+
         # 이동할 방향(dx, dy)을 0으로 초기화합니다.
         dx = dy = 0
 
@@ -43,6 +56,100 @@ class Player(pygame.sprite.Sprite):
         if keys[pygame.K_DOWN]:
             dy += self.speed * dt
 
-        # rect의 x, y 좌표를 갱신하여 실제로 플레이어를 이동시킵니다.
-        self.rect.x += dx
-        self.rect.y += dy
+        # 위치를 갱신하고 rect 에 반영하여 실제로 플레이어를 이동시킵니다.
+        self.pos[0] += dx
+        self.pos[1] += dy
+        # 월드 가장자리에서 멈춥니다.
+        if self.bounds is not None:
+            b = self.bounds
+            self.pos[0] = min(max(self.pos[0], b.left), b.right - self.rect.width)
+            self.pos[1] = min(max(self.pos[1], b.top), b.bottom - self.rect.height)
+        self._move_rect(self.pos[0], self.pos[1])
+
+    # 렌더링 직전에 호출: 직전 틱과 현재 틱 위치 사이를 alpha(0~1) 비율로 보간한 곳에 그립니다.
+    # 다음 update() 에서 rect 는 다시 실제 위치로 돌아갑니다.
+    def interpolate(self, alpha):
+        self._sync_external_move()
+        px, py = self.prev_pos
+        x, y = self.pos
+        self._move_rect(px + (x - px) * alpha, py + (y - py) * alpha)
+
+    # 외부에서 rect 를 직접 옮긴 경우(순간이동 등)에는 그 위치를 따릅니다.
+    def _sync_external_move(self):
+        if self.rect.topleft != self._rect_pos:
+            self.pos = [float(self.rect.x), float(self.rect.y)]
+            self.prev_pos = list(self.pos)
+            self._rect_pos = self.rect.topleft
+
+    def _move_rect(self, x, y):
+        self.rect.topleft = (int(x), int(y))
+        self._rect_pos = self.rect.topleft
+
+
+# 맵 위에 떨어져 있는 회복 아이템 하나를 나타냅니다.
+# 딕셔너리를 매번 새로 만들지 않고, ItemPool 이 미리 만들어 둔 객체를 재활용합니다.
+class MapItem:
+    __slots__ = ("rect", "heal", "active")
+
+    def __init__(self, size=24):
+        self.rect = pygame.Rect(0, 0, size, size)  # 위치/크기 (재활용 시 위치만 바꿈)
+        self.heal = 0                              # 회복량
+        self.active = False                        # 맵에 놓여 있는지 여부
+
+
+# 최대 개수가 정해진 아이템 풀입니다.
+# 가득 찬 상태에서 새 아이템이 생기면 가장 오래된 아이템을 치우고 그 객체를 다시 씁니다.
+# 그래서 오래 플레이해도 아이템 수(=매 프레임 비용)가 capacity 를 넘지 않습니다.
+class ItemPool:
+    def __init__(self, capacity=16, size=24):
+        self.capacity = capacity
+        self.free = [MapItem(size) for _ in range(capacity)]
+        self.active = []   # 맵에 놓인 아이템 (오래된 순)
+
+    # (x, y) 에 heal 회복량 아이템을 놓습니다.
+    # 반환값: (아이템, 가득 차서 치운 아이템의 이전 위치 Rect 또는 None)
+    def spawn(self, x, y, heal):
+        evicted_rect = None
+        if self.free:
+            item = self.free.pop()
+        else:
+            item = self.active.pop(0)
+            evicted_rect = item.rect.copy()
+        item.rect.topleft = (x, y)
+        item.heal = heal
+        item.active = True
+        self.active.append(item)
+        return item, evicted_rect
+
+    def release(self, item):
+        if not item.active:
+            return
+        item.active = False
+        try:
+            self.active.remove(item)
+        except ValueError:
+            pass
+        self.free.append(item)
+
+    def clear(self):
+        for item in self.active:
+            item.active = False
+            self.free.append(item)
+        # 리스트 객체는 그대로 두고 비웁니다 (MapScene.items 가 같은 리스트를 가리킴).
+        self.active.clear()
+
+    def __len__(self):
+        return len(self.active)
+
+    def __iter__(self):
+        return iter(self.active)
+
+
+# 야생 포켓몬이 나오는 조우 구역 (예: 풀숲).
+# 타일 월드에서는 구역 이름마다 하나씩 있고 rect 는 None 입니다 (영역은 타일 데이터가 정함).
+class EncounterZone:
+    __slots__ = ("rect", "name")
+
+    def __init__(self, rect, name="grass"):
+        self.rect = rect    # 구역 영역 (pygame.Rect)
+        self.name = name    # 구역 이름
@@ -0,0 +1,172 @@
+# font_manager.py
+# 글꼴을 한 곳에서 관리합니다.
+#  - 글꼴 이름 -> 파일 경로 찾기는 한 번만 하고, 결과를 디스크(.font_cache.json)에 남겨
+#    다음 실행부터는 시스템 글꼴 목록 조회(fc-list 등, 수백 ms)를 하지 않습니다.
+#    못 찾은 이름도 남기되, 시스템 글꼴 폴더가 바뀌면(글꼴 설치/삭제) 다시 찾습니다.
+#  - pygame.font.Font 객체는 (이름, 크기) 별로 하나만 만들어 모든 씬이 함께 씁니다.
+#    (Game.restart 로 씬을 새로 만들어도 다시 만들지 않음)
+#  - assets/fonts/ 에 글꼴 파일을 넣어 두면 시스템 글꼴보다 먼저 씁니다 (번들 글꼴).
+#    아무것도 없으면 pygame 기본 글꼴을 씁니다.
+import json
+import os
+
+import pygame
+
+# 게임 UI 에 쓰는 기본 글꼴 이름 (한글 표시용)
+UI_FONT = "malgungothic"
+
+FONT_DIR = os.path.join("assets", "fonts")
+FONT_EXTS = ("ttf", "otf", "ttc")
+# 이름에 맞는 파일이 없을 때 쓰는 번들 글꼴
+BUNDLED_FALLBACK = os.path.join(FONT_DIR, "default.ttf")
+CACHE_PATH = ".font_cache.json"
+CACHE_VERSION = 2
+
+
+def system_font_dirs():
+    """운영체제별 시스템/사용자 글꼴 폴더 (있는 것만)."""
+    home = os.path.expanduser("~")
+    dirs = [
+        # Windows
+        os.path.join(os.environ.get("WINDIR", r"C:\Windows"), "Fonts"),
+        os.path.join(os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts"),
+        # macOS
+        "/Library/Fonts", "/System/Library/Fonts", os.path.join(home, "Library", "Fonts"),
+        # Linux 등 (fontconfig)
+        "/usr/share/fonts", "/usr/local/share/fonts",
+        os.path.join(home, ".fonts"), os.path.join(home, ".local", "share", "fonts"),
+    ]
+    return [d for d in dirs if os.path.isdir(d)]
+
+
+def font_dirs_stamp():
+    """글꼴 폴더와 그 바로 아래 폴더들의 수정 시각. 글꼴을 설치/삭제하면 바뀝니다."""
+    stamp = []
+    for d in system_font_dirs():
+        try:
+            stamp.append([d, int(os.stat(d).st_mtime)])
+            for entry in os.scandir(d):
+                if entry.is_dir():
+                    stamp.append([entry.path, int(entry.stat().st_mtime)])
+        except OSError:
+            continue
+    return stamp
+
+
+class FontManager:
+    def __init__(self, cache_path=CACHE_PATH, font_dir=FONT_DIR):
+        self.cache_path = cache_path
+        self.font_dir = font_dir
+        self._paths = None      # 이름 -> 파일 경로 (못 찾았으면 None)
+        self._stamp = None      # 지금 글꼴 폴더 상태 (font_dirs_stamp)
+        self._fonts = {}        # (이름, 크기) -> Font
+        self.system_lookups = 0
+
+    # -----------------------------
+    # 이름 -> 파일 경로
+    # -----------------------------
+    def _load_cache(self):
+        self._paths = {}
+        self._stamp = font_dirs_stamp()
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        if data.get("version") == CACHE_VERSION:
+            found = data.get("paths") or {}
+            # 못 찾은 이름은 글꼴 폴더가 그대로일 때만 믿습니다.
+            if data.get("stamp") == self._stamp:
+                self._paths.update((name, None) for name in data.get("missing") or ())
+        else:
+            # 예전 형식: {이름: 경로}
+            found = data
+        # 그사이 지워진 파일은 다시 찾도록 버립니다.
+        self._paths.update((name, path) for name, path in found.items()
+                           if isinstance(path, str) and os.path.exists(path))
+
+    def _save_cache(self):
+        data = {
+            "version": CACHE_VERSION,
+            "stamp": self._stamp,
+            "paths": {name: path for name, path in self._paths.items() if path is not None},
+            "missing": sorted(name for name, path in self._paths.items() if path is None),
+        }
+        try:
+            tmp = self.cache_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            # 저장하지 못해도 이번 실행에는 지장이 없습니다.
+            pass
+
+    def _bundled(self, name):
+        for ext in FONT_EXTS:
+            path = os.path.join(self.font_dir, f"{name}.{ext}")
+            if os.path.exists(path):
+                return path
+        return None
+
+    def resolve(self, name):
+        """글꼴 이름을 파일 경로로 바꿉니다. 못 찾으면 번들 대체 글꼴, 그것도 없으면 None (pygame 기본 글꼴)."""
+        if name is None:
+            return self.fallback()
+        path = self._bundled(name)
+        if path is not None:
+            return path
+        if self._paths is None:
+            self._load_cache()
+        if name in self._paths:
+            path = self._paths[name]
+        else:
+            # 시스템 글꼴 목록 조회는 이름마다 처음 한 번뿐입니다 (못 찾은 이름은 글꼴 폴더가 바뀔 때까지).
+            self.system_lookups += 1
+            try:
+                path = pygame.font.match_font(name)
+            except Exception:
+                path = None
+            self._paths[name] = path
+            self._save_cache()
+        return path or self.fallback()
+
+    def fallback(self):
+        return BUNDLED_FALLBACK if os.path.exists(BUNDLED_FALLBACK) else None
+
+    # -----------------------------
+    # 공유 Font 객체
+    # -----------------------------
+    def get(self, name, size):
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            path = self.resolve(name)
+            try:
+                font = pygame.font.Font(path, size)
+            except (OSError, pygame.error):
+                font = pygame.font.Font(None, size)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+
+# 게임 전체에서 함께 쓰는 글꼴 관리자
+_shared = None
+
+
+def shared_fonts():
+    global _shared
+    if _shared is None:
+        _shared = FontManager()
+    return _shared
+
+
+def get_font(name, size):
+    """(name, size) 글꼴을 돌려줍니다. name=None 이면 기본 글꼴."""
+    return shared_fonts().get(name, size)
@@ -1,14 +1,83 @@
 # game.py
-import pygame
-from scenes import MapScene
+import os
+
+# 시작 시간 기록은 다른 무엇보다 먼저 불러옵니다 (import 시간까지 재기 위해).
+from startup import STARTUP
+
+with STARTUP.phase("import pygame"):
+    import pygame
+with STARTUP.phase("import 게임 모듈"):
+    from scenes import MapScene
+    from sprite_cache import shared_cache
+    from input_source import LiveInput
+    from profiler import PROFILER
+    from savegame import AutoSaver, SaveError, load as load_save
+    from asset_loader import shared_loader
+    from battle_log import BattleLog, BattleLogError
+
+# 시뮬레이션(씬 update)은 화면 프레임과 무관하게 고정된 틱으로 진행합니다.
+TICK_RATE = 60               # 초당 틱 수
+TICK = 1.0 / TICK_RATE       # 한 틱의 길이(초)
+MAX_FRAME_TIME = 0.25        # 한 프레임이 너무 길어도 이 이상은 따라잡지 않음 (멈춤 방지)
+AUTOSAVE_INTERVAL = 30.0     # 맵에 있는 동안 자동 저장 간격(게임 시간, 초)
+
+
+def init_pygame():
+    # pygame.init() 은 소리/조이스틱 등 쓰지 않는 모듈까지 모두 켜므로, 화면(+이벤트)만 켭니다.
+    # 글꼴 모듈은 font_manager 가 처음 글꼴을 만들 때 켭니다.
+    pygame.display.init()
+
+
+def warm_battle():
+    # 첫 전투 진입이 끊기지 않도록 전투 모듈과 전투 글꼴을 미리 준비합니다.
+    import battle
+    from font_manager import get_font, UI_FONT
+    battle.FONT = battle.FONT or get_font(UI_FONT, 24)
+
+
+def warm_species():
+    from species_db import shared_species_db
+    shared_species_db()
+
 
 class Game:
-    def __init__(self):
-        pygame.init()
-        self.screen = pygame.display.set_mode((800, 600))
-        pygame.display.set_caption("Mini Pokemon")
+    # dirty_rendering=True 이면 씬이 알려준 바뀐 영역만 display.update 로 반영합니다.
+    # render_fps: 화면 그리기 상한 (0 이면 제한 없음). vsync=True 면 수직동기화를 시도합니다.
+    # save_path: 저장 파일 경로. 주면 시작할 때 불러오고, 전투 후/일정 간격/종료 시 자동 저장합니다.
+    # battle_log: 전투 기록 파일 경로. 주면 전투마다 시드/입력/결과를 덧붙입니다 (python replay.py 로 재현).
+    def __init__(self, dirty_rendering=False, render_fps=60, vsync=False, save_path=None, battle_log=None):
+        with STARTUP.phase("pygame 모듈 초기화"):
+            init_pygame()
+        with STARTUP.phase("화면 만들기"):
+            self.screen = None
+            if vsync:
+                try:
+                    self.screen = pygame.display.set_mode((800, 600), pygame.SCALED, vsync=1)
+                except pygame.error:
+                    self.screen = None
+            if self.screen is None:
+                self.screen = pygame.display.set_mode((800, 600))
+            pygame.display.set_caption("Mini Pokemon")
         self.clock = pygame.time.Clock()
+        # 첫 프레임에 필요 없는 준비 작업은 첫 프레임을 보여준 뒤 한 프레임에 하나씩 실행합니다.
+        # (이름, 함수) 목록. 이미지 폴더 인덱스, 종 데이터베이스, 전투 모듈/글꼴
+        self.deferred = [
+            ("이미지 폴더 인덱스", lambda: shared_cache().index),
+            ("종 데이터베이스", warm_species),
+            ("전투 모듈/글꼴", warm_battle),
+        ]
+        # True 면 지연 로딩까지 끝나는 대로 종료 (시작 시간 측정용)
+        self.exit_after_startup = False
         self.running = True
+        self.dirty_rendering = dirty_rendering
+        self.render_fps = render_fps
+        # 입력 소스 (기본은 실제 키보드. headless.py 는 스크립트/녹화 입력으로 바꿔 끼웁니다)
+        self.input = LiveInput()
+        # 프레임 단계별 시간 측정 (F3: 오버레이 켜기/끄기, F4: trace 저장)
+        self.profiler = PROFILER
+        self.trace_path = "frame_trace.json"
+        # 마지막 틱 이후 흐른 시간 비율 (0~1). 씬이 그릴 때 위치 보간에 사용합니다.
+        self.render_alpha = 1.0
         # 누적 획득 경험치 추적
         self.total_exp = 0
         # 도망 횟수 추적 (2회 이상이면 게임오버)
@@ -16,11 +85,55 @@ class Game:
         # 게임오버 사유(문자열)를 저장
         self.last_gameover_reason = None
 
+        # 전투 기록 (턴마다 파일로 내보내므로 게임이 멈춰도 직전 전투까지 남습니다)
+        self.battle_log = None
+        if battle_log:
+            try:
+                self.battle_log = BattleLog(battle_log)
+            except (OSError, BattleLogError) as e:
+                print(f"전투 기록 파일을 열지 못해 기록 없이 시작합니다: {e}")
+
         # 처음에는 필드 씬부터 시작
-        self.current_scene = MapScene(self)
+        with STARTUP.phase("MapScene 생성"):
+            self.current_scene = MapScene(self)
+
+        # 자동 저장 (파일 쓰기는 백그라운드 스레드에서)
+        self.save_path = save_path
+        self.autosaver = None
+        self.autosave_timer = 0.0
+        if save_path:
+            if os.path.exists(save_path):
+                with STARTUP.phase("저장 파일 불러오기"):
+                    try:
+                        load_save(save_path).apply(self)
+                    except SaveError as e:
+                        print(f"저장 파일을 불러오지 못해 새로 시작합니다: {e}")
+            self.autosaver = AutoSaver(save_path)
 
     def change_scene(self, new_scene):
+        # 되돌아온 씬(예: 전투 후의 맵)도 처음 한 번은 화면 전체를 다시 그려야 합니다.
+        new_scene.invalidate()
         self.current_scene = new_scene
+        # 맵으로 돌아올 때(전투가 끝났을 때) 자동 저장
+        if isinstance(new_scene, MapScene):
+            self.autosave()
+
+    def autosave(self):
+        """상태 스냅샷을 만들어 백그라운드 저장을 요청합니다 (자동 저장이 꺼져 있으면 무시)."""
+        self.autosave_timer = 0.0
+        if self.autosaver is not None:
+            self.autosaver.request(self)
+
+    def run_deferred(self):
+        """미뤄 둔 준비 작업을 하나 실행합니다. 모두 끝나면 시작 완료로 기록합니다."""
+        if self.deferred:
+            name, fn = self.deferred.pop(0)
+            with STARTUP.phase(f"지연: {name}"):
+                fn()
+        if not self.deferred:
+            STARTUP.ready()
+            if self.exit_after_startup:
+                self.running = False
 
     def restart(self):
         """게임을 다시 시작합니다: 누적 EXP 초기화 및 새 MapScene 로 이동."""
@@ -30,24 +143,130 @@ class Game:
         # 새로운 맵 씬을 만들어 초기 상태로 돌아갑니다.
         from scenes import MapScene
         self.current_scene = MapScene(self)
+        self.autosave()
 
     def run(self):
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(60) / 1000  # 초 단위 delta time
+            frame_time = self.clock.tick(self.render_fps) / 1000  # 초 단위 프레임 시간
+            accumulator += min(frame_time, MAX_FRAME_TIME)
+            prof = self.profiler
+            prof.begin_frame(self.current_scene)
 
-            events = pygame.event.get()
+            # 작업 스레드에서 읽기가 끝난 이미지를 디스플레이 포맷으로 바꿔 씬에 넘깁니다.
+            shared_loader().pump()
+
+            events = self.input.poll()
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                    prof.toggle_overlay()
+                    # 오버레이가 있던 자리를 다시 그리도록 합니다.
+                    self.current_scene.invalidate()
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and prof.enabled:
+                    prof.export_chrome_trace(self.trace_path)
 
             self.current_scene.handle_events(events)
-            self.current_scene.update(dt)
-            self.current_scene.draw(self.screen)
+            prof.mark("events")
+
+            # 쌓인 시간만큼 고정 틱으로 update 를 실행합니다.
+            # (프레임이 빠르면 0번, 느리면 여러 번 실행되어 게임 속도는 항상 같습니다.)
+            while accumulator >= TICK:
+                self.current_scene.update(TICK)
+                self.input.end_tick()
+                accumulator -= TICK
+                self.autosave_timer += TICK
+            if self.autosave_timer >= AUTOSAVE_INTERVAL and isinstance(self.current_scene, MapScene):
+                self.autosave()
+            self.render_alpha = accumulator / TICK
+            prof.mark("update")
+
+            rects = self.current_scene.draw(self.screen)
+            overlay = prof.draw_overlay(self.screen, self.current_scene)
+            if overlay is not None and rects is not None:
+                rects.append(overlay)
+            prof.mark("draw")
+
+            if self.dirty_rendering and rects is not None:
+                # 바뀐 영역만 화면에 반영 (아무것도 안 바뀌었으면 생략)
+                if rects:
+                    pygame.display.update(rects)
+            else:
+                pygame.display.flip()
+            prof.mark("flip")
+            prof.end_frame()
 
-            pygame.display.flip()
+            # 첫 프레임이 화면에 나간 뒤에 미뤄 둔 준비 작업을 진행합니다.
+            STARTUP.first_frame()
+            if self.deferred or STARTUP.ready_ms is None:
+                self.run_deferred()
 
+        # 종료 직전 상태를 저장하고, 쓰기가 끝날 때까지 기다립니다.
+        if self.autosaver is not None:
+            self.autosaver.request(self)
+            self.autosaver.close()
+        if self.battle_log is not None:
+            self.battle_log.close()
         pygame.quit()
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
+    import sys
+    # python game.py --dirty    : 더티 렉트 렌더링 모드로 실행
+    # python game.py --uncapped : 화면 그리기 속도 제한 없이 실행 (게임 속도는 동일)
+    # python game.py --vsync    : 수직동기화로 화면 그리기
+    # python game.py --record FILE : 틱별 입력을 녹화 (python headless.py --script FILE 로 재생)
+    # python game.py --profile FILE : 프레임 단계별 시간을 측정해 종료 시 Chrome trace JSON 으로 저장
+    # python game.py --save FILE : 저장 파일 경로 (기본 savegame.bin)
+    # python game.py --no-save   : 불러오기/자동 저장 없이 실행
+    # python game.py --battle-log FILE : 전투 기록 파일 (기본 battles.log, python replay.py FILE 로 검증)
+    # python game.py --no-battle-log   : 전투 기록 없이 실행
+    # python game.py --startup-report     : 종료할 때 시작 단계별 시간 출력
+    # python game.py --startup-budget MS  : 첫 프레임까지 MS 를 넘으면 종료 코드 1 (보고도 출력)
+    # python game.py --exit-after-startup : 지연 로딩까지 끝나면 바로 종료 (시작 시간 측정용)
+    #   (두 옵션을 쓰면 저장 파일과 전투 기록은 읽지도 쓰지도 않습니다)
+    save_path = "savegame.bin"
+    if "--save" in sys.argv:
+        save_path = sys.argv[sys.argv.index("--save") + 1]
+    if "--no-save" in sys.argv:
+        save_path = None
+    battle_log = "battles.log"
+    if "--battle-log" in sys.argv:
+        battle_log = sys.argv[sys.argv.index("--battle-log") + 1]
+    if "--no-battle-log" in sys.argv:
+        battle_log = None
+    # 시작 시간 측정은 남아 있는 저장 파일/기록에 영향받지 않고 파일도 만들지 않도록 항상 빈 상태로
+    if "--exit-after-startup" in sys.argv or "--startup-budget" in sys.argv:
+        save_path = None
+        battle_log = None
+    game = Game(
+        dirty_rendering="--dirty" in sys.argv,
+        render_fps=0 if "--uncapped" in sys.argv else 60,
+        vsync="--vsync" in sys.argv,
+        save_path=save_path,
+        battle_log=battle_log,
+    )
+    recorder = None
+    if "--record" in sys.argv:
+        from input_source import InputRecorder
+        recorder = InputRecorder(game.input, sys.argv[sys.argv.index("--record") + 1])
+        game.input = recorder
+    if "--profile" in sys.argv:
+        game.trace_path = sys.argv[sys.argv.index("--profile") + 1]
+        game.profiler.enable()
+    game.exit_after_startup = "--exit-after-startup" in sys.argv
+    budget = None
+    if "--startup-budget" in sys.argv:
+        budget = float(sys.argv[sys.argv.index("--startup-budget") + 1])
+    try:
+        game.run()
+    finally:
+        if recorder is not None:
+            recorder.close()
+        if game.profiler.enabled:
+            game.profiler.export_chrome_trace(game.trace_path)
+    if "--startup-report" in sys.argv or budget is not None:
+        STARTUP.print_report()
+    if budget is not None and STARTUP.over_budget(budget):
+        print(f"첫 프레임까지 {STARTUP.first_frame_ms:.1f}ms 로 예산 {budget:.0f}ms 를 넘었습니다.")
+        sys.exit(1)
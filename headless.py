@@ -0,0 +1,119 @@
+# headless.py
+# 창 없이(SDL dummy 드라이버), 프레임 제한 없이 게임을 빨리 감기로 돌리는 실행기입니다.
+# 입력은 실제 키보드 대신 스크립트/녹화 파일(ScriptedInput) 또는 무작위 입력(RandomInput)으로 넣습니다.
+# 장시간 soak 테스트나 메모리 증가 확인에 사용합니다.
+#
+# 실행 예:
+#   python headless.py --ticks 200000 --seed 1 --memory
+#   python headless.py --script my_input.jsonl          (python game.py --record my_input.jsonl 로 녹화)
+import os
+
+# pygame 을 불러오기 전에 창/소리가 없는 드라이버를 지정합니다.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import random
+import time
+import tracemalloc
+
+import pygame
+
+from game import Game, TICK
+from input_source import RandomInput, ScriptedInput
+from asset_loader import shared_loader
+
+
+class HeadlessRunner:
+    # input_source: ScriptedInput / RandomInput 등 (생략하면 RandomInput)
+    # draw_every: N 틱마다 한 번 draw 까지 실행 (0 이면 그리지 않음)
+    def __init__(self, input_source=None, seed=None, draw_every=0, game=None):
+        if seed is not None:
+            random.seed(seed)
+        self.game = game or Game()
+        self.game.input = input_source or RandomInput(seed)
+        self.draw_every = draw_every
+        self.ticks = 0
+        # 통계: 씬 종류별 틱 수, 씬 전환 횟수
+        self.scene_ticks = {}
+        self.scene_entries = {}
+        self.memory_samples = []   # (tick, 현재 바이트, 최고 바이트)
+
+    def step(self):
+        """한 틱을 진행합니다: 입력 -> handle_events -> update (-> draw)."""
+        game = self.game
+        scene = game.current_scene
+        shared_loader().pump()
+        events = game.input.poll()
+        for event in events:
+            if event.type == pygame.QUIT:
+                game.running = False
+        scene.handle_events(events)
+        game.current_scene.update(TICK)
+        game.input.end_tick()
+        self.ticks += 1
+        if self.draw_every and self.ticks % self.draw_every == 0:
+            game.render_alpha = 1.0
+            game.current_scene.draw(game.screen)
+
+        after = game.current_scene
+        name = type(after).__name__
+        self.scene_ticks[name] = self.scene_ticks.get(name, 0) + 1
+        if after is not scene:
+            self.scene_entries[name] = self.scene_entries.get(name, 0) + 1
+
+    def run(self, ticks, memory_every=0):
+        """ticks 만큼(또는 스크립트가 끝나거나 게임이 종료될 때까지) 진행하고 요약을 돌려줍니다."""
+        source = self.game.input
+        if memory_every and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if not self.game.running or getattr(source, "finished", False):
+                break
+            self.step()
+            if memory_every and self.ticks % memory_every == 0:
+                current, peak = tracemalloc.get_traced_memory()
+                self.memory_samples.append((self.ticks, current, peak))
+        elapsed = time.perf_counter() - start
+        return self.summary(elapsed)
+
+    def summary(self, elapsed):
+        return {
+            "ticks": self.ticks,
+            "seconds": elapsed,
+            "ticks_per_second": self.ticks / elapsed if elapsed > 0 else 0.0,
+            "game_seconds": self.ticks * TICK,
+            "scene_ticks": dict(self.scene_ticks),
+            "scene_entries": dict(self.scene_entries),
+            "total_exp": getattr(self.game, "total_exp", 0),
+            "memory": list(self.memory_samples),
+        }
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="창 없이 게임을 빨리 감기로 실행합니다.")
+    parser.add_argument("--ticks", type=int, default=100_000, help="실행할 틱 수 (60틱 = 게임 시간 1초)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument("--script", help="ScriptedInput JSON Lines 파일 (없으면 무작위 입력)")
+    parser.add_argument("--loop", action="store_true", help="스크립트를 끝까지 재생하면 처음부터 반복")
+    parser.add_argument("--draw-every", type=int, default=0, help="N 틱마다 화면 그리기도 실행")
+    parser.add_argument("--memory", action="store_true", help="tracemalloc 으로 메모리 사용량 기록")
+    args = parser.parse_args(argv)
+
+    source = ScriptedInput.load(args.script, loop=args.loop) if args.script else None
+    runner = HeadlessRunner(source, seed=args.seed, draw_every=args.draw_every)
+    memory_every = max(1, args.ticks // 20) if args.memory else 0
+    result = runner.run(args.ticks, memory_every=memory_every)
+
+    print(f"{result['ticks']} 틱 (게임 시간 {result['game_seconds']:.0f}초) / {result['seconds']:.2f}초"
+          f" -> {result['ticks_per_second']:,.0f} 틱/초")
+    print(f"씬별 틱: {result['scene_ticks']}")
+    print(f"씬 진입 횟수: {result['scene_entries']}")
+    print(f"누적 EXP: {result['total_exp']}")
+    for tick, current, peak in result["memory"]:
+        print(f"  tick {tick:>9}: 현재 {current / 1024:,.0f} KB, 최고 {peak / 1024:,.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
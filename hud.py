@@ -0,0 +1,244 @@
+# hud.py
+# 맵/전투 화면이 함께 쓰는 HUD 위젯 (리테인드 모드)
+#  - 위젯은 보여줄 값(state)을 기억해 두고, 값이 바뀔 때만 Surface 를 다시 그립니다.
+#    값이 그대로인 프레임에는 캐시된 Surface 를 blit 만 합니다 (SpriteBatch 로 모아 그릴 수 있음).
+#  - 위젯은 포켓몬 객체 대신 "포켓몬을 돌려주는 함수(source)" 에 묶입니다.
+#    (불러오기 등으로 씬의 포켓몬이 바뀌어도 따라가도록)
+#  - HP 바는 표시용 HP(display_hp)를 실제 HP 쪽으로 부드럽게 움직이는 애니메이션을 가지고 있고,
+#    HP 수치도 이 표시용 HP 를 따라갑니다.
+from abc import ABC, abstractmethod
+
+import pygame
+
+from text_cache import render_text, shared_text_cache
+
+# HP 애니메이션 속도 (클수록 빨리 따라감, 단위: 1/초에 가까워지는 비율)
+HP_LERP_SPEED = 6.0
+
+# HP 비율별 바 색: 초록 -> 노랑 -> 빨강
+HP_GREEN = (88, 200, 115)
+HP_YELLOW = (240, 200, 80)
+HP_RED = (220, 60, 60)
+HP_BORDER = (100, 100, 100)
+
+
+def hp_color(fraction):
+    if fraction > 0.5:
+        return HP_GREEN
+    if fraction > 0.2:
+        return HP_YELLOW
+    return HP_RED
+
+
+# -----------------------------
+# 🧱 위젯 기본 틀
+# -----------------------------
+class Widget(ABC):
+    """캐시된 Surface 를 가진 HUD 요소. state() 가 바뀔 때만 render() 로 다시 그립니다."""
+
+    def __init__(self, pos):
+        self.pos = pos
+        self.surface = None
+        self._state = None
+        self.renders = 0        # 다시 그린 횟수 (측정용)
+
+    def state(self):
+        """화면에 보이는 값. 이 값이 같으면 같은 그림입니다."""
+        return None
+
+    @abstractmethod
+    def render(self, state):
+        """state 를 그린 Surface 를 돌려줍니다."""
+        pass
+
+    def dest(self):
+        return self.pos
+
+    def refresh(self):
+        """값이 바뀌었으면 Surface 를 다시 그리고 True."""
+        state = self.state()
+        if self.surface is not None and state == self._state:
+            return False
+        self._state = state
+        self.surface = self.render(state)
+        self.renders += 1
+        return True
+
+    def draw(self, screen, batch=None):
+        self.refresh()
+        if batch is not None:
+            batch.add(self.surface, self.dest())
+        else:
+            screen.blit(self.surface, self.dest())
+
+
+class Panel(Widget):
+    """테두리가 있는 단색 배경 상자 (한 번만 그림)."""
+
+    def __init__(self, rect, color, border_color, border=2):
+        rect = pygame.Rect(rect)
+        super().__init__(rect.topleft)
+        self.size = rect.size
+        self.color = color
+        self.border_color = border_color
+        self.border = border
+
+    def render(self, state):
+        surf = pygame.Surface(self.size)
+        surf.fill(self.color)
+        pygame.draw.rect(surf, self.border_color, surf.get_rect(), self.border)
+        return surf
+
+
+class NamePlate(Widget):
+    """'이름 LvN' 텍스트."""
+
+    def __init__(self, source, pos, font, color=(0, 0, 0)):
+        super().__init__(pos)
+        self.source = source
+        self.font = font
+        self.color = color
+
+    def state(self):
+        p = self.source()
+        return p.name, p.level
+
+    def render(self, state):
+        name, level = state
+        return render_text(self.font, f"{name} Lv{level}", self.color)
+
+
+class HpBar(Widget):
+    """애니메이션되는 HP 바. update(dt) 로 표시용 HP 를 실제 HP 쪽으로 움직입니다.
+
+    다시 그리는 것은 채워진 너비(픽셀)나 색이 바뀔 때뿐입니다.
+    """
+
+    def __init__(self, source, rect, back_color=(210, 210, 210)):
+        rect = pygame.Rect(rect)
+        # 테두리 1px 을 포함해 그립니다.
+        super().__init__((rect.x - 1, rect.y - 1))
+        self.source = source
+        self.width, self.height = rect.size
+        self.back_color = back_color
+        self._pokemon = None
+        self.display_hp = 0.0
+        self.snap()
+
+    def snap(self):
+        """애니메이션 없이 표시용 HP 를 실제 HP 로 맞춥니다."""
+        self._pokemon = self.source()
+        self.display_hp = float(self._pokemon.current_hp)
+
+    def update(self, dt):
+        p = self.source()
+        if p is not self._pokemon:
+            # 다른 포켓몬으로 바뀌었으면 (불러오기 등) 애니메이션 없이 바로 맞춥니다.
+            self.snap()
+            return
+        target = float(p.current_hp)
+        if abs(self.display_hp - target) > 0.01:
+            self.display_hp += (target - self.display_hp) * min(1.0, HP_LERP_SPEED * dt)
+        else:
+            self.display_hp = target
+
+    def fraction(self):
+        max_hp = self.source().max_hp
+        if max_hp <= 0:
+            return 0.0
+        return max(0.0, min(1.0, self.display_hp / float(max_hp)))
+
+    def state(self):
+        fraction = self.fraction()
+        return int(self.width * fraction), hp_color(fraction)
+
+    def render(self, state):
+        fill_w, color = state
+        w, h = self.width, self.height
+        surf = pygame.Surface((w + 2, h + 2))
+        surf.fill(HP_BORDER)
+        surf.fill(self.back_color, (1, 1, w, h))
+        if fill_w > 0:
+            surf.fill(color, (1, 1, fill_w, h))
+        return surf
+
+
+class HpText(Widget):
+    """'현재/최대' HP 수치. 표시용 HP 는 bar 를 따라갑니다.
+
+    align="right" 이면 pos 가 오른쪽 끝입니다. 글자는 숫자 아틀라스로 그립니다 (글꼴 래스터화 없음).
+    """
+
+    def __init__(self, bar, pos, font, color=(0, 0, 0), align="left"):
+        super().__init__(pos)
+        self.bar = bar
+        self.font = font
+        self.color = color
+        self.align = align
+
+    def state(self):
+        return int(self.bar.display_hp), self.bar.source().max_hp
+
+    def render(self, state):
+        text = "%d/%d" % state
+        digits = shared_text_cache().digits(self.font, self.color, True)
+        surf = pygame.Surface((max(1, digits.width(text)), digits.height), pygame.SRCALPHA)
+        digits.draw(surf, text, (0, 0))
+        return surf
+
+    def dest(self):
+        if self.align == "right":
+            return self.pos[0] - self.surface.get_width(), self.pos[1]
+        return self.pos
+
+
+# -----------------------------
+# 🩺 포켓몬 상태 HUD (이름/레벨 + HP 바 + HP 수치)
+# -----------------------------
+class StatusHud:
+    """한 포켓몬의 HUD 위젯 묶음. 위젯은 그리는 순서대로 widgets 에 들어 있습니다."""
+
+    def __init__(self, widgets, bar):
+        self.widgets = widgets
+        self.bar = bar
+
+    @property
+    def display_hp(self):
+        return self.bar.display_hp
+
+    def update(self, dt):
+        self.bar.update(dt)
+
+    def snap(self):
+        self.bar.snap()
+
+    def state(self):
+        """모든 위젯의 보이는 값 (더티 렉트 모드에서 바뀌었는지 비교용)."""
+        return tuple(w.state() for w in self.widgets)
+
+    def draw(self, screen, batch=None):
+        for w in self.widgets:
+            w.draw(screen, batch)
+
+
+def battle_hud(source, x, y, font, width=220):
+    """전투 화면용: (x, y) 에 이름, 그 아래 HP 바, 그 아래 HP 수치."""
+    bar = HpBar(source, (x, y + 30, width, 18))
+    return StatusHud([
+        NamePlate(source, (x, y), font),
+        bar,
+        HpText(bar, (x, y + 55), font),
+    ], bar)
+
+
+def map_hud(source, rect, font):
+    """맵 화면용: rect 상자 안에 이름, HP 바, HP 바 오른쪽 위에 겹친 HP 수치."""
+    x, y, w, h = rect
+    bar = HpBar(source, (x + 8, y + 28, w - 16, 14), back_color=(220, 220, 220))
+    text_color = (10, 10, 10)
+    return StatusHud([
+        Panel(rect, (240, 240, 240), (160, 160, 160)),
+        NamePlate(source, (x + 8, y + 6), font, text_color),
+        bar,
+        HpText(bar, (x + w - 8, y + 30), font, text_color, align="right"),
+    ], bar)
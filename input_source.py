@@ -0,0 +1,215 @@
+# input_source.py
+# 게임 입력(키 누름 상태, 키 이벤트)을 가져오는 곳을 바꿔 끼울 수 있게 해 주는 모듈입니다.
+#  - LiveInput     : 실제 키보드 (기본값, pygame.key / pygame.event 사용)
+#  - ScriptedInput : 미리 정해 둔(또는 녹화해 둔) 입력을 틱마다 재생
+#  - RandomInput   : 무작위로 돌아다니며 전투하는 입력 (장시간 soak 테스트용)
+#  - InputRecorder : 다른 입력 소스를 감싸 틱별 입력을 JSON Lines 파일로 녹화
+#
+# 씬은 game.input.get_pressed() 로 키 상태를 읽고, Game 루프는 game.input.poll() 로 이벤트를 받으며
+# 틱(update) 하나가 끝날 때마다 game.input.end_tick() 을 호출합니다.
+import json
+import random
+
+import pygame
+
+# 맵 이동에 쓰는 키
+ARROW_KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN)
+
+# 스크립트 파일에서 쓰는 키 이름 <-> pygame 키 코드
+KEY_NAMES = {
+    "left": pygame.K_LEFT,
+    "right": pygame.K_RIGHT,
+    "up": pygame.K_UP,
+    "down": pygame.K_DOWN,
+    "1": pygame.K_1,
+    "2": pygame.K_2,
+    "return": pygame.K_RETURN,
+    "space": pygame.K_SPACE,
+}
+KEY_CODES = {code: name for name, code in KEY_NAMES.items()}
+
+
+def key_code(key):
+    """'left' 같은 이름이나 pygame 키 코드를 키 코드로 바꿉니다."""
+    if isinstance(key, str):
+        return KEY_NAMES[key]
+    return key
+
+
+def key_name(code):
+    return KEY_CODES.get(code, code)
+
+
+class KeyState:
+    """pygame.key.get_pressed() 결과처럼 keys[pygame.K_LEFT] 로 읽을 수 있는 키 상태."""
+
+    __slots__ = ("held",)
+
+    def __init__(self, held=()):
+        self.held = frozenset(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+def keydown(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key_code(key))
+
+
+class LiveInput:
+    """실제 키보드 입력."""
+
+    def poll(self):
+        return pygame.event.get()
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def end_tick(self):
+        pass
+
+
+class ScriptedInput:
+    """틱 단위로 정해 둔 입력을 재생합니다.
+
+    스크립트는 (held, presses, ticks) 단계의 목록입니다.
+      held    : 그 동안 누르고 있을 키 목록 (예: ["right", "down"])
+      presses : 단계 첫 틱에 보낼 KEYDOWN 키 목록 (예: ["1"])
+      ticks   : 이 단계를 유지할 틱 수
+    스크립트가 끝나면 아무 키도 누르지 않은 상태가 됩니다 (loop=True 면 처음부터 반복).
+    """
+
+    def __init__(self, steps=(), loop=False):
+        self.steps = [self._normalize(step) for step in steps]
+        self.loop = loop
+        self._index = 0
+        self._left = self.steps[0][2] if self.steps else 0
+        self._first = True
+        self._held = KeyState()
+
+    @staticmethod
+    def _normalize(step):
+        held, presses, ticks = step
+        return (frozenset(key_code(k) for k in held), [key_code(k) for k in presses], max(1, int(ticks)))
+
+    @classmethod
+    def load(cls, path, loop=False):
+        """InputRecorder 가 녹화한 JSON Lines 파일(또는 같은 형식으로 쓴 스크립트)을 읽습니다."""
+        steps = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                rec = json.loads(line)
+                steps.append((rec.get("held", []), rec.get("press", []), rec.get("ticks", 1)))
+        return cls(steps, loop=loop)
+
+    @property
+    def finished(self):
+        return not self.loop and self._index >= len(self.steps)
+
+    def poll(self):
+        """다음 틱으로 넘어가며 이번 틱에 보낼 이벤트 목록을 돌려줍니다."""
+        if self._index >= len(self.steps):
+            if not self.loop or not self.steps:
+                self._held = KeyState()
+                return []
+            self._index = 0
+            self._left = self.steps[0][2]
+            self._first = True
+        held, presses, _ = self.steps[self._index]
+        self._held = KeyState(held)
+        events = [keydown(k) for k in presses] if self._first else []
+        self._first = False
+        self._left -= 1
+        if self._left <= 0:
+            self._index += 1
+            self._first = True
+            if self._index < len(self.steps):
+                self._left = self.steps[self._index][2]
+        return events
+
+    def get_pressed(self):
+        return self._held
+
+    def end_tick(self):
+        pass
+
+
+class RandomInput:
+    """무작위 방향으로 걷다가 전투가 나오면 공격하는 입력 (soak 테스트용)."""
+
+    def __init__(self, seed=None, press_every=15):
+        self.rng = random.Random(seed)
+        self.press_every = press_every
+        self._held = KeyState()
+        self._left = 0
+        self._tick = 0
+
+    def poll(self):
+        self._tick += 1
+        if self._left <= 0:
+            # 한 방향(가끔은 대각선/정지)을 골라 잠시 유지합니다.
+            n = self.rng.choice((0, 1, 1, 1, 2))
+            self._held = KeyState(self.rng.sample(ARROW_KEYS, n))
+            self._left = self.rng.randint(10, 90)
+        self._left -= 1
+        if self._tick % self.press_every == 0:
+            # 전투 메뉴/기술 선택/게임오버 화면을 넘기기 위해 1번 키를 누릅니다.
+            return [keydown(pygame.K_1)]
+        return []
+
+    def get_pressed(self):
+        return self._held
+
+    def end_tick(self):
+        pass
+
+
+class InputRecorder:
+    """다른 입력 소스를 감싸서, 틱마다 읽힌 입력을 JSON Lines 로 파일에 기록합니다.
+
+    같은 입력이 이어지는 구간은 한 줄({"held": [...], "press": [...], "ticks": n})로 묶어
+    ScriptedInput.load 로 그대로 재생할 수 있습니다.
+    """
+
+    def __init__(self, source, path):
+        self.source = source
+        self.file = open(path, "w", encoding="utf-8")
+        self._pending = []      # 다음 틱에 붙일 KEYDOWN 키
+        self._run = None        # [held, press, ticks]
+
+    def poll(self):
+        events = self.source.poll()
+        for ev in events:
+            if ev.type == pygame.KEYDOWN:
+                self._pending.append(key_name(ev.key))
+        return events
+
+    def get_pressed(self):
+        return self.source.get_pressed()
+
+    def end_tick(self):
+        # 틱 하나가 끝날 때: 이번 틱의 키 상태와 틱 전에 처리된 KEYDOWN 을 기록합니다.
+        self.source.end_tick()
+        keys = self.source.get_pressed()
+        held = [key_name(k) for k in ARROW_KEYS if keys[k]]
+        press = self._pending
+        self._pending = []
+        run = self._run
+        if run is not None and not press and run[0] == held:
+            run[2] += 1
+        else:
+            self._flush()
+            self._run = [held, press, 1]
+
+    def _flush(self):
+        if self._run is not None:
+            held, press, ticks = self._run
+            self.file.write(json.dumps({"held": held, "press": press, "ticks": ticks}) + "\n")
+            self._run = None
+
+    def close(self):
+        self._flush()
+        self.file.close()
@@ -0,0 +1,227 @@
+# profiler.py
+# 프레임 단위 성능 측정 도구입니다.
+#  - Game.run 의 단계(events / update / draw / flip)별 시간을 씬 종류별로 기록
+#  - 최근 N 프레임의 p50 / p95 / p99 / 최악 값을 화면 오버레이로 표시 (F3 으로 켜고 끄기)
+#  - Chrome trace-event JSON 으로 내보내기 (chrome://tracing 또는 Perfetto 에서 열기)
+#  - 특정 구간은 PROFILER.span("이름") 으로 감싸 trace 에 따로 표시할 수 있습니다.
+#
+# 꺼져 있을 때는 각 호출이 enabled 확인 한 번으로 바로 끝나므로 비용이 거의 없습니다.
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+PHASES = ("events", "update", "draw", "flip")
+WINDOW = 600              # 통계를 내는 최근 프레임 수 (60FPS 기준 10초)
+MAX_TRACE_EVENTS = 200_000
+OVERLAY_REFRESH = 0.5     # 오버레이 글자를 다시 만드는 간격(초)
+
+_now_ns = time.perf_counter_ns
+
+
+def percentile(ordered, p):
+    """정렬된 목록 ordered 의 p 백분위수 (사이 값은 선형 보간). 비어 있으면 0."""
+    if not ordered:
+        return 0.0
+    k = (len(ordered) - 1) * p / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+class _NullSpan:
+    # 꺼져 있을 때 span() 이 돌려주는 아무 일도 하지 않는 컨텍스트
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = _now_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add_trace(self.name, "span", self.start, _now_ns() - self.start)
+        return False
+
+
+class FrameProfiler:
+    def __init__(self, window=WINDOW):
+        self.enabled = False
+        self.overlay_visible = False
+        self.window = window
+        # (씬 이름, 단계) -> 최근 시간들(ms)
+        self.samples = {}
+        # 씬 이름 -> 최근 프레임 전체 시간(ms)
+        self.frames = {}
+        self.trace = deque(maxlen=MAX_TRACE_EVENTS)
+        self._origin = _now_ns()
+        self._scene = None
+        self._frame_start = 0
+        self._mark = 0
+        self._overlay = None
+        self._overlay_time = 0.0
+        self._font = None
+
+    # -----------------------------
+    # 켜고 끄기
+    # -----------------------------
+    def enable(self):
+        self.enabled = True
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+        if self.overlay_visible:
+            self.enabled = True
+        self._overlay = None
+
+    def reset(self):
+        self.samples.clear()
+        self.frames.clear()
+        self.trace.clear()
+
+    # -----------------------------
+    # 측정 (Game.run 에서 호출)
+    # -----------------------------
+    def begin_frame(self, scene):
+        if not self.enabled:
+            return
+        self._scene = type(scene).__name__
+        self._frame_start = self._mark = _now_ns()
+
+    def mark(self, phase):
+        """직전 mark(또는 begin_frame) 이후 시간을 phase 단계의 시간으로 기록합니다."""
+        if not self.enabled or self._scene is None:
+            return
+        now = _now_ns()
+        start = self._mark
+        self._mark = now
+        self._add(self._scene, phase, (now - start) / 1e6)
+        self.add_trace(phase, self._scene, start, now - start)
+
+    def end_frame(self):
+        if not self.enabled or self._scene is None:
+            return
+        now = _now_ns()
+        buf = self.frames.get(self._scene)
+        if buf is None:
+            buf = self.frames[self._scene] = deque(maxlen=self.window)
+        buf.append((now - self._frame_start) / 1e6)
+        self.add_trace("frame", self._scene, self._frame_start, now - self._frame_start)
+        self._scene = None
+
+    def span(self, name):
+        """with PROFILER.span("BattleScene.__init__"): ... 처럼 구간을 trace 에 남깁니다."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def _add(self, scene, phase, ms):
+        key = (scene, phase)
+        buf = self.samples.get(key)
+        if buf is None:
+            buf = self.samples[key] = deque(maxlen=self.window)
+        buf.append(ms)
+
+    def add_trace(self, name, cat, start_ns, dur_ns):
+        self.trace.append((name, cat, start_ns, dur_ns))
+
+    # -----------------------------
+    # 통계 / 내보내기
+    # -----------------------------
+    def stats(self, scene=None):
+        """{(씬, 단계): {"p50", "p95", "p99", "max", "count"}} (단위 ms)"""
+        result = {}
+        items = list(self.samples.items())
+        items += [((name, "frame"), buf) for name, buf in self.frames.items()]
+        for (name, phase), buf in items:
+            if scene is not None and name != scene:
+                continue
+            ordered = sorted(buf)
+            result[(name, phase)] = {
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+                "max": ordered[-1] if ordered else 0.0,
+                "count": len(ordered),
+            }
+        return result
+
+    def export_chrome_trace(self, path):
+        """기록된 구간을 Chrome trace-event 형식(JSON)으로 저장합니다."""
+        events = []
+        origin = self._origin
+        pid = os.getpid()
+        for name, cat, start_ns, dur_ns in self.trace:
+            events.append({
+                "name": name,
+                "cat": cat,
+                "ph": "X",
+                "ts": (start_ns - origin) / 1000.0,
+                "dur": dur_ns / 1000.0,
+                "pid": pid,
+                "tid": 1,
+            })
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+    # -----------------------------
+    # 화면 오버레이
+    # -----------------------------
+    def overlay_rect(self):
+        if self._overlay is None:
+            return None
+        return self._overlay.get_rect(topleft=(4, 4))
+
+    def draw_overlay(self, screen, scene):
+        """오버레이를 그리고 그린 영역을 돌려줍니다 (꺼져 있으면 None)."""
+        if not self.overlay_visible:
+            return None
+        now = time.perf_counter()
+        if self._overlay is None or now - self._overlay_time >= OVERLAY_REFRESH:
+            self._overlay = self._build_overlay(type(scene).__name__)
+            self._overlay_time = now
+        rect = self.overlay_rect()
+        screen.blit(self._overlay, rect)
+        return rect
+
+    def _build_overlay(self, scene):
+        if self._font is None:
+            from font_manager import get_font
+            self._font = get_font(None, 18)
+        stats = self.stats(scene)
+        lines = [f"{scene}  (ms)   p50    p95    p99    max"]
+        for phase in PHASES + ("frame",):
+            s = stats.get((scene, phase))
+            if s is None:
+                continue
+            lines.append(f"{phase:>8s}  {s['p50']:6.2f} {s['p95']:6.2f} {s['p99']:6.2f} {s['max']:6.2f}")
+        surfs = [self._font.render(line, True, (255, 255, 255)) for line in lines]
+        w = max(s.get_width() for s in surfs) + 12
+        h = sum(s.get_height() for s in surfs) + 8
+        # 더티 렉트 모드에서도 겹쳐 그려 어두워지지 않도록 불투명 패널을 씁니다.
+        panel = pygame.Surface((w, h))
+        panel.fill((0, 0, 0))
+        y = 4
+        for s in surfs:
+            panel.blit(s, (6, y))
+            y += s.get_height()
+        return panel
+
+
+# 게임 전체에서 함께 쓰는 프로파일러
+PROFILER = FrameProfiler()
@@ -0,0 +1,111 @@
+# replay.py
+# 전투 기록(battle_log)을 창 없이 최대 속도로 다시 돌려, 기록된 결과와 똑같이 나오는지 검증합니다.
+#  - 기록 파일은 흘려 읽으므로 아무리 큰 묶음이어도 메모리 사용량이 일정합니다.
+#  - 버그 제보가 오면 그 기록 파일로 같은 전투를 그대로 재현할 수 있습니다 (-v 로 이벤트 출력).
+#
+# 실행 예:
+#   python replay.py battles.log
+#   python replay.py archive/*.log --stop-on-fail
+#   python replay.py battles.log --battle 12 -v
+import sys
+import time
+
+from battle_engine import (
+    BattleEngine, EVENT_ID, SIDE_ID, STATE_ID, EVENT_CODES, SIDE_CODES, STATE_CODES,
+    INPUT_ATTACK, INPUT_FLEE, INPUT_ENEMY_ATTACK, INPUT_ATTACK_ONLY,
+)
+from battle_log import iter_battles, BattleLogError
+
+
+def _event_key(ev):
+    return (EVENT_ID[ev.kind], SIDE_ID.get(ev.side, 0), min(0xFFFFFFFF, int(ev.value)))
+
+
+def replay(battle, verbose=False):
+    """기록된 전투 하나를 다시 돌려 (일치 여부, 설명) 을 돌려줍니다."""
+    engine = BattleEngine(battle.player, battle.enemy, seed=battle.seed)
+    produced = [_event_key(ev) for ev in engine.drain_events()]
+    logged = []
+    for step in battle.steps:
+        if step[0] == "event":
+            logged.append(step[1:])
+            continue
+        _, action, skill = step
+        if action == INPUT_ATTACK:
+            engine.player_attack(skill)
+        elif action == INPUT_ATTACK_ONLY:
+            engine.player_attack(skill, enemy_turn=False)
+        elif action == INPUT_FLEE:
+            engine.flee()
+        elif action == INPUT_ENEMY_ATTACK:
+            engine.enemy_attack(skill)
+        else:
+            return False, f"알 수 없는 입력 {action}"
+        produced.extend(_event_key(ev) for ev in engine.drain_events())
+
+    if verbose:
+        for kind, side, value in produced:
+            print(f"    {EVENT_CODES[kind]:6s} {str(SIDE_CODES[side]):7s} {value}")
+
+    for i, (want, got) in enumerate(zip(logged, produced)):
+        if want != got:
+            return False, f"{i}번째 이벤트가 다름: 기록 {_describe(want)} / 재현 {_describe(got)}"
+    if len(logged) != len(produced):
+        return False, f"이벤트 수가 다름: 기록 {len(logged)} / 재현 {len(produced)}"
+    if battle.end is None:
+        return True, "끝나지 않은 전투 (기록 도중 종료)"
+    winner, state, turns = battle.end
+    result = (SIDE_ID.get(engine.winner, 0), STATE_ID[engine.state], engine.turns)
+    if result != (winner, state, turns):
+        return False, (f"결과가 다름: 기록 {SIDE_CODES[winner]}/{STATE_CODES[state]}/{turns}턴"
+                       f" / 재현 {engine.winner}/{engine.state}/{engine.turns}턴")
+    return True, f"{SIDE_CODES[winner]} 승 ({turns}턴)" if winner else f"{STATE_CODES[state]} ({turns}턴)"
+
+
+def _describe(key):
+    kind, side, value = key
+    return f"{EVENT_CODES[kind]}/{SIDE_CODES[side]}/{value}"
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="전투 기록을 다시 돌려 결과를 검증합니다.")
+    parser.add_argument("paths", nargs="+", help="battle_log 파일들")
+    parser.add_argument("--battle", type=int, help="이 번호의 전투만 (파일 안의 전투 번호)")
+    parser.add_argument("--stop-on-fail", action="store_true", help="처음 불일치에서 멈춤")
+    parser.add_argument("-v", "--verbose", action="store_true", help="전투마다 결과와 이벤트 출력")
+    args = parser.parse_args(argv)
+
+    total = failed = incomplete = 0
+    start = time.perf_counter()
+    for path in args.paths:
+        try:
+            with open(path, "rb") as f:
+                for battle in iter_battles(f):
+                    if args.battle is not None and battle.battle_id != args.battle:
+                        continue
+                    total += 1
+                    if args.verbose:
+                        print(f"{path} #{battle.battle_id} seed={battle.seed} "
+                              f"{battle.player.name} Lv{battle.player.level} vs {battle.enemy.name} Lv{battle.enemy.level}")
+                    ok, detail = replay(battle, verbose=args.verbose)
+                    if battle.end is None:
+                        incomplete += 1
+                    if not ok:
+                        failed += 1
+                        print(f"불일치 {path} #{battle.battle_id} (seed={battle.seed}): {detail}")
+                        if args.stop_on_fail:
+                            return 1
+                    elif args.verbose:
+                        print(f"  -> 일치: {detail}")
+        except (OSError, BattleLogError) as e:
+            print(f"{path}: {e}")
+            failed += 1
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"전투 {total}개 재현 ({rate:,.0f}개/초), 불일치 {failed}, 끝나지 않은 전투 {incomplete}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
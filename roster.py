@@ -0,0 +1,266 @@
+# roster.py
+# 수만 마리의 포켓몬(파티/박스/NPC 명단)을 작게 보관하는 배열 기반(struct-of-arrays) 저장소입니다.
+#  - 레벨, HP, 스탯, EXP, 기술 위력/PP 를 종류별 NumPy 배열에 나눠 담습니다.
+#    (기술 1개 기준 한 마리당 약 67바이트. Pokemon + Skill 객체로 두면 수백 바이트)
+#  - roster.view(i) 는 Pokemon 처럼 쓸 수 있는 가벼운 뷰를 돌려주므로
+#    BattleScene / BattleEngine 에 그대로 넘길 수 있습니다. (값은 배열에 바로 반영됨)
+#  - 박스 전체 회복 같은 일괄 작업은 배열 연산 한 번으로 처리합니다.
+import numpy as np
+
+from base_pokemon import (Pokemon, Skill, DEFAULT_GROWTH, growth_table,
+                          LEVEL_UP_HP, LEVEL_UP_ATTACK, LEVEL_UP_DEFENSE, LEVEL_UP_SPEED)
+
+MAX_SKILLS = 4          # 한 마리가 가질 수 있는 기술 수
+DEFAULT_CAPACITY = 256  # 처음 확보하는 칸 수 (모자라면 두 배씩 늘림)
+
+# 마리당 값 배열 (이름, dtype)
+STAT_FIELDS = (
+    ("name_id", np.int32),      # names 목록의 번호
+    ("level", np.int16),
+    ("exp", np.int64),
+    ("max_hp", np.int32),
+    ("current_hp", np.int32),
+    ("attack", np.int32),
+    ("defense", np.int32),
+    ("speed", np.int32),
+    ("skill_count", np.int8),
+)
+# 마리 x 기술 배열 (이름, dtype)
+SKILL_FIELDS = (
+    ("skill_name_id", np.uint16),  # 기술 이름 번호 (names 목록, 65535개까지)
+    ("skill_power", np.int16),
+    ("skill_max_pp", np.int16),
+    ("skill_pp", np.int16),
+)
+
+
+class Roster:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        capacity = max(1, int(capacity))
+        self.size = 0
+        self.names = []         # 포켓몬/기술 이름 (같은 이름은 한 번만 저장)
+        self._name_ids = {}
+        for field, dtype in STAT_FIELDS:
+            setattr(self, field, np.zeros(capacity, dtype=dtype))
+        for field, dtype in SKILL_FIELDS:
+            setattr(self, field, np.zeros((capacity, MAX_SKILLS), dtype=dtype))
+
+    @property
+    def capacity(self):
+        return self.level.shape[0]
+
+    def __len__(self):
+        return self.size
+
+    def _intern(self, name):
+        nid = self._name_ids.get(name)
+        if nid is None:
+            nid = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return nid
+
+    def _grow(self, need):
+        cap = self.capacity
+        if need <= cap:
+            return
+        new_cap = max(need, cap * 2)
+        for field, _ in STAT_FIELDS + SKILL_FIELDS:
+            old = getattr(self, field)
+            new = np.zeros((new_cap,) + old.shape[1:], dtype=old.dtype)
+            new[:cap] = old
+            setattr(self, field, new)
+
+    # -----------------------------
+    # 추가 / 조회
+    # -----------------------------
+    def add(self, name, level, max_hp, attack, defense, speed, skills=None):
+        """포켓몬 한 마리를 추가하고 번호를 돌려줍니다. skills 는 Skill 목록(생략 시 기본 기술)."""
+        if skills is None:
+            skills = [Skill("Tackle", power=10, pp=35)]
+        if len(skills) > MAX_SKILLS:
+            raise ValueError(f"기술은 최대 {MAX_SKILLS}개까지 가질 수 있습니다.")
+        i = self.size
+        self._grow(i + 1)
+        self.size = i + 1
+        self.name_id[i] = self._intern(name)
+        self.level[i] = level
+        self.exp[i] = 0
+        self.max_hp[i] = max_hp
+        self.current_hp[i] = max_hp
+        self.attack[i] = attack
+        self.defense[i] = defense
+        self.speed[i] = speed
+        self.skill_count[i] = len(skills)
+        for k, skill in enumerate(skills):
+            self.skill_name_id[i, k] = self._intern(skill.name)
+            self.skill_power[i, k] = skill.power
+            self.skill_max_pp[i, k] = skill.max_pp
+            self.skill_pp[i, k] = skill.current_pp
+        return i
+
+    def add_pokemon(self, pokemon):
+        """기존 Pokemon 객체의 현재 상태(HP, EXP, PP 포함)를 그대로 옮겨 담습니다."""
+        i = self.add(pokemon.name, pokemon.level, pokemon.max_hp, pokemon.attack,
+                     pokemon.defense, pokemon.speed, pokemon.skills)
+        self.current_hp[i] = pokemon.current_hp
+        self.exp[i] = pokemon.exp
+        return i
+
+    def view(self, i):
+        """i 번 포켓몬을 Pokemon 처럼 다룰 수 있는 뷰를 돌려줍니다."""
+        if not 0 <= i < self.size:
+            raise IndexError(i)
+        return PokemonView(self, i)
+
+    def __getitem__(self, i):
+        return self.view(i)
+
+    def __iter__(self):
+        for i in range(self.size):
+            yield PokemonView(self, i)
+
+    def to_pokemon(self, i):
+        """i 번 포켓몬을 독립된 Pokemon 객체로 복사합니다."""
+        v = self.view(i)
+        p = Pokemon(v.name, v.level, v.max_hp, v.attack, v.defense, v.speed,
+                    [Skill(s.name, s.power, s.max_pp) for s in v.skills])
+        for src, dst in zip(v.skills, p.skills):
+            dst.current_pp = src.current_pp
+        p.current_hp = v.current_hp
+        p.exp = v.exp
+        return p
+
+    # -----------------------------
+    # 일괄 작업 (배열 연산)
+    # -----------------------------
+    def heal_all(self, indices=None):
+        """HP 와 PP 를 모두 회복합니다. indices 를 주면 그 번호들만 (예: 박스 하나)."""
+        n = self.size
+        if indices is None:
+            self.current_hp[:n] = self.max_hp[:n]
+            self.skill_pp[:n] = self.skill_max_pp[:n]
+        else:
+            idx = np.asarray(indices)
+            self.current_hp[idx] = self.max_hp[idx]
+            self.skill_pp[idx] = self.skill_max_pp[idx]
+
+    def gain_exp(self, amount, indices=None):
+        """여러 마리에게 EXP 를 한꺼번에 주고, 마리별로 오른 레벨 수 배열을 돌려줍니다.
+
+        누적 EXP 표에서 searchsorted 로 최종 레벨을 찾고 스탯도 한 번에 올립니다.
+        (결과는 한 마리씩 Pokemon.gain_exp 를 부른 것과 같고, 메시지는 만들지 않습니다.)
+        """
+        n = self.size
+        idx = slice(0, n) if indices is None else np.asarray(indices)
+        levels = self.level[idx].astype(np.int64)
+        if amount <= 0 or levels.size == 0:
+            return np.zeros(levels.shape, dtype=np.int64)
+        table = growth_table(DEFAULT_GROWTH)
+        table.cumulative(int(levels.max()))
+        cum = np.asarray(table.total, dtype=np.int64)
+        total = cum[levels] + self.exp[idx] + int(amount)
+        table.level_for(int(total.max()))   # 표를 최종 레벨까지 늘림
+        cum = np.asarray(table.total, dtype=np.int64)
+        new_levels = np.searchsorted(cum, total, side="right") - 1
+        gained = new_levels - levels
+        self.level[idx] = new_levels
+        self.exp[idx] = total - cum[new_levels]
+        self.max_hp[idx] += LEVEL_UP_HP * gained
+        self.attack[idx] += LEVEL_UP_ATTACK * gained
+        self.defense[idx] += LEVEL_UP_DEFENSE * gained
+        self.speed[idx] += LEVEL_UP_SPEED * gained
+        self.current_hp[idx] = np.minimum(self.max_hp[idx], self.current_hp[idx] + LEVEL_UP_HP * gained)
+        return gained
+
+    def fainted(self):
+        """기절한 포켓몬 번호 배열."""
+        return np.flatnonzero(self.current_hp[:self.size] <= 0)
+
+    def nbytes(self):
+        """배열이 차지하는 바이트 수 (확보한 칸 기준)."""
+        return sum(getattr(self, f).nbytes for f, _ in STAT_FIELDS + SKILL_FIELDS)
+
+
+class SkillView(Skill):
+    """Roster 안의 기술 하나를 Skill 처럼 보여주는 뷰. use() 등은 Skill 의 것을 그대로 씁니다."""
+
+    __slots__ = ("_roster", "_i", "_k")
+
+    def __init__(self, roster, i, k):
+        self._roster = roster
+        self._i = i
+        self._k = k
+
+    @property
+    def name(self):
+        r = self._roster
+        return r.names[r.skill_name_id[self._i, self._k]]
+
+    @property
+    def power(self):
+        return int(self._roster.skill_power[self._i, self._k])
+
+    @property
+    def max_pp(self):
+        return int(self._roster.skill_max_pp[self._i, self._k])
+
+    @property
+    def current_pp(self):
+        return int(self._roster.skill_pp[self._i, self._k])
+
+    @current_pp.setter
+    def current_pp(self, value):
+        self._roster.skill_pp[self._i, self._k] = value
+
+
+def _stat_property(field):
+    # Roster 배열의 i 번 칸을 읽고 쓰는 속성을 만듭니다.
+    def getter(self):
+        return int(getattr(self._roster, field)[self._i])
+
+    def setter(self, value):
+        getattr(self._roster, field)[self._i] = value
+
+    return property(getter, setter)
+
+
+class PokemonView(Pokemon):
+    """Roster 안의 포켓몬 한 마리를 Pokemon 처럼 보여주는 뷰.
+
+    전투/경험치 규칙(attack_target, gain_exp, level_up 등)은 Pokemon 의 메서드를 그대로 쓰고,
+    값을 읽고 쓰는 것만 Roster 배열로 연결됩니다.
+    """
+
+    __slots__ = ("_roster", "_i")
+
+    # 배열 저장소는 기본 성장 곡선만 씁니다.
+    growth = DEFAULT_GROWTH
+
+    def __init__(self, roster, i):
+        self._roster = roster
+        self._i = i
+
+    level = _stat_property("level")
+    exp = _stat_property("exp")
+    max_hp = _stat_property("max_hp")
+    current_hp = _stat_property("current_hp")
+    attack = _stat_property("attack")
+    defense = _stat_property("defense")
+    speed = _stat_property("speed")
+
+    @property
+    def index(self):
+        return self._i
+
+    @property
+    def name(self):
+        r = self._roster
+        return r.names[r.name_id[self._i]]
+
+    @property
+    def skills(self):
+        r, i = self._roster, self._i
+        return [SkillView(r, i, k) for k in range(int(r.skill_count[i]))]
+
+    def __repr__(self):
+        return f"PokemonView({self.name!r}, Lv{self.level}, HP {self.current_hp}/{self.max_hp})"
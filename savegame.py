@@ -0,0 +1,250 @@
+# savegame.py
+# 게임 상태 저장/불러오기입니다.
+#  - Game(누적 EXP, 도망 횟수), MapScene(플레이어 위치, 아이템, 타이머), 파티 포켓몬(스탯, EXP, 기술/PP)을
+#    버전이 붙은 작은 바이너리 형식으로 저장합니다. (보통 100바이트 남짓)
+#  - AutoSaver: 메인 스레드에서는 상태를 bytes 로 만드는 것(스냅샷)만 하고,
+#    파일 쓰기는 백그라운드 스레드가 임시 파일 + 원자적 rename 으로 처리합니다.
+#    그래서 저장 때문에 프레임이 밀리지 않고, 저장 중 꺼져도 이전 파일이 깨지지 않습니다.
+import os
+import struct
+import threading
+import zlib
+
+from base_pokemon import Pokemon, Skill, DEFAULT_GROWTH
+
+MAGIC = b"PKSV"
+VERSION = 2
+# 불러올 수 있는 이전 버전 (1: 아이템 좌표가 16비트. 한 화면짜리 맵 시절)
+OLD_VERSIONS = (1,)
+
+# 파일 구조 (모두 little-endian)
+#   헤더 | Game | MapScene | 아이템 목록 | 파티 | CRC32 (앞부분 전체)
+HEADER = struct.Struct("<4sH")                # magic, version
+GAME = struct.Struct("<qH")                   # total_exp, flee_count
+MAP = struct.Struct("<ffffB")                 # 플레이어 x, y, 아이템 타이머, 전투 쿨다운, 아이템 수
+ITEM = struct.Struct("<iih")                  # x, y (월드 좌표), 회복량
+ITEM_V1 = struct.Struct("<hhh")
+POKEMON = struct.Struct("<HqiiHHHB")          # level, exp, max_hp, current_hp, attack, defense, speed, 기술 수
+SKILL = struct.Struct("<hHH")                 # power, max_pp, current_pp
+CRC = struct.Struct("<I")
+
+
+class SaveError(Exception):
+    """저장 파일이 없거나 깨졌거나 지원하지 않는 버전일 때 발생합니다."""
+
+
+class SaveData:
+    """불러온 저장 내용. apply(game) 로 게임에 적용합니다."""
+
+    def __init__(self, total_exp=0, flee_count=0, player_pos=(100.0, 100.0), item_spawn_timer=0.0,
+                 battle_cooldown=0.0, items=None, party=None):
+        self.total_exp = total_exp
+        self.flee_count = flee_count
+        self.player_pos = player_pos
+        self.item_spawn_timer = item_spawn_timer
+        self.battle_cooldown = battle_cooldown
+        self.items = items or []      # [(x, y, heal), ...]
+        self.party = party or []      # [Pokemon, ...]
+
+    def apply(self, game):
+        """저장 내용으로 새 MapScene 을 만들어 게임을 이어서 시작합니다."""
+        from scenes import MapScene
+        game.total_exp = self.total_exp
+        game.flee_count = self.flee_count
+        game.last_gameover_reason = None
+        scene = MapScene(game)
+        if self.party:
+            scene.player_pokemon = self.party[0]
+        x, y = self.player_pos
+        player = scene.player
+        player.pos = [x, y]
+        player.prev_pos = [x, y]
+        player._move_rect(x, y)
+        scene.item_spawn_timer = self.item_spawn_timer
+        scene.battle_cooldown = self.battle_cooldown
+        for ix, iy, heal in self.items:
+            item, _ = scene.item_pool.spawn(ix, iy, heal)
+            scene.item_index.insert(item, item.rect)
+        game.change_scene(scene)
+        return scene
+
+
+# -----------------------------
+# 인코딩 / 디코딩
+# -----------------------------
+def _put_str(out, text):
+    data = text.encode("utf-8")[:255]
+    out.append(len(data))
+    out += data
+
+
+def _get_str(buf, off):
+    n = buf[off]
+    return bytes(buf[off + 1:off + 1 + n]).decode("utf-8"), off + 1 + n
+
+
+def encode_pokemon(out, p):
+    skills = p.skills
+    _put_str(out, p.name)
+    _put_str(out, getattr(p, "growth", DEFAULT_GROWTH))
+    out += POKEMON.pack(p.level, p.exp, p.max_hp, p.current_hp, p.attack, p.defense, p.speed, len(skills))
+    for s in skills:
+        _put_str(out, s.name)
+        out += SKILL.pack(s.power, s.max_pp, s.current_pp)
+
+
+def decode_pokemon(buf, off):
+    name, off = _get_str(buf, off)
+    growth, off = _get_str(buf, off)
+    level, exp, max_hp, current_hp, attack, defense, speed, n_skills = POKEMON.unpack_from(buf, off)
+    off += POKEMON.size
+    skills = []
+    for _ in range(n_skills):
+        sname, off = _get_str(buf, off)
+        power, max_pp, current_pp = SKILL.unpack_from(buf, off)
+        off += SKILL.size
+        skill = Skill(sname, power, max_pp)
+        skill.current_pp = current_pp
+        skills.append(skill)
+    p = Pokemon(name, level, max_hp, attack, defense, speed, skills, growth=growth)
+    p.current_hp = current_hp
+    p.exp = exp
+    return p, off
+
+
+def snapshot(game):
+    """현재 게임 상태를 저장용 bytes 로 만듭니다 (메인 스레드에서 호출).
+
+    맵 씬이 아니면(전투 중 등) 저장할 맵 상태가 없으므로 None 을 돌려줍니다.
+    """
+    scene = game.current_scene
+    if not hasattr(scene, "player_pokemon") or not hasattr(scene, "item_pool"):
+        return None
+    out = bytearray(HEADER.pack(MAGIC, VERSION))
+    out += GAME.pack(int(game.total_exp), int(game.flee_count))
+    x, y = scene.player.pos
+    items = list(scene.item_pool.active)
+    out += MAP.pack(x, y, scene.item_spawn_timer, scene.battle_cooldown, len(items))
+    for it in items:
+        out += ITEM.pack(it.rect.x, it.rect.y, it.heal)
+    # 파티 (지금은 한 마리지만 여러 마리를 담을 수 있는 형식)
+    party = [scene.player_pokemon]
+    out.append(len(party))
+    for p in party:
+        encode_pokemon(out, p)
+    out += CRC.pack(zlib.crc32(out))
+    return bytes(out)
+
+
+def decode(data):
+    if len(data) < HEADER.size + CRC.size:
+        raise SaveError("저장 파일이 너무 짧습니다.")
+    (crc,) = CRC.unpack_from(data, len(data) - CRC.size)
+    body = memoryview(data)[:len(data) - CRC.size]
+    if zlib.crc32(body) != crc:
+        raise SaveError("저장 파일이 손상되었습니다.")
+    magic, version = HEADER.unpack_from(body, 0)
+    if magic != MAGIC:
+        raise SaveError("저장 파일이 아닙니다.")
+    if version != VERSION and version not in OLD_VERSIONS:
+        raise SaveError(f"지원하지 않는 저장 파일 버전입니다: {version}")
+    item_struct = ITEM if version == VERSION else ITEM_V1
+    off = HEADER.size
+    total_exp, flee_count = GAME.unpack_from(body, off)
+    off += GAME.size
+    x, y, spawn_timer, cooldown, n_items = MAP.unpack_from(body, off)
+    off += MAP.size
+    items = []
+    for _ in range(n_items):
+        items.append(item_struct.unpack_from(body, off))
+        off += item_struct.size
+    party = []
+    n_party = body[off]
+    off += 1
+    for _ in range(n_party):
+        p, off = decode_pokemon(body, off)
+        party.append(p)
+    return SaveData(total_exp, flee_count, (x, y), spawn_timer, cooldown, items, party)
+
+
+# -----------------------------
+# 파일 읽기 / 쓰기
+# -----------------------------
+def write_atomic(path, data):
+    # 임시 파일에 다 쓴 뒤 rename 으로 바꿔치기 (쓰는 도중 꺼져도 기존 파일은 그대로)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def save(game, path):
+    """동기 저장 (종료 직전 등). 저장했으면 True."""
+    data = snapshot(game)
+    if data is None:
+        return False
+    write_atomic(path, data)
+    return True
+
+
+def load(path):
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise SaveError(f"저장 파일을 열 수 없습니다: {e}") from e
+    try:
+        return decode(data)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise SaveError("저장 파일이 손상되었습니다.") from e
+
+
+class AutoSaver:
+    """백그라운드 스레드에서 저장 파일을 씁니다.
+
+    request(game) 은 스냅샷(bytes)만 만들어 넘기고 바로 돌아옵니다.
+    쓰기가 밀리면 마지막 스냅샷만 씁니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.saves = 0              # 파일에 쓴 횟수
+        self.last_error = None
+        self._pending = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._worker, name="autosave", daemon=True)
+        self._thread.start()
+
+    def request(self, game):
+        data = snapshot(game)
+        if data is None:
+            return False
+        with self._cond:
+            self._pending = data
+            self._cond.notify()
+        return True
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                data, self._pending = self._pending, None
+                if data is None:
+                    return
+            try:
+                write_atomic(self.path, data)
+                self.saves += 1
+            except Exception as e:
+                # 저장 실패로 게임이 멈추지 않도록 기록만 합니다.
+                self.last_error = e
+
+    def close(self):
+        """남은 스냅샷을 다 쓰고 스레드를 끝냅니다."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
@@ -11,10 +11,36 @@ import random
 import os
 
 # Player 클래스를 가져옵니다. (플레이어의 움직임과 모양 담당)
-from entities import Player
+from entities import Player, ItemPool
+from spatial import SpatialHash
+from tile_world import TileWorld, Camera
+from profiler import PROFILER
+from background_layer import shared_background
+from text_cache import render_text
+from hud import map_hud
 
 # 포켓몬의 능력치와 전투 데이터를 담당하는 Pokemon 클래스를 불러옵니다.
-from base_pokemon import Pokemon
+from base_pokemon import Pokemon, STARTER
+from species_db import shared_species_db
+from sprite_cache import shared_cache
+from asset_loader import shared_loader
+from font_manager import get_font, UI_FONT
+from sprite_atlas import shared_atlas, SpriteBatch
+
+# 맵에 동시에 놓일 수 있는 아이템 최대 개수
+MAX_ITEMS = 16
+# 더티 렉트 목록이 이보다 길어지면 차라리 화면 전체를 다시 그립니다.
+MAX_DIRTY_RECTS = 64
+# 풀숲에서 한 틱(1/60초)마다 야생 포켓몬을 만날 확률
+ENCOUNTER_CHANCE = 0.05
+# 조우 구역에 들어설 때 스프라이트를 미리 읽어 둘 종 수 (확률 높은 순)
+PREFETCH_COUNT = 8
+
+# 회복 아이템 이미지 (작업 스레드에서 읽어 모든 MapScene 이 함께 씁니다)
+ITEM_IMAGE_PATH = os.path.join("assets", "items", "heal.png")
+ITEM_SIZE = (24, 24)
+ITEM_SPRITE = "items/heal"      # 스프라이트 아틀라스 안의 이름
+_item_image = None
 
 
 # -------------------------------------------
@@ -26,6 +52,19 @@ class BaseScene(ABC):
     # 생성자: 모든 Scene은 game 객체(메인 루프)를 공유합니다.
     def __init__(self, game):
         self.game = game  # Game 인스턴스를 저장해, 장면 간 이동(change_scene)에 사용됩니다.
+        # 다음 draw 에서 화면 전체를 다시 그려야 하는지 (처음 그릴 때, 씬 전환 직후)
+        self.needs_full_redraw = True
+
+    # 더티 렉트 모드: Game(dirty_rendering=True) 일 때 켜집니다.
+    # 이 모드에서 draw() 는 바뀐 영역(Rect) 목록을 돌려주고, Game 은 그 영역만 화면에 반영합니다.
+    # 일반 모드에서 draw() 는 None 을 돌려주고 Game 이 화면 전체를 flip 합니다.
+    @property
+    def dirty_mode(self):
+        return getattr(self.game, 'dirty_rendering', False)
+
+    # 다음 프레임에 화면 전체를 다시 그리도록 표시합니다 (씬 전환 시 Game 이 호출).
+    def invalidate(self):
+        self.needs_full_redraw = True
 
     # 하위 클래스에서 반드시 구현해야 할 이벤트 처리 메서드
     @abstractmethod
@@ -53,74 +92,100 @@ class MapScene(BaseScene):
         # 부모 클래스(BaseScene)의 초기화 실행
         super().__init__(game)
 
-        # Player 객체 생성 (시작 위치 x=100, y=100)
-        self.player = Player(100, 100)
-
-        # 스프라이트 그룹을 만들어, 화면에 그릴 객체를 묶습니다.
-        self.all_sprites = pygame.sprite.Group(self.player)
-
-    # 초록색 풀숲 영역을 사각형(Rect)으로 정의합니다.
-        # (x=0, y=400, 너비=800, 높이=200)
-        self.grass_rect = pygame.Rect(0, 400, 800, 200)
+        # 이 맵의 난수 (조우 판정, 야생 포켓몬 선택, 전투 시드, 아이템 위치)
+        # 전투마다 여기서 뽑은 시드로 BattleEngine 의 난수를 따로 만들어, 전투 기록만으로 재현할 수 있습니다.
+        self.rng = random.Random(random.getrandbits(64))
+
+        # 타일 월드: 화면 주변 청크만 올려 두고, 청크마다 미리 그린 Surface 를 씁니다.
+        # 풀숲(조우 구역)은 타일 데이터로 정해집니다. 좌표(플레이어, 아이템)는 모두 월드 좌표입니다.
+        self.world = TileWorld()
+        screen = getattr(game, 'screen', None)
+        view_size = screen.get_size() if screen is not None else (800, 600)
+        # 카메라는 플레이어를 따라가며, 월드 밖은 보여주지 않습니다.
+        self.camera = Camera(view_size, self.world.bounds)
+
+        # Player 객체 생성 (시작 위치 x=100, y=100, 월드 밖으로는 못 나감)
+        self.player = Player(100, 100, bounds=self.world.bounds)
+
+        # 이번 프레임에 바뀐 영역 (아이템 생성/획득 등, 월드 좌표). 더티 렉트 모드에서 사용합니다.
+        self.dirty_rects = []
+        # 더티 렉트 모드에서 마지막으로 그린 카메라 위치 / 플레이어 화면 영역
+        self._camera_drawn = None
+        self._player_drawn = None
+        # 마지막으로 그린 HUD 의 보이는 값 (바뀌었을 때만 HUD 를 다시 그림)
+        self._hud_drawn = None
+        # 청크/아이템/플레이어 blit 을 모아 한 번에 그리는 배치
+        self._batch = SpriteBatch()
 
         # 플레이어가 보유한 첫 번째 포켓몬을 생성합니다.
         # (기본 스타터 포켓몬 — 필요 시 변경)
-        self.player_pokemon = Pokemon("초염몽", level=5, max_hp=35, attack=12, defense=8, speed=10)
-
-        # 배경 이미지 경로 설정(사용자가 이미지를 넣을 수 있도록 경로를 만들어 둡니다)
-        # 기본적으로 프로젝트 루트의 `background.png`를 우선으로 사용하고,
-        # 없다면 assets/backgrounds/background.png 를 시도합니다.
-        candidate_root = os.path.join("background.png")
-        candidate_assets = os.path.join("assets", "backgrounds", "background.png")
-        if os.path.exists(candidate_root):
-            self.background_image_path = candidate_root
-        else:
-            self.background_image_path = candidate_assets
-        self.background_image = None
-        try:
-            if os.path.exists(self.background_image_path):
-                # convert_alpha 허용은 PNG 투명도 지원을 돕습니다.
-                self.background_image = pygame.image.load(self.background_image_path).convert_alpha()
-        except Exception:
-            # 로드 실패 시 무시하고 기본 컬러로 그립니다.
-            self.background_image = None
-
-        # 야생 포켓몬 후보 목록 (이름, 레벨, max_hp, attack, defense, speed)
-        self.wild_candidates = [
-            ("이상해풀", 3, 30, 10, 8, 7),
-            ("꼬부기", 3, 28, 9, 9, 8),
-            ("잉어킹", 4, 30, 14, 6, 8),
-        ]
-
-        # 체력 회복 아이템 관리: 각 아이템은 rect와 heal_amount를 가진 딕셔너리
-        self.items = []
-        self.item_surface = None
-        # 기본 아이템 이미지 경로(사용자가 이미지를 넣을 수 있도록 경로를 준비)
-        item_path = os.path.join("assets", "items", "heal.png")
-        try:
-            if os.path.exists(item_path):
-                self.item_surface = pygame.image.load(item_path).convert_alpha()
-                self.item_surface = pygame.transform.scale(self.item_surface, (24, 24))
-        except Exception:
-            self.item_surface = None
+        name, lvl, hp, atk, df, sp = STARTER
+        self.player_pokemon = Pokemon(name, level=lvl, max_hp=hp, attack=atk, defense=df, speed=sp)
+
+        # 배경 이미지(풀 텍스처)는 모든 MapScene 이 공유하는 배경 레이어가 한 번만 읽고,
+        # 타일 월드가 풀숲 타일 텍스처로 씁니다. 도착하기 전까지는 단색 타일로 그립니다.
+        self.background = shared_background()
+        self.background.load()
+        self.world.set_texture(self.background.image)
+        self._background_version = self.background.version
+
+        # 체력 회복 아이템 관리: 최대 개수가 정해진 풀에서 MapItem(rect, heal)을 재활용합니다.
+        # 공간 해시로 플레이어 주변 아이템만 충돌 검사합니다.
+        self.item_pool = ItemPool(capacity=MAX_ITEMS)
+        self.items = self.item_pool.active
+        self.item_index = SpatialHash()
+        self.item_surface = _item_image
+        # 기본 아이템 이미지(assets/items/heal.png)는 스프라이트 아틀라스에 있으면 아틀라스 시트에서,
+        # 없으면 파일을 작업 스레드에서 읽습니다. 그동안은 대체 이미지를 씁니다.
+        atlas = shared_atlas()
+        if self.item_surface is None and atlas.has(ITEM_SPRITE, ITEM_SIZE):
+            atlas.request(lambda a: self._on_item_image(a.get(ITEM_SPRITE, ITEM_SIZE)))
+        elif self.item_surface is None and os.path.exists(ITEM_IMAGE_PATH):
+            shared_loader().request(ITEM_IMAGE_PATH, ITEM_SIZE, callback=self._on_item_image)
+        # 전투 스프라이트도 아틀라스 시트에 있으므로, 첫 조우 전에 시트를 미리 읽어 둡니다 (한 번만 요청됨).
+        atlas.request()
 
         if self.item_surface is None:
             # 대체: 초록색 원을 그린 Surface
-            s = pygame.Surface((24, 24), pygame.SRCALPHA)
+            s = pygame.Surface(ITEM_SIZE, pygame.SRCALPHA)
             # 변경: 아이템 색을 흰색으로 표시
             pygame.draw.circle(s, (255, 255, 255), (12, 12), 10)
             self.item_surface = s
 
+        # 마지막으로 스프라이트를 미리 읽어 둔 조우 구역 (구역에 새로 들어설 때만 요청)
+        self._prefetched_zone = None
+
         # 아이템 생성 타이머 (초)
         self.item_spawn_timer = 0.0
         self.item_spawn_interval = 8.0  # 초마다 하나씩 생성 시도
         # 전투 재발생 방지를 위한 쿨다운(초)
         self.battle_cooldown = 0.0
-        # UI 폰트 (지도에서 보여줄 작은 HUD용)
-        try:
-            self.ui_font = pygame.font.SysFont("malgungothic", 18)
-        except Exception:
-            self.ui_font = pygame.font.SysFont(None, 18)
+        # UI 폰트 (지도에서 보여줄 작은 HUD용, 모든 씬이 공유)
+        self.ui_font = get_font(UI_FONT, 18)
+        # 우측 상단: 내 포켓몬 이름/레벨, HP 바, HP 수치 (전투 화면과 같은 HUD 위젯)
+        self.hud = map_hud(lambda: self.player_pokemon, self.hud_rect(view_size), self.ui_font)
+
+    # 야생 포켓몬은 종 데이터베이스(data/species.bin)의 구역별 조우표에서 뽑습니다.
+    # (모든 MapScene 이 같은 데이터베이스를 공유하고, 처음 필요할 때 열립니다.)
+    @property
+    def species_db(self):
+        return shared_species_db()
+
+    def _on_item_image(self, image):
+        global _item_image
+        if image is None:
+            return
+        _item_image = image
+        self.item_surface = image
+        self.invalidate()
+
+    def prefetch_encounters(self, zone):
+        """이 구역에서 만날 가능성이 높은 포켓몬(과 내 포켓몬)의 전투 스프라이트를 미리 읽어 둡니다."""
+        from battle import SPRITE_SIZE
+        cache = shared_cache()
+        cache.prefetch(self.player_pokemon.name, SPRITE_SIZE)
+        for species in self.species_db.zone(zone.name).likely(PREFETCH_COUNT):
+            cache.prefetch(species.name, SPRITE_SIZE)
 
     # 이벤트 처리 (현재는 특별한 입력 처리 없음)
     def handle_events(self, events):
@@ -129,7 +194,9 @@ class MapScene(BaseScene):
     # 매 프레임마다 실행되는 업데이트 함수
     def update(self, dt):
         # 키보드 입력 상태를 가져옵니다.
-        keys = pygame.key.get_pressed()
+        # (game.input 이 있으면 그쪽에서 읽어 스크립트/녹화 입력도 받을 수 있게 합니다.)
+        source = getattr(self.game, 'input', None)
+        keys = source.get_pressed() if source is not None else pygame.key.get_pressed()
 
         # 쿨다운 감소
         if getattr(self, 'battle_cooldown', 0.0) > 0.0:
@@ -137,121 +204,173 @@ class MapScene(BaseScene):
 
         # Player 객체의 update() 메서드를 호출하여 이동을 적용합니다.
         self.player.update(dt, keys)
-
-        # 만약 플레이어가 풀숲 영역(grass_rect)에 들어가면 전투 발생 확률 체크
-        if self.player.rect.colliderect(self.grass_rect):
+        # HUD 의 HP 바 애니메이션 (전투에서 돌아왔을 때 등)
+        self.hud.update(dt)
+
+        # 만약 플레이어가 풀숲 등 조우 구역에 들어가면 전투 발생 확률 체크
+        zone = self.in_encounter_zone()
+        # 조우 구역에 막 들어섰으면 전투 스프라이트를 미리 읽기 시작합니다.
+        if zone is not self._prefetched_zone:
+            self._prefetched_zone = zone
+            if zone is not None:
+                self.prefetch_encounters(zone)
+        if zone is not None:
             # battle_cooldown이 0보다 클 때는 전투 발생을 막음
             if getattr(self, 'battle_cooldown', 0.0) <= 0.0:
-                # 0~1 사이의 난수 중 0.05(5%) 확률로 전투 시작
-                if random.random() < 0.05:
+                # 틱마다 ENCOUNTER_CHANCE(5%) 확률로 전투 시작
+                # (update 는 고정 틱으로 실행되므로 화면 프레임 수와 무관하게 같은 비율)
+                if self.rng.random() < ENCOUNTER_CHANCE:
                     # 전투 씬을 불러오기 위해 이 시점에서 import (순환 참조 방지용)
                     from battle import BattleScene
 
-                    # 야생 포켓몬을 후보군에서 무작위로 선택
-                    name, lvl, hp, atk, df, sp = random.choice(self.wild_candidates)
-                    wild = Pokemon(name, level=lvl, max_hp=hp, attack=atk, defense=df, speed=sp)
+                    # 야생 포켓몬을 이 구역의 조우표에서 가중치대로 선택 (O(1))
+                    wild = self.species_db.zone(zone.name).sample(self.rng).create()
 
                     # 게임 장면을 전투 장면(BattleScene)으로 변경합니다.
                     # 인자: 현재 game 객체, 플레이어의 포켓몬, 야생 포켓몬
                     # origin_scene=self 를 넘겨 같은 MapScene 인스턴스로 돌아갈 수 있게 합니다.
-                    self.game.change_scene(BattleScene(self.game, self.player_pokemon, wild, origin_scene=self))
+                    with PROFILER.span("BattleScene.__init__"):
+                        battle = BattleScene(self.game, self.player_pokemon, wild, origin_scene=self,
+                                             seed=self.rng.getrandbits(32))
+                    self.game.change_scene(battle)
 
         # 아이템 스폰 처리
         self.item_spawn_timer += dt
         if self.item_spawn_timer >= self.item_spawn_interval:
             self.item_spawn_timer = 0.0
-            # 땅 영역(예: y=300~580) 안쪽에 랜덤하게 생성
-            x = random.randint(0, max(0, 800 - 24))
-            y = random.randint(300, max(300, 600 - 24))
-            item_rect = pygame.Rect(x, y, 24, 24)
-            self.items.append({"rect": item_rect, "heal": 15})
+            # 플레이어 주변 한 화면 안쪽에 랜덤하게 생성 (월드 좌표)
+            view = self.camera.view_around(self.player.rect)
+            x = self.rng.randint(view.left, max(view.left, view.right - 24))
+            y = self.rng.randint(view.top, max(view.top, view.bottom - 24))
+            item, evicted_rect = self.item_pool.spawn(x, y, 15)
+            if evicted_rect is not None:
+                # 풀이 가득 차 가장 오래된 아이템을 치웠습니다.
+                self.mark_dirty(evicted_rect)
+            self.item_index.insert(item, item.rect)
+            self.mark_dirty(item.rect.copy())
 
         # 플레이어와 아이템 충돌 체크
-        for it in list(self.items):
-            if self.player.rect.colliderect(it["rect"]):
+        for it in self.item_index.query(self.player.rect):
+            if self.player.rect.colliderect(it.rect):
                 # 아이템 획득: 플레이어 포켓몬 체력 회복
                 if hasattr(self, 'player_pokemon') and self.player_pokemon is not None:
-                    heal = it.get("heal", 10)
+                    heal = it.heal or 10
                     prev = self.player_pokemon.current_hp
                     self.player_pokemon.current_hp = min(self.player_pokemon.max_hp, self.player_pokemon.current_hp + heal)
                     # 간단한 피드백
                     print(f"{self.player_pokemon.name} 의 체력이 {prev} -> {self.player_pokemon.current_hp} 으로 회복되었습니다.")
-                try:
-                    self.items.remove(it)
-                except ValueError:
-                    pass
+                self.mark_dirty(it.rect.copy())
+                self.item_index.remove(it)
+                self.item_pool.release(it)
+
+    # 더티 렉트 모드에서 다시 그려야 할 영역을 기록합니다.
+    # 한동안 그리지 않아(예: 창 없는 실행) 목록이 길어지면 다음에 화면 전체를 다시 그립니다.
+    def mark_dirty(self, rect):
+        if self.needs_full_redraw:
+            return
+        self.dirty_rects.append(rect)
+        if len(self.dirty_rects) > MAX_DIRTY_RECTS:
+            self.dirty_rects = []
+            self.needs_full_redraw = True
+
+    def in_encounter_zone(self):
+        """플레이어가 서 있는 조우 구역 (조우표가 있는 구역만, 없으면 None)."""
+        zone = self.world.zone_at(self.player.rect)
+        if zone is not None and self.species_db.zone(zone.name) is not None:
+            return zone
+        return None
 
     # 화면을 그리는 함수
     def draw(self, screen):
-        # 배경 이미지가 있으면 스케일해서 먼저 그립니다. 없으면 기본 색상 사용
-        if self.background_image is not None:
-            try:
-                bg = pygame.transform.scale(self.background_image, screen.get_size())
-                screen.blit(bg, (0, 0))
-            except Exception:
-                screen.fill((150, 200, 255))
-        else:
-            # 하늘색 배경으로 화면 전체를 채웁니다.
-            screen.fill((150, 200, 255))
-
-
-        # 플레이어를 포함한 모든 스프라이트를 화면에 그립니다.
-        self.all_sprites.draw(screen)
-
-        # 아이템 그리기
+        # 플레이어는 직전 틱과 현재 틱 사이 위치에 그려서 움직임을 부드럽게 합니다.
+        self.player.interpolate(getattr(self.game, 'render_alpha', 1.0))
+        # 카메라가 (보간된) 플레이어를 따라가고, 주변 청크를 올리거나 버립니다.
+        self.camera.follow(self.player.rect)
+        self.world.stream(self.camera.rect)
+        # 배경 텍스처가 새로 도착했으면 청크를 다시 그리고 화면 전체를 다시 그립니다.
+        if self.background.version != self._background_version:
+            self._background_version = self.background.version
+            self.world.set_texture(self.background.image)
+            self.needs_full_redraw = True
+        if self.dirty_mode:
+            return self.draw_dirty(screen)
+
+        self.draw_area(screen)
+        self.dirty_rects = []
+
+    def draw_area(self, screen, area=None):
+        """월드(청크), 아이템, 플레이어, HUD 를 한 배치로 그립니다. area(화면 좌표) 를 주면 그 영역만."""
+        if area is not None:
+            screen.set_clip(area)
+        camera = self.camera
+        batch = self._batch
+        self.world.draw(screen, camera, area, batch)
+        view = camera.rect if area is None else camera.to_world(area)
+        ox, oy = camera.rect.topleft
+        item_surface = self.item_surface
         for it in self.items:
-            screen.blit(self.item_surface, it["rect"].topleft)
-
-        # ---------------------------
-        # 우측 상단: 내 포켓몬 HP 표시
-        # ---------------------------
-        if getattr(self, 'player_pokemon', None) is not None:
-            hud_w, hud_h = 180, 56
-            sw = screen.get_width()
-            x = sw - hud_w - 10
-            y = 10
-            # 배경 박스
-            pygame.draw.rect(screen, (240, 240, 240), (x, y, hud_w, hud_h))
-            pygame.draw.rect(screen, (160, 160, 160), (x, y, hud_w, hud_h), 2)
-
-            # 이름과 레벨
-            name_txt = f"{self.player_pokemon.name} Lv{self.player_pokemon.level}"
-            name_surf = self.ui_font.render(name_txt, True, (10, 10, 10))
-            screen.blit(name_surf, (x + 8, y + 6))
-
-            # HP 바
-            hp_x = x + 8
-            hp_y = y + 28
-            hp_w = hud_w - 16
-            hp_h = 14
-            pygame.draw.rect(screen, (100, 100, 100), (hp_x - 1, hp_y - 1, hp_w + 2, hp_h + 2))
-            pygame.draw.rect(screen, (220, 220, 220), (hp_x, hp_y, hp_w, hp_h))
-            cur = max(0, getattr(self.player_pokemon, 'current_hp', 0))
-            m = max(1, getattr(self.player_pokemon, 'max_hp', 1))
-            frac = min(1.0, cur / float(m))
-            fill_w = int(hp_w * frac)
-            if frac > 0.5:
-                color = (88, 200, 115)
-            elif frac > 0.2:
-                color = (240, 200, 80)
-            else:
-                color = (220, 60, 60)
-            if fill_w > 0:
-                pygame.draw.rect(screen, color, (hp_x, hp_y, fill_w, hp_h))
-
-            # HP 수치
-            hp_text = self.ui_font.render(f"{int(cur)}/{int(m)}", True, (10, 10, 10))
-            screen.blit(hp_text, (x + hud_w - 8 - hp_text.get_width(), y + 30))
+            if it.rect.colliderect(view):
+                batch.add(item_surface, (it.rect.x - ox, it.rect.y - oy))
+        if self.player.rect.colliderect(view):
+            batch.add(self.player.image, camera.to_screen(self.player.rect))
+        if area is None or area.colliderect(self.hud_rect(screen.get_size())):
+            self.draw_hud(screen, batch)
+        batch.flush(screen)
+        if area is not None:
+            screen.set_clip(None)
+
+    def draw_dirty(self, screen):
+        """바뀐 부분만 다시 그리고, 바뀐 영역(Rect) 목록을 돌려줍니다.
+
+        카메라가 움직이면 화면 전체가 바뀌므로 전체를 다시 그립니다.
+        (카메라가 월드 가장자리에 멈춰 있거나 플레이어가 서 있을 때만 일부 영역 갱신)
+        """
+        camera_pos = self.camera.rect.topleft
+        player_rect = self.camera.to_screen(self.player.rect)
+        if self.needs_full_redraw or camera_pos != self._camera_drawn:
+            self.needs_full_redraw = False
+            self._camera_drawn = camera_pos
+            self._player_drawn = player_rect
+            self.dirty_rects = []
+            self.draw_area(screen)
+            return [screen.get_rect()]
+
+        # 아이템이 생기거나 사라진 영역, 플레이어가 움직인 영역만 다시 그립니다.
+        changed = [self.camera.to_screen(r) for r in self.dirty_rects]
+        self.dirty_rects = []
+        if player_rect != self._player_drawn:
+            changed.append(self._player_drawn)
+            changed.append(player_rect)
+            self._player_drawn = player_rect
+        # HUD 는 내용이 바뀌었을 때 통째로, 아래쪽이 다시 그려졌을 때는 그 영역만 다시 그립니다.
+        if self.hud.state() != self._hud_drawn:
+            changed.append(self.hud_rect(screen.get_size()))
+        screen_rect = screen.get_rect()
+        rects = []
+        for r in changed:
+            r = r.clip(screen_rect)
+            if r.width and r.height:
+                self.draw_area(screen, r)
+                rects.append(r)
+        return rects
+
+    def hud_rect(self, view_size):
+        hud_w, hud_h = 180, 56
+        return pygame.Rect(view_size[0] - hud_w - 10, 10, hud_w, hud_h)
+
+    # ---------------------------
+    # 우측 상단: 내 포켓몬 HP 표시
+    # ---------------------------
+    def draw_hud(self, screen, batch):
+        self._hud_drawn = self.hud.state()
+        self.hud.draw(screen, batch)
 
 
 class GameOverScene(BaseScene):
     def __init__(self, game):
         super().__init__(game)
-        # 폰트
-        try:
-            self.font = pygame.font.SysFont("malgungothic", 32)
-        except Exception:
-            self.font = pygame.font.SysFont(None, 32)
+        # 폰트 (모든 씬이 공유)
+        self.font = get_font(UI_FONT, 32)
         # 버튼 영역
         self.button_rect = pygame.Rect(300, 360, 200, 60)
 
@@ -268,17 +387,29 @@ class GameOverScene(BaseScene):
         pass
 
     def draw(self, screen):
+        # 더티 렉트 모드: 게임오버 화면은 내용이 바뀔 때만 다시 그립니다.
+        if self.dirty_mode:
+            state = (getattr(self.game, 'last_gameover_reason', ''), getattr(self.game, 'total_exp', 0))
+            if not self.needs_full_redraw and state == getattr(self, '_drawn_state', None):
+                return []
+            self.needs_full_redraw = False
+            self._drawn_state = state
+            self.draw_scene(screen)
+            return [screen.get_rect()]
+        self.draw_scene(screen)
+
+    def draw_scene(self, screen):
         screen.fill((40, 40, 40))
-        title = self.font.render("Game Over", True, (240, 240, 240))
+        title = render_text(self.font, "Game Over", (240, 240, 240))
         screen.blit(title, (320, 200))
         reason = getattr(self.game, 'last_gameover_reason', '')
-        reason_text = self.font.render(reason, True, (240, 240, 240))
+        reason_text = render_text(self.font, reason, (240, 240, 240))
         screen.blit(reason_text, (240, 230))
         total = getattr(self.game, 'total_exp', 0)
-        info = self.font.render(f"획득한 총 EXP: {total}", True, (240, 240, 240))
+        info = render_text(self.font, f"획득한 총 EXP: {total}", (240, 240, 240))
         screen.blit(info, (260, 270))
 
         # 버튼
         pygame.draw.rect(screen, (200, 100, 100), self.button_rect)
-        btn_text = self.font.render("다시 시작", True, (255, 255, 255))
+        btn_text = render_text(self.font, "다시 시작", (255, 255, 255))
         screen.blit(btn_text, (self.button_rect.x + 36, self.button_rect.y + 12))
@@ -0,0 +1,78 @@
+# spatial.py
+# 균일 격자(uniform grid) 공간 해시입니다.
+# 맵 위의 물체(아이템, 조우 구역 등)를 칸(cell) 단위로 나눠 보관해서,
+# "플레이어 주변에 뭐가 있지?" 를 물체 개수와 상관없이 주변 몇 칸만 보고 답할 수 있게 합니다.
+
+DEFAULT_CELL_SIZE = 64
+
+
+class SpatialHash:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}     # (cx, cy) -> 그 칸에 걸친 물체 목록
+        self._where = {}    # 물체 -> 그 물체가 들어 있는 칸 목록
+
+    def _cells_for(self, rect):
+        cs = self.cell_size
+        x0 = rect.left // cs
+        y0 = rect.top // cs
+        # right/bottom 은 rect 바깥 좌표이므로 1 을 빼서 마지막 픽셀이 속한 칸을 구합니다.
+        x1 = (rect.right - 1) // cs
+        y1 = (rect.bottom - 1) // cs
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, obj, rect):
+        """obj 를 rect 가 걸친 칸들에 등록합니다 (이미 있으면 위치를 갱신)."""
+        if obj in self._where:
+            self.remove(obj)
+        keys = self._cells_for(rect)
+        cells = self.cells
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [obj]
+            else:
+                bucket.append(obj)
+        self._where[obj] = keys
+
+    def remove(self, obj):
+        keys = self._where.pop(obj, None)
+        if keys is None:
+            return
+        cells = self.cells
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket is None:
+                continue
+            try:
+                bucket.remove(obj)
+            except ValueError:
+                pass
+            if not bucket:
+                # 빈 칸은 지워서 오래 플레이해도 칸 수가 늘지 않게 합니다.
+                del cells[key]
+
+    def query(self, rect):
+        """rect 가 걸친 칸들에 등록된 물체 후보를 돌려줍니다 (정확한 충돌 검사는 호출한 쪽에서)."""
+        cells = self.cells
+        keys = self._cells_for(rect)
+        if len(keys) == 1:
+            bucket = cells.get(keys[0])
+            return list(bucket) if bucket else []
+        found = {}
+        for key in keys:
+            bucket = cells.get(key)
+            if bucket:
+                for obj in bucket:
+                    found[obj] = None
+        return list(found)
+
+    def clear(self):
+        self.cells.clear()
+        self._where.clear()
+
+    def __contains__(self, obj):
+        return obj in self._where
+
+    def __len__(self):
+        return len(self._where)
@@ -0,0 +1,348 @@
+# species_db.py
+# 포켓몬 종(species) 데이터베이스입니다.
+#  - data/species.json (사람이 고치는 원본) 을 작은 바이너리 파일 data/species.bin 으로 변환해 씁니다.
+#  - 바이너리 파일은 mmap 으로 열고, 필요한 종만 그때그때 해독(lazy decode)합니다.
+#    그래서 종 수가 늘어나도 시작 시간이 늘지 않습니다.
+#  - id / 이름 색인은 파일 안에 정렬된 표로 들어 있어 이진 탐색으로 찾습니다.
+#  - 구역(zone)별 조우표는 Alias method 표로 미리 만들어 두어, 표 크기와 상관없이 O(1)로 뽑습니다.
+#
+# 데이터 고친 뒤 다시 만들기:  python species_db.py build
+import json
+import mmap
+import os
+import random
+import struct
+
+from base_pokemon import Pokemon, STARTER, WILD_CANDIDATES
+
+DATA_DIR = "data"
+SOURCE_PATH = os.path.join(DATA_DIR, "species.json")
+DB_PATH = os.path.join(DATA_DIR, "species.bin")
+
+MAGIC = b"PKSP"
+VERSION = 1
+
+# 파일 구조 (모두 little-endian)
+#   헤더 | 종 레코드(id 순) | 이름 색인(이름 순) | 구역 목록 | 구역별 alias 표 | 문자열(UTF-8)
+HEADER = struct.Struct("<4sHHHHIIII")   # magic, version, 종 수, 구역 수, 예비, 각 구역 시작 위치 4개
+SPECIES = struct.Struct("<HHHHHHIH")    # id, level, max_hp, attack, defense, speed, 이름 위치, 이름 길이
+NAME_ENTRY = struct.Struct("<IHH")      # 이름 위치, 이름 길이, 종 레코드 번호
+ZONE_ENTRY = struct.Struct("<IHHI")     # 이름 위치, 이름 길이, 항목 수, alias 표 위치
+ALIAS_ENTRY = struct.Struct("<fHH")     # 확률, alias 번호, 종 레코드 번호
+
+
+class Species:
+    """해독된 종 데이터 하나."""
+
+    __slots__ = ("id", "name", "level", "max_hp", "attack", "defense", "speed")
+
+    def __init__(self, id, name, level, max_hp, attack, defense, speed):
+        self.id = id
+        self.name = name
+        self.level = level
+        self.max_hp = max_hp
+        self.attack = attack
+        self.defense = defense
+        self.speed = speed
+
+    def create(self):
+        """이 종의 새 Pokemon 을 만듭니다."""
+        return Pokemon(self.name, level=self.level, max_hp=self.max_hp, attack=self.attack,
+                       defense=self.defense, speed=self.speed)
+
+    def __repr__(self):
+        return f"Species({self.id}, {self.name!r}, Lv{self.level})"
+
+
+def build_alias(weights):
+    """가중치 목록으로 Vose 의 alias method 표 (prob, alias) 를 만듭니다."""
+    n = len(weights)
+    total = float(sum(weights))
+    if n == 0 or total <= 0:
+        raise ValueError("조우표에는 가중치가 양수인 항목이 하나 이상 있어야 합니다.")
+    scaled = [w * n / total for w in weights]
+    prob = [0.0] * n
+    alias = [0] * n
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s = small.pop()
+        g = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = g
+        scaled[g] = scaled[g] + scaled[s] - 1.0
+        (small if scaled[g] < 1.0 else large).append(g)
+    for i in large + small:
+        # 남은 항목은 (부동소수 오차를 제외하면) 확률 1
+        prob[i] = 1.0
+        alias[i] = i
+    return prob, alias
+
+
+def encode(species, zones):
+    """종 목록과 구역별 조우표를 바이너리로 만듭니다.
+
+    species: (id, name, level, max_hp, attack, defense, speed) 목록
+    zones:   {구역 이름: [(종 id, 가중치), ...]}
+    """
+    species = sorted(species, key=lambda s: s[0])
+    slot_of = {s[0]: i for i, s in enumerate(species)}
+    if len(slot_of) != len(species):
+        raise ValueError("종 id 가 중복되었습니다.")
+
+    strings = bytearray()
+    string_pos = {}
+
+    def put(text):
+        data = text.encode("utf-8")
+        if data not in string_pos:
+            string_pos[data] = len(strings)
+            strings.extend(data)
+        return string_pos[data], len(data)
+
+    species_blob = bytearray()
+    names = []
+    for slot, (sid, name, level, max_hp, attack, defense, speed) in enumerate(species):
+        off, ln = put(name)
+        species_blob += SPECIES.pack(sid, level, max_hp, attack, defense, speed, off, ln)
+        names.append((name.encode("utf-8"), off, ln, slot))
+
+    names.sort(key=lambda n: n[0])
+    name_blob = b"".join(NAME_ENTRY.pack(off, ln, slot) for _, off, ln, slot in names)
+
+    zone_items = sorted(zones.items())
+    zone_dir_size = ZONE_ENTRY.size * len(zone_items)
+    species_off = HEADER.size
+    name_off = species_off + len(species_blob)
+    zones_off = name_off + len(name_blob)
+    tables_off = zones_off + zone_dir_size
+
+    zone_blob = bytearray()
+    table_blob = bytearray()
+    for zname, entries in zone_items:
+        entries = [(sid, w) for sid, w in entries if w > 0]
+        prob, alias = build_alias([w for _, w in entries])
+        off, ln = put(zname)
+        zone_blob += ZONE_ENTRY.pack(off, ln, len(entries), tables_off + len(table_blob))
+        for i, (sid, _) in enumerate(entries):
+            table_blob += ALIAS_ENTRY.pack(prob[i], alias[i], slot_of[sid])
+
+    strings_off = tables_off + len(table_blob)
+    header = HEADER.pack(MAGIC, VERSION, len(species), len(zone_items), 0,
+                         species_off, name_off, zones_off, strings_off)
+    return bytes(header + species_blob + name_blob + zone_blob + table_blob + strings)
+
+
+class EncounterTable:
+    """한 구역의 조우표. sample() 은 항목 수와 상관없이 O(1) 입니다."""
+
+    def __init__(self, db, name, count, table_off):
+        self.db = db
+        self.name = name
+        self.count = count
+        self.table_off = table_off
+
+    def sample(self, rng=random):
+        """가중치에 따라 종 하나를 뽑아 Species 로 돌려줍니다."""
+        u = rng.random() * self.count
+        i = int(u)
+        if i >= self.count:
+            i = self.count - 1
+        prob, alias, slot = ALIAS_ENTRY.unpack_from(self.db.buf, self.table_off + i * ALIAS_ENTRY.size)
+        if u - i >= prob:
+            _, _, slot = ALIAS_ENTRY.unpack_from(self.db.buf, self.table_off + alias * ALIAS_ENTRY.size)
+        return self.db.species_at(slot)
+
+    def likely(self, k):
+        """나올 확률이 높은 종 k 개를 확률 순으로 돌려줍니다 (스프라이트 미리 읽기용, O(항목 수))."""
+        n = self.count
+        entries = [ALIAS_ENTRY.unpack_from(self.db.buf, self.table_off + i * ALIAS_ENTRY.size)
+                   for i in range(n)]
+        # 항목 i 의 확률 = (자기 칸의 prob + i 를 alias 로 가리키는 칸들의 1 - prob) / n
+        mass = [prob for prob, _, _ in entries]
+        for prob, alias, _ in entries:
+            if prob < 1.0:
+                mass[alias] += 1.0 - prob
+        order = sorted(range(n), key=lambda i: mass[i], reverse=True)[:k]
+        return [self.db.species_at(entries[i][2]) for i in order]
+
+    def __len__(self):
+        return self.count
+
+
+class SpeciesDB:
+    def __init__(self, buf, owner=None):
+        self.buf = buf          # bytes 또는 mmap
+        self._owner = owner     # mmap 객체 (닫을 때 사용)
+        (magic, version, self.species_count, self.zone_count, _,
+         self._species_off, self._name_off, self._zones_off, self._strings_off) = HEADER.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError("종 데이터베이스 파일이 아닙니다.")
+        if version != VERSION:
+            raise ValueError(f"지원하지 않는 종 데이터베이스 버전입니다: {version}")
+        self._decoded = {}      # 레코드 번호 -> Species (한 번 해독한 것만 보관)
+        self._zones = {}
+
+    @classmethod
+    def open(cls, path=DB_PATH):
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(mm, owner=mm)
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(data)
+
+    def close(self):
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def _string(self, off, ln):
+        start = self._strings_off + off
+        return bytes(self.buf[start:start + ln]).decode("utf-8")
+
+    def _raw_name(self, off, ln):
+        start = self._strings_off + off
+        return bytes(self.buf[start:start + ln])
+
+    # -----------------------------
+    # 종 조회
+    # -----------------------------
+    def species_at(self, slot):
+        sp = self._decoded.get(slot)
+        if sp is None:
+            sid, level, max_hp, attack, defense, speed, off, ln = SPECIES.unpack_from(
+                self.buf, self._species_off + slot * SPECIES.size)
+            sp = Species(sid, self._string(off, ln), level, max_hp, attack, defense, speed)
+            self._decoded[slot] = sp
+        return sp
+
+    def get(self, species_id):
+        """id 로 종을 찾습니다 (레코드가 id 순이라 이진 탐색). 없으면 None."""
+        lo, hi = 0, self.species_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (sid,) = struct.unpack_from("<H", self.buf, self._species_off + mid * SPECIES.size)
+            if sid < species_id:
+                lo = mid + 1
+            elif sid > species_id:
+                hi = mid
+            else:
+                return self.species_at(mid)
+        return None
+
+    def by_name(self, name):
+        """이름으로 종을 찾습니다 (이름 색인 이진 탐색). 없으면 None."""
+        key = name.encode("utf-8")
+        lo, hi = 0, self.species_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            off, ln, slot = NAME_ENTRY.unpack_from(self.buf, self._name_off + mid * NAME_ENTRY.size)
+            raw = self._raw_name(off, ln)
+            if raw < key:
+                lo = mid + 1
+            elif raw > key:
+                hi = mid
+            else:
+                return self.species_at(slot)
+        return None
+
+    def __len__(self):
+        return self.species_count
+
+    def __iter__(self):
+        for slot in range(self.species_count):
+            yield self.species_at(slot)
+
+    # -----------------------------
+    # 구역별 조우표
+    # -----------------------------
+    def zone(self, name):
+        """구역 이름의 EncounterTable (없으면 None)."""
+        table = self._zones.get(name)
+        if table is not None:
+            return table
+        key = name.encode("utf-8")
+        lo, hi = 0, self.zone_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            off, ln, count, table_off = ZONE_ENTRY.unpack_from(self.buf, self._zones_off + mid * ZONE_ENTRY.size)
+            raw = self._raw_name(off, ln)
+            if raw < key:
+                lo = mid + 1
+            elif raw > key:
+                hi = mid
+            else:
+                table = self._zones[name] = EncounterTable(self, name, count, table_off)
+                return table
+        return None
+
+    def zone_names(self):
+        names = []
+        for i in range(self.zone_count):
+            off, ln, _, _ = ZONE_ENTRY.unpack_from(self.buf, self._zones_off + i * ZONE_ENTRY.size)
+            names.append(self._string(off, ln))
+        return names
+
+
+# -----------------------------
+# 원본(JSON) 읽기 / 빌드
+# -----------------------------
+def default_source():
+    # data/species.json 이 없을 때 쓰는 기본 데이터 (스타터 + 풀숲 야생 후보)
+    species = []
+    for sid, (name, level, max_hp, attack, defense, speed) in enumerate((STARTER,) + WILD_CANDIDATES, 1):
+        species.append((sid, name, level, max_hp, attack, defense, speed))
+    zones = {"grass": [(sid, 1) for sid in range(2, len(species) + 1)]}
+    return species, zones
+
+
+def load_source(path=SOURCE_PATH):
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    species = [(s["id"], s["name"], s["level"], s["max_hp"], s["attack"], s["defense"], s["speed"])
+               for s in data["species"]]
+    zones = {name: [(e["species"], e["weight"]) for e in entries]
+             for name, entries in data["zones"].items()}
+    return species, zones
+
+
+def build(source_path=SOURCE_PATH, db_path=DB_PATH):
+    species, zones = load_source(source_path) if os.path.exists(source_path) else default_source()
+    data = encode(species, zones)
+    os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+    tmp = db_path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, db_path)
+    return len(data)
+
+
+# 프로세스 전체에서 함께 쓰는 데이터베이스 (처음 필요할 때 한 번만 엽니다)
+_shared = None
+
+
+def shared_species_db():
+    global _shared
+    if _shared is None:
+        if os.path.exists(DB_PATH):
+            _shared = SpeciesDB.open(DB_PATH)
+        else:
+            # 빌드된 파일이 없으면 원본/기본 데이터로 메모리에서 만듭니다.
+            species, zones = load_source() if os.path.exists(SOURCE_PATH) else default_source()
+            _shared = SpeciesDB.from_bytes(encode(species, zones))
+    return _shared
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) > 1 and sys.argv[1] == "build":
+        size = build()
+        print(f"{DB_PATH} 생성 ({size} bytes)")
+    else:
+        db = shared_species_db()
+        for sp in db:
+            print(sp)
+        for name in db.zone_names():
+            print(f"zone {name}: {len(db.zone(name))} 종")
@@ -0,0 +1,249 @@
+# sprite_atlas.py
+# 스프라이트 아틀라스: 프로젝트 루트와 assets/ 의 스프라이트를 그려질 크기로 미리 스케일해
+# 큰 시트 몇 장(data/atlas_N.png)에 모아 두고, 위치 표(data/atlas.json)로 찾아 씁니다.
+#  - 빌드는 개발할 때 한 번: python sprite_atlas.py build (스프라이트를 추가/수정한 뒤 다시 실행)
+#  - 게임에서는 시트 몇 장만 읽으면 되므로 포켓몬이 늘어나도 파일 읽기/스케일/Surface 수가 늘지 않습니다.
+#  - 시트는 asset_loader 작업 스레드에서 읽고, 준비되기 전에는 sprite_cache 가 원래 파일을 씁니다.
+#  - SpriteBatch: 한 프레임의 blit 들을 모아 Surface.blits 한 번으로 그립니다 (blit 마다 드는 파이썬 비용 절약).
+#
+# 아틀라스 표 (JSON)
+#   {"version": 1, "sheets": ["atlas_0.png", ...],
+#    "sprites": [[이름, 너비, 높이, 시트 번호, x, y], ...]}
+import json
+import os
+import sys
+
+import pygame
+
+from asset_loader import shared_loader
+
+ATLAS_DIR = "data"
+ATLAS_INDEX = os.path.join(ATLAS_DIR, "atlas.json")
+ATLAS_VERSION = 1
+SHEET_SIZE = 1024       # 시트 한 장의 최대 크기 (px)
+PADDING = 1             # 스프라이트 사이 여백 (스케일/필터링 시 옆 스프라이트가 번지지 않도록)
+
+# 아틀라스에 넣지 않는 이미지 (스프라이트가 아닌 큰 그림)
+EXCLUDE = {"background"}
+ITEM_DIR = os.path.join("assets", "items")
+
+
+def atlas_sources():
+    """아틀라스에 넣을 (이름, 파일 경로, 크기) 목록. 크기는 게임에서 그리는 크기입니다."""
+    from sprite_cache import AssetIndex
+    from battle import SPRITE_SIZE
+    from scenes import ITEM_SIZE
+    sources = []
+    # 포켓몬 전투 스프라이트 (sprite_cache 와 같은 폴더/우선순위)
+    for name, path in sorted(AssetIndex().paths.items()):
+        if name not in EXCLUDE:
+            sources.append((name, path, SPRITE_SIZE))
+    # 맵 아이템 (이름 앞에 "items/")
+    for name, path in sorted(AssetIndex(dirs=(ITEM_DIR,)).paths.items()):
+        sources.append(("items/" + name, path, ITEM_SIZE))
+    return sources
+
+
+# -----------------------------
+# 🧩 빌드
+# -----------------------------
+def pack(sizes, sheet_size=SHEET_SIZE, padding=PADDING):
+    """(너비, 높이) 목록을 선반(shelf) 방식으로 시트에 배치합니다.
+
+    반환값: (배치 목록 [(시트 번호, x, y), ...] (입력 순서), 시트별 사용 크기 [(w, h), ...])
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    places = [None] * len(sizes)
+    sheets = []
+    sheet = x = y = shelf_h = 0
+    used_w = 0
+    for i in order:
+        w, h = sizes[i]
+        if w > sheet_size or h > sheet_size:
+            raise ValueError(f"스프라이트가 시트보다 큽니다: {w}x{h}")
+        if x + w > sheet_size:
+            # 다음 선반
+            x = 0
+            y += shelf_h + padding
+            shelf_h = 0
+        if y + h > sheet_size:
+            # 다음 시트
+            sheets.append((used_w, y))
+            sheet += 1
+            x = y = shelf_h = used_w = 0
+        places[i] = (sheet, x, y)
+        x += w + padding
+        shelf_h = max(shelf_h, h)
+        used_w = max(used_w, x - padding)
+    if sizes:
+        sheets.append((used_w, y + shelf_h))
+    return places, sheets
+
+
+def build(out_dir=ATLAS_DIR, sources=None):
+    """스프라이트를 스케일해 시트 PNG 와 아틀라스 표를 만듭니다. 표 경로를 돌려줍니다."""
+    from asset_loader import _scale
+    sources = atlas_sources() if sources is None else sources
+    images = []
+    for name, path, size in sources:
+        try:
+            image = pygame.image.load(path)
+            if image.get_size() != tuple(size):
+                image = _scale(image, size)
+        except Exception as e:
+            print(f"건너뜀 {path}: {e}")
+            continue
+        images.append((name, image))
+    places, sheet_sizes = pack([image.get_size() for _, image in images])
+    sheets = [pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA, 32) for w, h in sheet_sizes]
+    entries = []
+    for (name, image), (sheet, x, y) in zip(images, places):
+        sheets[sheet].blit(image, (x, y))
+        w, h = image.get_size()
+        entries.append([name, w, h, sheet, x, y])
+    os.makedirs(out_dir, exist_ok=True)
+    names = []
+    for i, surf in enumerate(sheets):
+        fname = f"atlas_{i}.png"
+        pygame.image.save(surf, os.path.join(out_dir, fname))
+        names.append(fname)
+    index = os.path.join(out_dir, os.path.basename(ATLAS_INDEX))
+    # 스프라이트 한 줄에 하나씩 (다시 빌드했을 때 diff 가 읽기 쉽도록)
+    with open(index, "w", encoding="utf-8") as f:
+        f.write('{"version": %d,\n "sheets": %s,\n "sprites": [\n  ' % (ATLAS_VERSION, json.dumps(names)))
+        f.write(",\n  ".join(json.dumps(e, ensure_ascii=False) for e in entries))
+        f.write("\n ]}\n")
+    return index
+
+
+# -----------------------------
+# 🗺️ 게임에서 쓰는 아틀라스
+# -----------------------------
+class SpriteAtlas:
+    def __init__(self, index_path=ATLAS_INDEX):
+        self.index_path = index_path
+        self.entries = {}           # (이름, (w, h)) -> (시트 번호, Rect)
+        self.sheet_paths = []
+        self.sheets = []            # 시트 Surface (읽히기 전에는 None)
+        self._subsurfaces = {}
+        self._requested = False
+        self._callbacks = []
+        # 아틀라스 표가 없거나 깨졌으면 빈 아틀라스 (모든 스프라이트를 원래 파일에서 읽음)
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == ATLAS_VERSION:
+                base = os.path.dirname(index_path)
+                self.sheet_paths = [os.path.join(base, name) for name in data["sheets"]]
+                for name, w, h, sheet, x, y in data["sprites"]:
+                    self.entries[(name, (w, h))] = (sheet, pygame.Rect(x, y, w, h))
+        except (OSError, ValueError, KeyError, TypeError):
+            self.entries = {}
+            self.sheet_paths = []
+        self.sheets = [None] * len(self.sheet_paths)
+
+    def request(self, callback=None):
+        """시트를 작업 스레드에서 읽도록 요청합니다 (한 번만). 모두 준비되면 callback(atlas)."""
+        if self.ready:
+            if callback is not None:
+                callback(self)
+            return
+        if callback is not None:
+            self._callbacks.append(callback)
+        if self._requested:
+            return
+        self._requested = True
+        loader = shared_loader()
+        for i, path in enumerate(self.sheet_paths):
+            loader.request(path, None, alpha=True, callback=lambda image, i=i: self._on_sheet(i, image))
+
+    def _on_sheet(self, i, image):
+        if image is None:
+            # 시트를 읽지 못하면 그 시트의 스프라이트는 아틀라스에서 빼고 원래 파일을 씁니다.
+            self.entries = {k: v for k, v in self.entries.items() if v[0] != i}
+            image = False
+        self.sheets[i] = image
+        if self.ready:
+            callbacks, self._callbacks = self._callbacks, []
+            for callback in callbacks:
+                callback(self)
+
+    @property
+    def ready(self):
+        return all(sheet is not None for sheet in self.sheets)
+
+    def has(self, name, size):
+        return (name, tuple(size)) in self.entries
+
+    def region(self, name, size):
+        """(시트 Surface, 영역 Rect). 아틀라스에 없거나 시트가 아직 없으면 None."""
+        entry = self.entries.get((name, tuple(size)))
+        if entry is None:
+            return None
+        sheet = self.sheets[entry[0]]
+        if not sheet:
+            return None
+        return sheet, entry[1]
+
+    def get(self, name, size):
+        """스프라이트를 시트의 subsurface 로 돌려줍니다 (픽셀은 시트와 공유). 없으면 None."""
+        key = (name, tuple(size))
+        surf = self._subsurfaces.get(key)
+        if surf is None:
+            region = self.region(name, size)
+            if region is None:
+                return None
+            surf = self._subsurfaces[key] = region[0].subsurface(region[1])
+        return surf
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class SpriteBatch:
+    """한 프레임의 blit 을 모아 두었다가 Surface.blits 한 번으로 그립니다.
+
+    겹치는 순서는 add 한 순서 그대로입니다. 사이에 다른 그리기(도형 등)가 끼면 그 전에 flush 하세요.
+    """
+
+    __slots__ = ("items",)
+
+    def __init__(self):
+        self.items = []
+
+    def add(self, surface, dest, area=None):
+        if area is None:
+            self.items.append((surface, dest))
+        else:
+            self.items.append((surface, dest, area))
+
+    def flush(self, target):
+        if self.items:
+            target.blits(self.items, doreturn=False)
+            self.items.clear()
+
+    def __len__(self):
+        return len(self.items)
+
+
+# 프로세스 전체에서 함께 쓰는 아틀라스
+_shared = None
+
+
+def shared_atlas():
+    global _shared
+    if _shared is None:
+        _shared = SpriteAtlas()
+    return _shared
+
+
+if __name__ == "__main__":
+    # python sprite_atlas.py build : 스프라이트를 모아 data/atlas_N.png + data/atlas.json 만들기
+    if len(sys.argv) > 1 and sys.argv[1] == "build":
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+        path = build()
+        atlas = SpriteAtlas(path)
+        print(f"{path}: 스프라이트 {len(atlas)}개, 시트 {len(atlas.sheet_paths)}장")
+    else:
+        print("사용법: python sprite_atlas.py build")
@@ -0,0 +1,188 @@
+# sprite_cache.py
+# 포켓몬 전투 이미지를 프로세스 전체에서 공유하는 스프라이트 캐시입니다.
+#  - 이미지 폴더 목록(인덱스)은 처음 한 번만 만들고, 전투마다 os.path.exists 로 뒤지지 않습니다.
+#  - (포켓몬 이름, 크기) 별로 스케일까지 끝난 Surface 를 보관하므로
+#    같은 포켓몬을 다시 만나면 디스크 읽기도, smoothscale 도 하지 않습니다.
+#  - 메모리 상한을 넘으면 가장 오래 안 쓴 항목부터 버립니다(LRU).
+#  - prefetch() / get_async() 는 asset_loader 작업 스레드에서 읽고 스케일해 캐시에 채워 둡니다.
+#  - 스프라이트 아틀라스(sprite_atlas)에 있는 스프라이트는 파일 대신 아틀라스 시트의 subsurface 를 씁니다.
+import os
+from collections import OrderedDict
+
+import pygame
+
+from asset_loader import shared_loader
+from sprite_atlas import shared_atlas
+
+# 이미지를 찾는 폴더 (앞쪽이 우선) 와 확장자 우선순위
+SPRITE_DIRS = ("", os.path.join("assets", "pokemon"))
+SPRITE_EXTS = ("png", "jpg", "jpeg")
+
+# 기본 메모리 상한: 16MB (120x120 32비트 스프라이트 약 290장)
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+
+class AssetIndex:
+    """이미지 폴더를 한 번 훑어 '이름 -> 파일 경로' 표를 만들어 둡니다."""
+
+    def __init__(self, dirs=SPRITE_DIRS, exts=SPRITE_EXTS):
+        self.dirs = dirs
+        self.exts = exts
+        self.paths = {}
+        self.rebuild()
+
+    def rebuild(self):
+        # 폴더/확장자 우선순위가 높은 것이 먼저 등록되도록 순서대로 훑습니다.
+        paths = {}
+        for d in self.dirs:
+            try:
+                names = os.listdir(d or ".")
+            except OSError:
+                continue
+            found = {}
+            for fname in names:
+                stem, dot, ext = fname.rpartition(".")
+                if dot and ext.lower() in self.exts:
+                    found.setdefault(stem, {})[ext.lower()] = os.path.join(d, fname)
+            for stem, by_ext in found.items():
+                if stem in paths:
+                    continue
+                for e in self.exts:
+                    if e in by_ext:
+                        paths[stem] = by_ext[e]
+                        break
+        self.paths = paths
+
+    def find(self, name):
+        return self.paths.get(name)
+
+
+class SpriteCache:
+    """(이름, 크기) -> 스케일된 Surface 를 보관하는 LRU 캐시."""
+
+    def __init__(self, index=None, max_bytes=DEFAULT_MAX_BYTES):
+        self._index = index
+        self.max_bytes = max_bytes
+        self.bytes_used = 0
+        self._entries = OrderedDict()   # key -> (surface, nbytes)
+        self._missing = set()           # 파일이 없거나 로드에 실패한 이름
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def index(self):
+        # 인덱스는 처음 필요할 때 한 번만 만듭니다.
+        if self._index is None:
+            self._index = AssetIndex()
+        return self._index
+
+    def get(self, name, size):
+        """스케일된 스프라이트를 돌려줍니다. 이미지가 없으면 None."""
+        key = (name, tuple(size))
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if name in self._missing:
+            return None
+        surf = shared_atlas().get(name, key[1])
+        if surf is not None:
+            self.hits += 1
+            return surf
+
+        self.misses += 1
+        surf = self._load(name, key[1])
+        if surf is None:
+            self._missing.add(name)
+            return None
+        self._store(key, surf)
+        return surf
+
+    def peek(self, name, size):
+        """캐시에 이미 있는 스프라이트만 돌려줍니다 (없으면 None, 디스크는 건드리지 않음)."""
+        key = (name, tuple(size))
+        entry = self._entries.get(key)
+        if entry is None:
+            surf = shared_atlas().get(name, key[1])
+            if surf is not None:
+                self.hits += 1
+            return surf
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def is_missing(self, name):
+        """이미지 파일이 없거나 읽기에 실패한 이름인지."""
+        return name in self._missing
+
+    def prefetch(self, name, size):
+        """스프라이트를 작업 스레드에서 읽어 캐시에 넣도록 요청합니다 (이미 있거나 없는 파일이면 무시)."""
+        key = (name, tuple(size))
+        if key in self._entries or name in self._missing:
+            return
+        atlas = shared_atlas()
+        if atlas.has(name, key[1]):
+            # 아틀라스 시트가 오면 그걸 씁니다 (시트를 읽지 못해 빠졌으면 그때 원래 파일을 요청).
+            if not atlas.ready:
+                atlas.request(lambda a: None if a.has(name, key[1]) else self.prefetch(name, size))
+            return
+        path = self.index.find(name)
+        if not path:
+            self._missing.add(name)
+            return
+
+        def done(surf):
+            if surf is None:
+                self._missing.add(name)
+            elif key not in self._entries:
+                self.misses += 1
+                self._store(key, surf)
+
+        shared_loader().request(path, key[1], alpha=True, callback=done)
+
+    def get_async(self, name, size):
+        """캐시에 있으면 바로 돌려주고, 없으면 읽기를 요청한 뒤 None (그동안 대체 이미지를 그리세요)."""
+        surf = self.peek(name, size)
+        if surf is None:
+            self.prefetch(name, size)
+        return surf
+
+    def _load(self, name, size):
+        path = self.index.find(name)
+        if not path:
+            return None
+        try:
+            image = pygame.image.load(path).convert_alpha()
+            return pygame.transform.smoothscale(image, size)
+        except Exception:
+            return None
+
+    def _store(self, key, surf):
+        nbytes = surf.get_width() * surf.get_height() * surf.get_bytesize()
+        self._entries[key] = (surf, nbytes)
+        self.bytes_used += nbytes
+        # 상한을 넘으면 오래된 것부터 제거 (방금 넣은 항목은 남겨둠)
+        while self.bytes_used > self.max_bytes and len(self._entries) > 1:
+            _, (_, old_bytes) = self._entries.popitem(last=False)
+            self.bytes_used -= old_bytes
+
+    def clear(self):
+        self._entries.clear()
+        self._missing.clear()
+        self.bytes_used = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# 프로세스 전체에서 공유하는 기본 캐시
+_shared = None
+
+
+def shared_cache():
+    global _shared
+    if _shared is None:
+        _shared = SpriteCache()
+    return _shared
+
@@ -0,0 +1,70 @@
+# startup.py
+# 게임 시작 과정(모듈 import, pygame 초기화, 첫 씬 생성, 첫 프레임, 지연 로딩)의 시간을 재는 도구입니다.
+#  - game.py 가 가장 먼저 import 하므로, 기준 시각은 거의 프로세스 시작 직후입니다.
+#  - python game.py --startup-report 로 단계별 시간을 출력하고,
+#    --startup-budget MS 를 주면 첫 프레임까지 걸린 시간이 예산을 넘을 때 종료 코드 1 로 끝납니다.
+#  - 모듈별 import 시간을 더 자세히 보려면 python -X importtime game.py 를 함께 쓰세요.
+import time
+
+_now = time.perf_counter
+
+
+class StartupReport:
+    def __init__(self):
+        self.origin = _now()
+        self.phases = []            # (이름, 시작 ms, 걸린 ms)
+        self.first_frame_ms = None
+        self.ready_ms = None        # 지연 로딩까지 끝난 시각
+
+    def elapsed_ms(self):
+        return (_now() - self.origin) * 1000.0
+
+    def phase(self, name):
+        """with STARTUP.phase("pygame.display.init"): ... 처럼 구간 시간을 기록합니다."""
+        return _Phase(self, name)
+
+    def first_frame(self):
+        if self.first_frame_ms is None:
+            self.first_frame_ms = self.elapsed_ms()
+
+    def ready(self):
+        if self.ready_ms is None:
+            self.ready_ms = self.elapsed_ms()
+
+    def over_budget(self, budget_ms):
+        return self.first_frame_ms is not None and self.first_frame_ms > budget_ms
+
+    def lines(self):
+        out = ["시작 시간 보고 (ms, startup 모듈 import 기준)"]
+        for name, start, dur in self.phases:
+            out.append(f"  {name:32s} {start:9.1f} +{dur:8.1f}")
+        if self.first_frame_ms is not None:
+            out.append(f"  {'첫 프레임 표시':32s} {self.first_frame_ms:9.1f}")
+        if self.ready_ms is not None:
+            out.append(f"  {'지연 로딩 완료':32s} {self.ready_ms:9.1f}")
+        return out
+
+    def print_report(self):
+        for line in self.lines():
+            print(line)
+
+
+class _Phase:
+    def __init__(self, report, name):
+        self.report = report
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = _now()
+        return self
+
+    def __exit__(self, *exc):
+        end = _now()
+        origin = self.report.origin
+        self.report.phases.append((self.name, (self.start - origin) * 1000.0, (end - self.start) * 1000.0))
+        return False
+
+
+# 게임 전체에서 함께 쓰는 시작 시간 기록
+STARTUP = StartupReport()
@@ -0,0 +1,67 @@
+# enemy_ai 의 기술 선택 테스트 (python -m pytest)
+import pytest
+
+from base_pokemon import Pokemon, Skill
+from enemy_ai import AiJob, BattleModel, damage_outcomes, search_limits, AI_LEVELS
+
+
+def enemy(hp=200):
+    # 위력 5 / 15 / 30 의 세 기술 (x, y, z)
+    return Pokemon("적", 40, hp, 20, 20, 5,
+                   [Skill("x", 5, 30), Skill("y", 15, 30), Skill("z", 30, 30)])
+
+
+def player(hp):
+    return Pokemon("나", 10, hp, 10, 10, 5)
+
+
+def choose(ai, foe, depth):
+    job = AiJob(BattleModel(ai, foe), depth, budget=60.0)
+    job.run()
+    assert job.depth == depth       # 시간 제한에 걸리지 않고 끝까지 탐색했는지
+    return job.best
+
+
+@pytest.mark.parametrize("depth", [1, 2, 4, 6, 8, 10])
+def test_sure_kill_uses_strongest_skill_at_every_depth(depth):
+    # z 는 한 번에 쓰러뜨림. 깊이 볼수록 "언젠가 이김" 만 보고 약한 기술을 고르면 안 됩니다.
+    assert choose(enemy(), player(35), depth) == 2
+
+
+@pytest.mark.parametrize("depth", [1, 2, 3, 4, 6, 8])
+def test_faster_win_preferred_when_no_one_hit_kill(depth):
+    assert choose(enemy(), player(80), depth) == 2
+
+
+@pytest.mark.parametrize("depth", [1, 4, 8])
+def test_equal_values_break_ties_by_expected_damage(depth):
+    # y 와 z 모두 반드시 한 번에 쓰러뜨림 (같은 값) -> 기대 데미지가 큰 z
+    assert choose(enemy(), player(20), depth) == 2
+
+
+@pytest.mark.parametrize("depth", [1, 4, 8])
+def test_skips_skills_without_pp(depth):
+    ai = enemy()
+    ai.skills[2].current_pp = 0
+    assert choose(ai, player(80), depth) == 1
+
+
+def test_single_usable_skill_needs_no_search():
+    ai = enemy()
+    ai.skills[1].current_pp = ai.skills[2].current_pp = 0
+    job = AiJob(BattleModel(ai, player(80)), 8, budget=60.0)
+    job.run()
+    assert job.best == 0 and job.nodes == 0
+
+
+def test_damage_outcomes_cover_calc_damage_rolls():
+    ai, foe = enemy(), player(80)
+    outcomes = damage_outcomes(ai, ai.skills[2], foe)
+    # 30 + 20 - 10 = 40, 보정 -2 ~ +2 가 같은 확률
+    assert outcomes == [(d, pytest.approx(0.2)) for d in range(38, 43)]
+
+
+def test_search_limits_grow_with_level():
+    depths = [search_limits(level)[0] for level, _, _ in AI_LEVELS]
+    assert depths == sorted(depths)
+    assert search_limits(1) == AI_LEVELS[0][1:]
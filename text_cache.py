@@ -0,0 +1,94 @@
+# text_cache.py
+# 글자 렌더링 결과(Surface)를 재사용하는 캐시입니다.
+#  - 이름, 로그, 메뉴처럼 거의 바뀌지 않는 문자열은 (폰트, 글자, 색, 안티앨리어싱) 별로 보관합니다.
+#  - 매 프레임 바뀌는 HP 숫자는 미리 렌더링한 숫자 글리프(0~9, '/')를 이어 붙여 그립니다.
+#    그래서 평소 프레임에서는 글꼴 래스터화가 전혀 일어나지 않습니다.
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 256
+DIGIT_CHARS = "0123456789/-"
+
+
+class TextCache:
+    """(font, text, color, antialias) -> Surface 를 보관하는 LRU 캐시."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._atlases = {}
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self._entries.get(key)
+        if surf is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = font.render(text, antialias, color)
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def digits(self, font, color, antialias=True):
+        """font/color 조합의 숫자 아틀라스를 돌려줍니다 (처음 한 번만 렌더링)."""
+        key = (font, tuple(color), antialias)
+        atlas = self._atlases.get(key)
+        if atlas is None:
+            atlas = DigitAtlas(font, color, antialias)
+            self._atlases[key] = atlas
+        return atlas
+
+    def clear(self):
+        self._entries.clear()
+        self._atlases.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DigitAtlas:
+    """숫자/구분자 글리프를 미리 렌더링해 두고 이어 붙여 그리는 도우미."""
+
+    def __init__(self, font, color, antialias=True):
+        self.glyphs = {}
+        for ch in DIGIT_CHARS:
+            self.glyphs[ch] = font.render(ch, antialias, color)
+        self.height = max(g.get_height() for g in self.glyphs.values())
+
+    def width(self, text):
+        glyphs = self.glyphs
+        return sum(glyphs[ch].get_width() for ch in text)
+
+    def draw(self, screen, text, pos):
+        """text(숫자와 '/')를 pos 에 그리고, 그린 너비를 돌려줍니다."""
+        x, y = pos
+        glyphs = self.glyphs
+        batch = []
+        for ch in text:
+            g = glyphs[ch]
+            batch.append((g, (x, y)))
+            x += g.get_width()
+        # 글자마다 blit 을 부르지 않고 한 번에 그립니다.
+        screen.blits(batch, doreturn=False)
+        return x - pos[0]
+
+
+# 모든 씬이 함께 쓰는 텍스트 캐시
+_shared = None
+
+
+def shared_text_cache():
+    global _shared
+    if _shared is None:
+        _shared = TextCache()
+    return _shared
+
+
+def render_text(font, text, color, antialias=True):
+    """공유 캐시를 거쳐 font.render 결과를 돌려줍니다."""
+    return shared_text_cache().render(font, text, color, antialias)
+
@@ -0,0 +1,281 @@
+# tile_world.py
+# 타일 단위의 넓은 맵을 청크(CHUNK_TILES x CHUNK_TILES 타일)로 나눠 필요한 곳만 메모리에 올리는 월드입니다.
+#  - 타일 데이터는 시드로 정해지는 생성기(WorldGen)가 청크 단위로 만듭니다. 같은 시드면 항상 같은 맵입니다.
+#  - 카메라(Camera)가 보는 영역 주변의 청크만 올려 두고, 멀어진 청크는 버립니다.
+#    그래서 월드가 아무리 커도 메모리와 프레임 시간은 화면 크기에만 좌우됩니다.
+#  - 청크마다 정적인 타일을 Surface 하나에 미리 그려 두고(pre-render), 화면에는 청크 Surface 몇 장만 blit 합니다.
+#  - 조우 구역은 타일 종류로 정해집니다 (TILE_ZONES: 풀숲 타일 -> "grass").
+import math
+from collections import OrderedDict
+
+import pygame
+
+from entities import EncounterZone
+from profiler import PROFILER
+
+TILE_SIZE = 40                          # 타일 한 칸 (px)
+CHUNK_TILES = 8                         # 청크 한 변의 타일 수
+CHUNK_SIZE = TILE_SIZE * CHUNK_TILES    # 청크 한 변 (px)
+WORLD_CHUNKS = (64, 64)                 # 기본 월드 크기 (청크 수)
+WORLD_SEED = 0                          # 맵 모양을 정하는 시드 (저장 파일과 같은 맵이 되도록 고정)
+
+# 타일 종류
+GROUND = 0
+GRASS = 1       # 풀숲 (야생 포켓몬 조우)
+PATH = 2
+
+# 텍스처가 없을 때(또는 읽기 전) 타일 색
+TILE_COLORS = {
+    GROUND: (118, 186, 96),
+    GRASS: (46, 140, 84),
+    PATH: (214, 196, 148),
+}
+# 타일 종류 -> 조우 구역 이름 (species_db 의 구역 이름과 같아야 합니다)
+TILE_ZONES = {GRASS: "grass"}
+
+# 시작 화면(예전의 800x600 한 화면): 위쪽은 땅, y=400 아래는 풀숲
+HOME_TILES = (20, 15)
+HOME_GRASS_ROW = 10
+# 이 간격(타일)마다 가로/세로 길을 냅니다.
+PATH_EVERY = 48
+PATH_WIDTH = 2
+
+# 화면 밖으로 이 청크 수만큼 더 올려 두고(미리 읽기), 그보다 먼 청크는 버립니다.
+KEEP_MARGIN = 1
+# 화면 밖 청크는 프레임당 이 개수까지만 새로 만듭니다 (한 프레임에 몰리지 않도록).
+PREFETCH_PER_FRAME = 1
+
+
+# -----------------------------
+# 🌱 맵 생성기
+# -----------------------------
+def _lattice(ix, iy, seed):
+    # 격자점 (ix, iy) 의 0~1 난수 (정수 해시, 같은 입력이면 항상 같은 값)
+    h = (ix * 374761393 + iy * 668265263 + seed * 2246822519) & 0xFFFFFFFF
+    h = ((h ^ (h >> 13)) * 1274126177) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h / 4294967296.0
+
+
+def value_noise(x, y, seed):
+    """부드러운 2D 값 노이즈 (0~1). 격자점 난수를 smoothstep 으로 이어 붙입니다."""
+    ix = math.floor(x)
+    iy = math.floor(y)
+    fx = x - ix
+    fy = y - iy
+    fx = fx * fx * (3 - 2 * fx)
+    fy = fy * fy * (3 - 2 * fy)
+    a = _lattice(ix, iy, seed)
+    b = _lattice(ix + 1, iy, seed)
+    c = _lattice(ix, iy + 1, seed)
+    d = _lattice(ix + 1, iy + 1, seed)
+    top = a + (b - a) * fx
+    bottom = c + (d - c) * fx
+    return top + (bottom - top) * fy
+
+
+class WorldGen:
+    """시드로 타일을 만드는 생성기. 풀숲은 노이즈로 덩어리지게, 길은 일정 간격으로 냅니다."""
+
+    def __init__(self, seed=WORLD_SEED, grass_scale=6.0, grass_threshold=0.6):
+        self.seed = seed
+        self.grass_scale = grass_scale
+        self.grass_threshold = grass_threshold
+
+    def tile(self, tx, ty):
+        hw, hh = HOME_TILES
+        if tx < hw and ty < hh:
+            return GRASS if ty >= HOME_GRASS_ROW else GROUND
+        if tx % PATH_EVERY < PATH_WIDTH or ty % PATH_EVERY < PATH_WIDTH:
+            return PATH
+        s = self.grass_scale
+        if value_noise(tx / s, ty / s, self.seed) > self.grass_threshold:
+            return GRASS
+        return GROUND
+
+    def chunk(self, cx, cy):
+        """청크 하나의 타일 (행 우선 bytes, CHUNK_TILES * CHUNK_TILES)."""
+        tile = self.tile
+        x0 = cx * CHUNK_TILES
+        y0 = cy * CHUNK_TILES
+        return bytes(tile(x0 + i, y0 + j) for j in range(CHUNK_TILES) for i in range(CHUNK_TILES))
+
+
+# -----------------------------
+# 🎥 카메라
+# -----------------------------
+class Camera:
+    """월드에서 화면에 보이는 영역. 대상(플레이어)을 가운데 두되 월드 밖은 보여주지 않습니다."""
+
+    def __init__(self, view_size, world_rect):
+        self.world_rect = world_rect
+        self.rect = pygame.Rect((0, 0), view_size)
+        self.rect.clamp_ip(world_rect)
+
+    def view_around(self, target):
+        """target 을 가운데 둔 화면 영역 (카메라는 움직이지 않음)."""
+        view = self.rect.copy()
+        view.center = target.center
+        return view.clamp(self.world_rect)
+
+    def follow(self, target):
+        self.rect = self.view_around(target)
+
+    def to_screen(self, rect):
+        return rect.move(-self.rect.x, -self.rect.y)
+
+    def to_world(self, rect):
+        return rect.move(self.rect.x, self.rect.y)
+
+
+# -----------------------------
+# 🧱 청크 / 월드
+# -----------------------------
+class Chunk:
+    __slots__ = ("cx", "cy", "tiles", "surface", "rect")
+
+    def __init__(self, cx, cy, tiles):
+        self.cx = cx
+        self.cy = cy
+        self.tiles = tiles          # 타일 종류 bytes
+        self.surface = None         # 미리 그린 Surface (처음 그릴 때 만듦)
+        self.rect = pygame.Rect(cx * CHUNK_SIZE, cy * CHUNK_SIZE, CHUNK_SIZE, CHUNK_SIZE)
+
+
+class TileWorld:
+    """청크 단위로 올리고 버리는 타일 월드."""
+
+    def __init__(self, size_chunks=WORLD_CHUNKS, generator=None):
+        self.size_chunks = size_chunks
+        self.generator = generator or WorldGen()
+        self.bounds = pygame.Rect(0, 0, size_chunks[0] * CHUNK_SIZE, size_chunks[1] * CHUNK_SIZE)
+        self.chunks = OrderedDict()     # (cx, cy) -> Chunk (올라와 있는 청크만)
+        self.texture = None             # 풀숲 타일 텍스처 (배경 이미지)
+        # 구역 이름마다 하나씩 (같은 구역이면 같은 객체 -> 구역이 바뀌었는지 is 로 비교 가능)
+        self.zones = {name: EncounterZone(None, name) for name in TILE_ZONES.values()}
+        # 통계 (bench.py)
+        self.generated = 0
+        self.rendered = 0
+        self.max_loaded = 0
+
+    # ---------- 타일 데이터 ----------
+    def chunk(self, cx, cy):
+        """청크를 돌려줍니다 (없으면 만들어 올림)."""
+        key = (cx, cy)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = Chunk(cx, cy, self.generator.chunk(cx, cy))
+            self.chunks[key] = chunk
+            self.generated += 1
+            self.max_loaded = max(self.max_loaded, len(self.chunks))
+        return chunk
+
+    def in_bounds(self, tx, ty):
+        w, h = self.size_chunks
+        return 0 <= tx < w * CHUNK_TILES and 0 <= ty < h * CHUNK_TILES
+
+    def tile_at(self, px, py):
+        """월드 좌표 (px, py) 의 타일 종류. 올라와 있지 않은 청크는 생성기에서 바로 계산합니다."""
+        tx = int(px) // TILE_SIZE
+        ty = int(py) // TILE_SIZE
+        if not self.in_bounds(tx, ty):
+            return None
+        chunk = self.chunks.get((tx // CHUNK_TILES, ty // CHUNK_TILES))
+        if chunk is None:
+            return self.generator.tile(tx, ty)
+        return chunk.tiles[(ty % CHUNK_TILES) * CHUNK_TILES + tx % CHUNK_TILES]
+
+    def zone_at(self, rect):
+        """rect 가 걸친 타일 중 조우 구역 타일이 있으면 그 구역 (EncounterZone), 없으면 None."""
+        t = TILE_SIZE
+        for ty in range(rect.top // t, (rect.bottom - 1) // t + 1):
+            for tx in range(rect.left // t, (rect.right - 1) // t + 1):
+                name = TILE_ZONES.get(self.tile_at(tx * t, ty * t))
+                if name is not None:
+                    return self.zones[name]
+        return None
+
+    # ---------- 스트리밍 ----------
+    def _chunk_range(self, rect):
+        w, h = self.size_chunks
+        x0 = max(0, rect.left // CHUNK_SIZE)
+        y0 = max(0, rect.top // CHUNK_SIZE)
+        x1 = min(w - 1, (rect.right - 1) // CHUNK_SIZE)
+        y1 = min(h - 1, (rect.bottom - 1) // CHUNK_SIZE)
+        return x0, y0, x1, y1
+
+    def visible(self, view):
+        """view(월드 좌표) 와 겹치는 청크들 (모두 올려서 돌려줌)."""
+        x0, y0, x1, y1 = self._chunk_range(view)
+        return [self.chunk(cx, cy) for cy in range(y0, y1 + 1) for cx in range(x0, x1 + 1)]
+
+    def stream(self, view, budget=PREFETCH_PER_FRAME):
+        """view 주변 KEEP_MARGIN 청크까지 미리 올리고(프레임당 budget 개), 그 밖의 청크는 버립니다."""
+        margin = KEEP_MARGIN * CHUNK_SIZE
+        x0, y0, x1, y1 = self._chunk_range(view.inflate(margin * 2, margin * 2))
+        chunks = self.chunks
+        # 범위 밖 청크 버리기 (Surface 도 함께 풀림)
+        for key in [k for k in chunks if not (x0 <= k[0] <= x1 and y0 <= k[1] <= y1)]:
+            del chunks[key]
+        # 화면 밖 여유 청크를 조금씩 미리 만들어 둡니다 (화면에 들어올 때 끊기지 않도록).
+        for cy in range(y0, y1 + 1):
+            for cx in range(x0, x1 + 1):
+                if budget <= 0:
+                    return
+                chunk = chunks.get((cx, cy))
+                if chunk is None or chunk.surface is None:
+                    self.render(self.chunk(cx, cy))
+                    budget -= 1
+
+    # ---------- 그리기 ----------
+    def set_texture(self, image):
+        """풀숲 타일 텍스처를 바꾸고, 미리 그려 둔 청크를 버립니다 (다음에 그릴 때 다시 그림)."""
+        self.texture = image
+        for chunk in self.chunks.values():
+            chunk.surface = None
+
+    def render(self, chunk):
+        """청크의 타일을 Surface 하나에 그립니다."""
+        with PROFILER.span("world.render_chunk"):
+            surface = pygame.Surface((CHUNK_SIZE, CHUNK_SIZE))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            texture = self.texture
+            tex_cols = tex_rows = 0
+            if texture is not None:
+                tex_cols = texture.get_width() // TILE_SIZE
+                tex_rows = texture.get_height() // TILE_SIZE
+            t = TILE_SIZE
+            x0 = chunk.cx * CHUNK_TILES
+            y0 = chunk.cy * CHUNK_TILES
+            tiles = chunk.tiles
+            for j in range(CHUNK_TILES):
+                for i in range(CHUNK_TILES):
+                    kind = tiles[j * CHUNK_TILES + i]
+                    dest = (i * t, j * t, t, t)
+                    if kind == GRASS and tex_cols and tex_rows:
+                        # 텍스처를 월드 좌표에 맞춰 이어 붙입니다.
+                        src = (((x0 + i) % tex_cols) * t, ((y0 + j) % tex_rows) * t, t, t)
+                        surface.blit(texture, dest, src)
+                    else:
+                        surface.fill(TILE_COLORS[kind], dest)
+            chunk.surface = surface
+            self.rendered += 1
+        return surface
+
+    def draw(self, screen, camera, area=None, batch=None):
+        """카메라에 보이는 청크들을 그립니다. area(화면 좌표) 를 주면 그 영역과 겹치는 청크만.
+
+        batch(sprite_atlas.SpriteBatch) 를 주면 바로 그리지 않고 배치에 넣습니다 (flush 는 호출한 쪽에서).
+        """
+        view = camera.rect if area is None else camera.to_world(area)
+        ox, oy = camera.rect.topleft
+        blits = [(chunk.surface or self.render(chunk), (chunk.rect.x - ox, chunk.rect.y - oy))
+                 for chunk in self.visible(view)]
+        if batch is not None:
+            batch.items.extend(blits)
+        else:
+            screen.blits(blits, doreturn=False)
+
+    def __len__(self):
+        return len(self.chunks)
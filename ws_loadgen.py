@@ -0,0 +1,201 @@
+# ws_loadgen.py
+# ws_server.py 부하 측정 클라이언트입니다. 한 컴퓨터에서 서버와 함께 실행합니다.
+#  - 동시 전투 수(가상 플레이어 수)만큼 전투를 열고, 각 플레이어는 think 초마다 공격을 보냅니다.
+#  - 공격 요청 -> 응답까지의 턴 지연을 모아 p50 / p95 / p99 를 냅니다.
+#  - 서버는 기본으로 별도 프로세스(코어 하나)로 띄우고, 클라이언트는 --procs 개 프로세스로 나눠
+#    클라이언트 쪽이 병목이 되지 않게 합니다.
+#
+# 실행 예:
+#   python ws_loadgen.py --battles 2000 --duration 10
+#   python ws_loadgen.py --sweep 1000,2000,4000,8000 --p99-budget 50   (p99 50ms 안에서 버티는 최대 동시 전투 수)
+#   python ws_loadgen.py --host 127.0.0.1 --port 8765 --no-spawn       (이미 떠 있는 서버 측정)
+import asyncio
+import itertools
+import multiprocessing
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+
+from battle_engine import FINISHED, FLED
+from profiler import percentile
+from ws_server import (
+    DEFAULT_HOST, DEFAULT_PORT, HEADER, NEW, ATTACK, OP_NEW, OP_ATTACK, OP_ERROR,
+    WS_BINARY, ws_frame, ws_read, ws_client_handshake, decode_response,
+)
+
+
+class Connection:
+    """웹소켓 연결 하나. 여러 가상 플레이어가 req_id 로 응답을 나눠 받습니다."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pending = {}               # req_id -> Future
+        self._ids = itertools.count(1)
+        self._task = asyncio.ensure_future(self._read_loop())
+
+    @classmethod
+    async def open(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        await ws_client_handshake(reader, writer, host, port)
+        return cls(reader, writer)
+
+    async def _read_loop(self):
+        try:
+            while True:
+                opcode, payload = await ws_read(self.reader)
+                if opcode != WS_BINARY:
+                    continue
+                op, req_id, body = decode_response(payload)
+                fut = self.pending.pop(req_id, None)
+                if fut is not None and not fut.done():
+                    fut.set_result((op, body))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            for fut in self.pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError("서버 연결이 끊겼습니다."))
+
+    def request(self, op, body):
+        req_id = next(self._ids) & 0xFFFFFFFF
+        fut = asyncio.get_running_loop().create_future()
+        self.pending[req_id] = fut
+        self.writer.write(ws_frame(HEADER.pack(op, req_id) + body, mask=os.urandom(4)))
+        return fut
+
+    async def close(self):
+        self._task.cancel()
+        self.writer.close()
+
+
+async def virtual_player(conn, think, deadline, stats, rng):
+    # 전투를 열고 끝날 때까지 think 초 간격으로 공격, 끝나면 새 전투를 엽니다.
+    clock = time.perf_counter
+    battle_id = None
+    while clock() < deadline:
+        if battle_id is None:
+            op, body = await conn.request(OP_NEW, NEW.pack(0, 0))
+            if op == OP_ERROR:
+                stats["errors"] += 1
+                return
+            battle_id = body[0]
+        await asyncio.sleep(think * rng.uniform(0.5, 1.5))
+        t0 = clock()
+        op, body = await conn.request(OP_ATTACK, ATTACK.pack(battle_id, 0))
+        stats["latency"].append((clock() - t0) * 1000.0)
+        if op == OP_ERROR:
+            stats["errors"] += 1
+            battle_id = None
+            continue
+        if body[1] in (FINISHED, FLED):
+            stats["battles"] += 1
+            battle_id = None
+
+
+async def run_load(host, port, battles, duration, think, connections, seed=0):
+    rng = random.Random(seed)
+    conns = [await Connection.open(host, port) for _ in range(max(1, min(connections, battles)))]
+    stats = {"latency": [], "battles": 0, "errors": 0}
+    # 모든 가상 플레이어가 동시에 시작하지 않도록 think 시간 안에 고르게 흩어 놓습니다.
+    warmup = think
+    deadline = time.perf_counter() + warmup + duration
+
+    async def start(i):
+        await asyncio.sleep(warmup * i / battles)
+        await virtual_player(conns[i % len(conns)], think, deadline, stats, rng)
+
+    await asyncio.gather(*(start(i) for i in range(battles)))
+    for c in conns:
+        await c.close()
+    return stats
+
+
+def _client_process(args):
+    host, port, battles, duration, think, connections, seed = args
+    return asyncio.run(run_load(host, port, battles, duration, think, connections, seed))
+
+
+def measure(host, port, battles, duration, think, connections, procs):
+    """battles 개 전투를 procs 개 클라이언트 프로세스로 나눠 돌리고 결과를 합칩니다."""
+    procs = max(1, min(procs, battles))
+    shares = [battles // procs + (1 if i < battles % procs else 0) for i in range(procs)]
+    jobs = [(host, port, n, duration, think, max(1, connections // procs), i) for i, n in enumerate(shares)]
+    if procs == 1:
+        results = [_client_process(jobs[0])]
+    else:
+        with multiprocessing.Pool(procs) as pool:
+            results = pool.map(_client_process, jobs)
+    latency = sorted(x for r in results for x in r["latency"])
+    return {
+        "battles": battles,
+        "turns_per_s": len(latency) / duration,
+        "battles_done": sum(r["battles"] for r in results),
+        "errors": sum(r["errors"] for r in results),
+        "p50": percentile(latency, 50),
+        "p95": percentile(latency, 95),
+        "p99": percentile(latency, 99),
+        "max": latency[-1] if latency else 0.0,
+    }
+
+
+def wait_for_port(host, port, timeout=10.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="전투 서버 부하 측정")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--no-spawn", action="store_true", help="서버를 띄우지 않고 이미 떠 있는 서버에 연결")
+    parser.add_argument("--battles", type=int, default=1000, help="동시 전투 수")
+    parser.add_argument("--sweep", help="쉼표로 구분한 동시 전투 수 목록 (차례로 측정)")
+    parser.add_argument("--duration", type=float, default=10.0, help="측정 시간(초)")
+    parser.add_argument("--think", type=float, default=0.5, help="플레이어가 공격하는 평균 간격(초)")
+    parser.add_argument("--connections", type=int, default=64, help="웹소켓 연결 수 (전투들이 나눠 씀)")
+    parser.add_argument("--procs", type=int, default=max(1, (os.cpu_count() or 2) - 1), help="클라이언트 프로세스 수")
+    parser.add_argument("--p99-budget", type=float, default=50.0, help="p99 턴 지연 허용치(ms)")
+    args = parser.parse_args(argv)
+
+    server = None
+    if not args.no_spawn:
+        # 서버는 별도 프로세스 하나 = 코어 하나
+        server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), "ws_server.py"),
+                                   "--host", args.host, "--port", str(args.port)],
+                                  stdout=subprocess.DEVNULL)
+    try:
+        if not wait_for_port(args.host, args.port):
+            print("서버에 연결할 수 없습니다.")
+            return 1
+        counts = [int(x) for x in args.sweep.split(",")] if args.sweep else [args.battles]
+        print(f"{'동시 전투':>10} {'턴/초':>10} {'끝난 전투':>10} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'오류':>6}")
+        best = None
+        for n in counts:
+            r = measure(args.host, args.port, n, args.duration, args.think, args.connections, args.procs)
+            ok = r["p99"] <= args.p99_budget and r["errors"] == 0
+            print(f"{n:>10} {r['turns_per_s']:>10,.0f} {r['battles_done']:>10} {r['p50']:>8.2f} {r['p95']:>8.2f}"
+                  f" {r['p99']:>8.2f} {r['max']:>8.2f} {r['errors']:>6}{'' if ok else '  <-- 예산 초과'}")
+            if ok:
+                best = n
+        if best is None:
+            print(f"p99 {args.p99_budget:.0f}ms 안에서 버틴 측정이 없습니다.")
+        else:
+            print(f"p99 {args.p99_budget:.0f}ms 안에서 버틴 최대 동시 전투 수: {best}")
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
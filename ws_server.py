@@ -0,0 +1,313 @@
+# ws_server.py
+# 여러 전투를 한 프로세스(스레드 하나, asyncio)에서 동시에 처리하는 전투 서버입니다.
+#  - 전투 규칙은 battle_engine.BattleEngine (base_pokemon.Pokemon / Skill) 을 그대로 씁니다.
+#  - 연결은 웹소켓(RFC 6455, 바이너리 프레임)이고, 메시지는 몇 바이트짜리 struct 바이너리입니다.
+#    (별도 패키지 없이 표준 라이브러리만 씁니다)
+#  - 전투마다 스레드를 만들지 않습니다. 전투는 id -> BattleEngine 표에 들어 있고,
+#    요청이 올 때만 한 턴을 계산합니다.
+#
+# 실행:  python ws_server.py --port 8765
+# 부하 측정:  python ws_loadgen.py --sweep 500,1000,2000 (같은 컴퓨터에서 서버를 띄워 측정)
+import asyncio
+import base64
+import hashlib
+import itertools
+import os
+import struct
+import time
+
+from battle_engine import (
+    BattleEngine,
+    STATE_CODES, EVENT_CODES, SIDE_CODES, STATE_ID as _STATE_ID, EVENT_ID as _EVENT_ID, SIDE_ID as _SIDE_ID,
+)
+from species_db import shared_species_db
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# -----------------------------
+# 📨 메시지 형식 (little-endian)
+# -----------------------------
+# 모든 메시지: op(u8), req_id(u32) + 본문. 응답은 요청의 req_id 를 그대로 돌려줍니다.
+HEADER = struct.Struct("<BI")
+# 클라이언트 -> 서버
+OP_NEW = 1          # 본문 NEW: 내 포켓몬 종 id, 상대 종 id (0 이면 풀숲 조우표에서 뽑음)
+OP_ATTACK = 2       # 본문 ATTACK: 전투 id, 기술 번호
+OP_FLEE = 3         # 본문 BATTLE: 전투 id
+NEW = struct.Struct("<HH")
+ATTACK = struct.Struct("<IB")
+BATTLE = struct.Struct("<I")
+# 서버 -> 클라이언트
+OP_STATE = 0x81     # 본문 STATE + 이벤트 n개 (EVENT)
+OP_ERROR = 0xFF     # 본문 ERROR
+STATE = struct.Struct("<IBHHB")     # 전투 id, 상태, 내 HP, 상대 HP, 이벤트 수
+EVENT = struct.Struct("<BBH")       # 종류, 쪽, 데미지 또는 EXP
+ERROR = struct.Struct("<B")
+
+ERR_BAD_REQUEST = 1
+ERR_NO_BATTLE = 2
+ERR_NO_SPECIES = 3
+
+# -----------------------------
+# 🔌 웹소켓 (필요한 부분만: 바이너리 프레임, ping/close)
+# -----------------------------
+WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+WS_BINARY = 0x2
+WS_CLOSE = 0x8
+WS_PING = 0x9
+WS_PONG = 0xA
+MAX_MESSAGE = 1 << 16
+
+
+def ws_accept_key(key):
+    return base64.b64encode(hashlib.sha1(key + WS_GUID).digest()).decode("ascii")
+
+
+def ws_mask(payload, mask):
+    # 4바이트 마스크를 반복해 XOR (메시지가 짧으므로 정수 한 번의 XOR 로 처리)
+    n = len(payload)
+    if n == 0:
+        return b""
+    key = (mask * (n // 4 + 1))[:n]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")).to_bytes(n, "little")
+
+
+def ws_frame(payload, opcode=WS_BINARY, mask=None):
+    """FIN 이 켜진 프레임 하나를 만듭니다. 클라이언트는 mask(4바이트)를 줘야 합니다."""
+    n = len(payload)
+    mbit = 0x80 if mask is not None else 0
+    if n < 126:
+        head = struct.pack("<BB", 0x80 | opcode, mbit | n)
+    elif n < 65536:
+        head = struct.pack(">BBH", 0x80 | opcode, mbit | 126, n)
+    else:
+        head = struct.pack(">BBQ", 0x80 | opcode, mbit | 127, n)
+    if mask is not None:
+        return head + mask + ws_mask(payload, mask)
+    return head + payload
+
+
+async def ws_read(reader):
+    """프레임 하나를 읽어 (opcode, payload) 를 돌려줍니다 (마스크는 풀어서)."""
+    b0, b1 = await reader.readexactly(2)
+    opcode = b0 & 0x0F
+    n = b1 & 0x7F
+    if n == 126:
+        (n,) = struct.unpack(">H", await reader.readexactly(2))
+    elif n == 127:
+        (n,) = struct.unpack(">Q", await reader.readexactly(8))
+    if n > MAX_MESSAGE:
+        raise ConnectionError("메시지가 너무 깁니다.")
+    mask = await reader.readexactly(4) if b1 & 0x80 else None
+    payload = await reader.readexactly(n) if n else b""
+    if mask is not None:
+        payload = ws_mask(payload, mask)
+    return opcode, payload
+
+
+async def ws_server_handshake(reader, writer):
+    request = await reader.readuntil(b"\r\n\r\n")
+    key = None
+    for line in request.split(b"\r\n")[1:]:
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"sec-websocket-key":
+            key = value.strip()
+    if key is None:
+        writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+        return False
+    writer.write(("HTTP/1.1 101 Switching Protocols\r\n"
+                  "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                  f"Sec-WebSocket-Accept: {ws_accept_key(key)}\r\n\r\n").encode("ascii"))
+    return True
+
+
+async def ws_client_handshake(reader, writer, host, port):
+    key = base64.b64encode(os.urandom(16))
+    writer.write(b"GET / HTTP/1.1\r\nHost: " + f"{host}:{port}".encode("ascii") +
+                 b"\r\nUpgrade: websocket\r\nConnection: Upgrade\r\nSec-WebSocket-Key: " + key +
+                 b"\r\nSec-WebSocket-Version: 13\r\n\r\n")
+    await writer.drain()
+    response = await reader.readuntil(b"\r\n\r\n")
+    if b" 101 " not in response.split(b"\r\n", 1)[0]:
+        raise ConnectionError("웹소켓 연결이 거부되었습니다.")
+    if ws_accept_key(key).encode("ascii") not in response:
+        raise ConnectionError("웹소켓 응답 키가 맞지 않습니다.")
+
+
+# -----------------------------
+# 메시지 만들기 / 읽기 (클라이언트에서도 씁니다)
+# -----------------------------
+def encode_state(req_id, battle_id, engine, events):
+    out = bytearray(HEADER.pack(OP_STATE, req_id))
+    out += STATE.pack(battle_id, _STATE_ID[engine.state], max(0, engine.player.current_hp),
+                      max(0, engine.enemy.current_hp), len(events))
+    for ev in events:
+        out += EVENT.pack(_EVENT_ID[ev.kind], _SIDE_ID.get(ev.side, 0), min(0xFFFF, int(ev.value)))
+    return bytes(out)
+
+
+def encode_error(req_id, code):
+    return HEADER.pack(OP_ERROR, req_id) + ERROR.pack(code)
+
+
+def decode_response(payload):
+    """서버 응답을 (op, req_id, 내용) 으로 풉니다.
+
+    STATE 내용: (전투 id, 상태, 내 HP, 상대 HP, [(종류, 쪽, 값), ...]), ERROR 내용: 오류 코드
+    """
+    op, req_id = HEADER.unpack_from(payload, 0)
+    off = HEADER.size
+    if op == OP_ERROR:
+        return op, req_id, ERROR.unpack_from(payload, off)[0]
+    battle_id, state, php, ehp, n = STATE.unpack_from(payload, off)
+    off += STATE.size
+    events = []
+    for _ in range(n):
+        kind, side, value = EVENT.unpack_from(payload, off)
+        off += EVENT.size
+        events.append((EVENT_CODES[kind], SIDE_CODES[side], value))
+    return op, req_id, (battle_id, STATE_CODES[state], php, ehp, events)
+
+
+# -----------------------------
+# 🖥️ 서버
+# -----------------------------
+class BattleServer:
+    # battle_log: battle_log.BattleLog (주면 모든 전투의 시드/입력/이벤트를 기록, replay.py 로 검증)
+    def __init__(self, player_species=1, zone="grass", battle_log=None):
+        self.db = shared_species_db()
+        self.battle_log = battle_log
+        self.player_species = player_species
+        self.zone = zone
+        self.battles = {}               # 전투 id -> BattleEngine
+        self._ids = itertools.count(1)
+        self.connections = 0
+        self.turns = 0
+        self.battles_started = 0
+
+    def new_battle(self, player_species, enemy_species):
+        player = self.db.get(player_species or self.player_species)
+        if enemy_species:
+            enemy = self.db.get(enemy_species)
+        else:
+            table = self.db.zone(self.zone)
+            enemy = table.sample() if table is not None else None
+        if player is None or enemy is None:
+            return None, None
+        battle_id = next(self._ids) & 0xFFFFFFFF
+        engine = BattleEngine(player.create(), enemy.create(), battle_log=self.battle_log)
+        self.battles[battle_id] = engine
+        self.battles_started += 1
+        return battle_id, engine
+
+    def handle(self, payload, owned):
+        """요청 하나를 처리하고 응답 bytes 를 돌려줍니다. owned 는 이 연결이 만든 전투 id 집합."""
+        try:
+            op, req_id = HEADER.unpack_from(payload, 0)
+        except struct.error:
+            return encode_error(0, ERR_BAD_REQUEST)
+        body = HEADER.size
+        try:
+            if op == OP_NEW:
+                battle_id, engine = self.new_battle(*NEW.unpack_from(payload, body))
+                if engine is None:
+                    return encode_error(req_id, ERR_NO_SPECIES)
+                owned.add(battle_id)
+            elif op == OP_ATTACK:
+                battle_id, skill = ATTACK.unpack_from(payload, body)
+                engine = self.battles.get(battle_id) if battle_id in owned else None
+                if engine is None:
+                    return encode_error(req_id, ERR_NO_BATTLE)
+                if skill >= len(engine.player.skills):
+                    return encode_error(req_id, ERR_BAD_REQUEST)
+                engine.player_attack(skill)
+                self.turns += 1
+            elif op == OP_FLEE:
+                (battle_id,) = BATTLE.unpack_from(payload, body)
+                engine = self.battles.get(battle_id) if battle_id in owned else None
+                if engine is None:
+                    return encode_error(req_id, ERR_NO_BATTLE)
+                engine.flee()
+            else:
+                return encode_error(req_id, ERR_BAD_REQUEST)
+        except struct.error:
+            return encode_error(req_id, ERR_BAD_REQUEST)
+        response = encode_state(req_id, battle_id, engine, engine.drain_events())
+        if engine.finished:
+            # 끝난 전투는 바로 치웁니다 (메모리는 진행 중인 전투 수에만 비례)
+            del self.battles[battle_id]
+            owned.discard(battle_id)
+        return response
+
+    async def serve_client(self, reader, writer):
+        owned = set()
+        self.connections += 1
+        try:
+            if not await ws_server_handshake(reader, writer):
+                return
+            while True:
+                opcode, payload = await ws_read(reader)
+                if opcode == WS_CLOSE:
+                    writer.write(ws_frame(b"", WS_CLOSE))
+                    break
+                if opcode == WS_PING:
+                    writer.write(ws_frame(payload, WS_PONG))
+                elif opcode == WS_BINARY:
+                    writer.write(ws_frame(self.handle(payload, owned)))
+                # 보낼 것이 많이 쌓였을 때만 기다립니다.
+                if writer.transport.get_write_buffer_size() > MAX_MESSAGE:
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            self.connections -= 1
+            for battle_id in owned:
+                self.battles.pop(battle_id, None)
+            writer.close()
+
+    async def report(self, every):
+        # every 초마다 진행 중인 전투 수와 처리량을 출력합니다.
+        last_turns, last = self.turns, time.perf_counter()
+        while True:
+            await asyncio.sleep(every)
+            now = time.perf_counter()
+            rate = (self.turns - last_turns) / (now - last)
+            last_turns, last = self.turns, now
+            print(f"연결 {self.connections}, 진행 중 전투 {len(self.battles)}, 턴 {rate:,.0f}/초")
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, stats_every=0, ready=None):
+        server = await asyncio.start_server(self.serve_client, host, port, backlog=1024)
+        if ready is not None:
+            ready()
+        if stats_every:
+            asyncio.ensure_future(self.report(stats_every))
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="asyncio 웹소켓 전투 서버")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--stats", type=float, default=0, help="N 초마다 진행 중 전투 수/처리량 출력")
+    parser.add_argument("--battle-log", help="전투 기록 파일 (replay.py 로 재현/검증)")
+    args = parser.parse_args(argv)
+    log = None
+    if args.battle_log:
+        from battle_log import BattleLog
+        # 서버는 처리량이 중요하므로 턴마다가 아니라 전투가 끝날 때 내보냅니다.
+        log = BattleLog(args.battle_log, flush_every_turn=False)
+    server = BattleServer(battle_log=log)
+    print(f"전투 서버 시작: ws://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve(args.host, args.port, stats_every=args.stats))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if log is not None:
+            log.close()
+
+
+if __name__ == "__main__":
+    main()